@@ -0,0 +1,15 @@
+"""
+Benchmarks for the model construction and packet decoding of skinport.py.
+
+Run them from the root of the repository::
+
+    $ python -m benchmarks
+    $ python -m benchmarks --save baseline.json
+    $ python -m benchmarks --baseline baseline.json --threshold 0.1
+
+The exit code is ``1`` if a benchmark regressed compared to the baseline.
+
+The sustained throughput of the websocket is measured against a local server::
+
+    $ python -m benchmarks.sale_feed --rates 1000 5000 20000
+"""
@@ -0,0 +1,47 @@
+import argparse
+import json
+import platform
+import sys
+
+from .suite import BENCHMARKS, Result, compare, run
+
+
+def _print_result(result: Result) -> None:
+    print(f"{result.key:<40} {result.ops_per_sec:>14,.1f} ops/s {result.peak_bytes / 1024:>12,.1f} KiB peak", flush=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks the hot paths of skinport.py.")
+    parser.add_argument("names", nargs="*", metavar="name", help=f"benchmarks to run, any of {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1, 100, 1000], help="payload sizes (default: 1 100 1000)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions, the best is reported (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per repetition (default: 0.2)")
+    parser.add_argument("--save", metavar="PATH", help="store the results as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare the results against a stored baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="tolerated relative regression (default: 0.1)")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    print(f"Python {platform.python_version()} on {platform.platform()}")
+    results = run(args.names or None, args.sizes, repeat=args.repeat, min_time=args.min_time, progress=_print_result)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({result.key: {"ops_per_sec": result.ops_per_sec, "peak_bytes": result.peak_bytes} for result in results}, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions compared to {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Measures how many saleFeed events per second the client sustains over a local websocket.
+
+Run it from the root of the repository::
+
+    $ python -m benchmarks.sale_feed --rates 1000 5000 20000 --sales-per-event 10
+
+The client keeps up with a rate if its backlog, the events emitted but not yet
+handled by the listeners, stays small when the server stops emitting. The server
+shares the event loop and CPU with the client, so the emitted rate can stay below
+the requested one.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import NamedTuple
+
+import skinport
+from skinport.testing import FakeSaleFeedServer
+
+__all__ = ("SaleFeedResult", "measure")
+
+
+class SaleFeedResult(NamedTuple):
+    """The result of streaming the sale feed at a rate."""
+
+    rate: float
+    emitted: int
+    handled: int
+    seconds: float
+
+    @property
+    def emitted_per_sec(self) -> float:
+        return self.emitted / self.seconds
+
+    @property
+    def handled_per_sec(self) -> float:
+        return self.handled / self.seconds
+
+    @property
+    def backlog(self) -> int:
+        return self.emitted - self.handled
+
+
+async def measure(rate: float, *, duration: float = 2.0, burst: int = 10, sales_per_event: int = 1, parse_sale_feed: bool = True) -> SaleFeedResult:
+    """Streams the sale feed at ``rate`` events per second for ``duration`` seconds to a client."""
+    async with FakeSaleFeedServer(rate=rate, burst=burst, sales_per_event=sales_per_event, max_events=int(rate * duration)) as server:
+        client = skinport.Client(parse_sale_feed=parse_sale_feed)
+        handled = 0
+
+        @client.listen("saleFeed")
+        async def on_sale_feed(data):
+            nonlocal handled
+            handled += 1
+
+        task = asyncio.create_task(client.connect(url=server.url))
+        await server.wait_for_join()
+        started_at = time.monotonic()
+        while (server.max_events is None or server.emitted < server.max_events) and time.monotonic() - started_at < duration * 10:
+            await asyncio.sleep(0.01)
+        seconds = time.monotonic() - started_at
+        # Give the client the time of a single burst to drain its buffers
+        await asyncio.sleep(burst / rate)
+        result = SaleFeedResult(rate, server.emitted, handled, seconds)
+        await client.close()
+        await task
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.sale_feed", description="Measures the sustained saleFeed throughput of the client.")
+    parser.add_argument("--rates", nargs="+", type=float, default=[1000, 5000, 20000], help="emitted events per second (default: 1000 5000 20000)")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds to emit per rate (default: 2)")
+    parser.add_argument("--burst", type=int, default=10, help="events emitted back to back (default: 10)")
+    parser.add_argument("--sales-per-event", type=int, default=1, help="sales of every event (default: 1)")
+    parser.add_argument("--raw", action="store_true", help="dispatch the raw dicts instead of SaleFeed objects")
+    args = parser.parse_args()
+
+    for rate in args.rates:
+        result = asyncio.run(
+            measure(rate, duration=args.duration, burst=args.burst, sales_per_event=args.sales_per_event, parse_sale_feed=not args.raw)
+        )
+        print(
+            f"{rate:>10,.0f} events/s requested {result.emitted_per_sec:>12,.1f} emitted {result.handled_per_sec:>12,.1f} handled {result.backlog:>8,} behind",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
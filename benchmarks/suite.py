@@ -0,0 +1,152 @@
+"""
+The benchmarks of the hot paths of skinport.py and the code to run and compare them.
+"""
+
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from skinport import Color, Item, ItemWithSales, SaleFeed, Transaction
+from skinport.skinport_msgpack_packet import SkinportMsgPackPacket
+
+from skinport.testing import payloads
+
+__all__ = ("BENCHMARKS", "Result", "run", "compare")
+
+
+# Every benchmark takes the payload size and returns the operation that is timed
+BENCHMARKS: Dict[str, Callable[[int], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[int], Callable[[], Any]]], Callable[[int], Callable[[], Any]]]:
+    def decorator(func: Callable[[int], Callable[[], Any]]) -> Callable[[int], Callable[[], Any]]:
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+@benchmark("item")
+def bench_item(size: int) -> Callable[[], Any]:
+    data = payloads.make_items(size)
+    return lambda: [Item(data=item) for item in data]
+
+
+@benchmark("item_with_sales")
+def bench_item_with_sales(size: int) -> Callable[[], Any]:
+    data = payloads.make_items_with_sales(size)
+    return lambda: [ItemWithSales(data=item) for item in data]
+
+
+@benchmark("transaction")
+def bench_transaction(size: int) -> Callable[[], Any]:
+    data = payloads.make_transactions(size)
+    return lambda: [Transaction(data=transaction) for transaction in data]
+
+
+@benchmark("sale_feed_sales")
+def bench_sale_feed_sales(size: int) -> Callable[[], Any]:
+    data = payloads.make_sale_feed(size)
+    return lambda: SaleFeed(data=data).sales
+
+
+@benchmark("sale_feed_sales_lazy")
+def bench_sale_feed_sales_lazy(size: int) -> Callable[[], Any]:
+    data = payloads.make_sale_feed(size)
+    return lambda: [(sale.market_hash_name, sale.sale_price) for sale in SaleFeed(data=data, lazy=True).sales]
+
+
+@benchmark("packet_decode")
+def bench_packet_decode(size: int) -> Callable[[], Any]:
+    encoded_packet = payloads.make_sale_feed_packet(size)
+    return lambda: SkinportMsgPackPacket(encoded_packet=encoded_packet)
+
+
+@benchmark("packet_decode_raw_timestamps")
+def bench_packet_decode_raw_timestamps(size: int) -> Callable[[], Any]:
+    encoded_packet = payloads.make_sale_feed_packet(size)
+    packet_class = SkinportMsgPackPacket.configure(raw_timestamps=True)
+    return lambda: packet_class(encoded_packet=encoded_packet)
+
+
+@benchmark("packet_encode")
+def bench_packet_encode(size: int) -> Callable[[], Any]:
+    packet = SkinportMsgPackPacket(packet_type=2, data=["saleFeed", payloads.make_sale_feed(size, timestamps=True)], namespace="/")
+    return packet.encode
+
+
+@benchmark("color")
+def bench_color(size: int) -> Callable[[], Any]:
+    values = payloads.make_colors(size)
+    return lambda: [Color(value) for value in values]
+
+
+class Result(NamedTuple):
+    """The result of a benchmark for a payload size."""
+
+    name: str
+    size: int
+    ops_per_sec: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+
+def _measure(op: Callable[[], Any], *, repeat: int, min_time: float) -> Tuple[float, int]:
+    timer = timeit.Timer(op)
+    # Grow the loop count until a repetition runs for at least min_time
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < min_time:
+        number = int(number * min(10.0, max(2.0, 1.2 * min_time / max(elapsed, 1e-9))))
+        elapsed = timer.timeit(number)
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(
+    names: Optional[Iterable[str]] = None,
+    sizes: Iterable[int] = (1, 100, 1000),
+    *,
+    repeat: int = 5,
+    min_time: float = 0.2,
+    progress: Optional[Callable[[Result], Any]] = None,
+) -> List[Result]:
+    """Runs benchmarks for every payload size.
+
+    The throughput is the best of ``repeat`` runs, the peak memory is traced during a single operation.
+    """
+    results = []
+    for name in names if names is not None else BENCHMARKS:
+        for size in sizes:
+            seconds, peak = _measure(BENCHMARKS[name](size), repeat=repeat, min_time=min_time)
+            result = Result(name, size, 1 / seconds, peak)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def compare(results: Iterable[Result], baseline: Dict[str, Dict[str, float]], *, threshold: float = 0.1) -> List[str]:
+    """Returns descriptions of the results that are more than ``threshold`` slower or use more memory than the baseline."""
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            continue
+        if result.ops_per_sec < previous["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{result.key}: {result.ops_per_sec:,.0f} ops/s, baseline {previous['ops_per_sec']:,.0f} ops/s")
+        if result.peak_bytes > previous["peak_bytes"] * (1 + threshold):
+            regressions.append(f"{result.key}: {result.peak_bytes:,} bytes peak, baseline {previous['peak_bytes']:,.0f} bytes")
+    return regressions
@@ -18,14 +18,24 @@ import logging
 from typing import NamedTuple
 
 from . import utils
+from .cache import *
 from .client import *
 from .color import *
+from .dedup import *
+from .dispatcher import *
 from .enums import *
 from .errors import *
+from .instrumentation import *
 from .item import *
 from .iterators import *
+from .orderbook import *
+from .ratelimit import *
+from .replay import *
+from .retry import *
 from .sale import *
 from .salefeed import *
+from .stream import *
+from .subscription import *
 from .transaction import *
 
 
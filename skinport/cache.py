@@ -0,0 +1,658 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, List, Mapping, NamedTuple, Optional, Tuple, TypeVar, Union
+
+from urllib.parse import urlencode
+
+from cachetools import TTLCache
+
+__all__ = (
+    "CachePolicy",
+    "CacheStats",
+    "DiskCache",
+)
+
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _encode_query(params: Optional[Mapping[str, Any]]) -> str:
+    return urlencode(sorted((key, str(value)) for key, value in (params or {}).items()))
+
+
+# Collects the ages of the responses a ResponseCache fetch has been served from the DiskCache
+_disk_ages: "contextvars.ContextVar[Optional[List[float]]]" = contextvars.ContextVar("_disk_ages", default=None)
+
+
+class CachePolicy:
+    """Describes how responses of an endpoint are cached.
+
+    By default a cached response is served until ``ttl`` expires and the next
+    caller has to wait for a fresh one. If ``stale_ttl`` is set, an expired
+    response keeps being served until it is ``stale_ttl`` seconds old while it
+    is refreshed in the background (stale-while-revalidate).
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        The maximum number of cached responses.
+        Defaults to ``128``.
+    ttl: :class:`float`
+        The number of seconds a cached response is considered fresh.
+        Defaults to ``300``.
+    stale_ttl: Optional[:class:`float`]
+        The number of seconds after which a cached response is no longer served at all.
+        Must not be smaller than ``ttl``. Defaults to ``None``, which disables serving stale responses.
+    on_refresh_error: Optional[Callable[[Hashable, :class:`BaseException`], Any]]
+        Called with the cache key and the exception when a background refresh fails.
+        If not set, the failure is logged.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "on_refresh_error",
+        "stale_ttl",
+        "ttl",
+    )
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 128,
+        ttl: float = 300.0,
+        stale_ttl: Optional[float] = None,
+        on_refresh_error: Optional[Callable[[Hashable, BaseException], Any]] = None,
+    ) -> None:
+        if stale_ttl is not None and stale_ttl < ttl:
+            raise ValueError("stale_ttl must not be smaller than ttl")
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.stale_ttl: Optional[float] = stale_ttl
+        self.on_refresh_error: Optional[Callable[[Hashable, BaseException], Any]] = on_refresh_error
+
+    def __repr__(self) -> str:
+        return f"CachePolicy(maxsize={self.maxsize!r}, ttl={self.ttl!r}, stale_ttl={self.stale_ttl!r})"
+
+    @property
+    def stale_while_revalidate(self) -> bool:
+        """:class:`bool`: Indicates if expired responses are served while they are refreshed."""
+        return self.stale_ttl is not None
+
+
+class CacheStats(NamedTuple):
+    """Statistics of a response cache.
+
+    Attributes
+    ------------
+    hits: :class:`int`
+        The number of lookups answered with a fresh response.
+    stale_hits: :class:`int`
+        The number of lookups answered with a stale response while it was refreshed.
+    misses: :class:`int`
+        The number of lookups that had to wait for a response to be fetched.
+    evictions: :class:`int`
+        The number of responses removed to make room for new ones.
+    expirations: :class:`int`
+        The number of responses removed because they became too old to be served.
+    currsize: :class:`int`
+        The number of cached responses.
+    maxsize: :class:`int`
+        The maximum number of cached responses.
+    nbytes: :class:`int`
+        The approximate memory held by the cached responses in bytes.
+    oldest_age: Optional[:class:`float`]
+        The age of the oldest cached response in seconds.
+    newest_age: Optional[:class:`float`]
+        The age of the most recently fetched response in seconds.
+    """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    maxsize: int
+    nbytes: int
+    oldest_age: Optional[float]
+    newest_age: Optional[float]
+
+
+def _estimate_size(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if not isinstance(value, (list, tuple)):
+        return size
+    for element in value:
+        size += sys.getsizeof(element)
+        for slot in getattr(type(element), "__slots__", ()):
+            size += sys.getsizeof(getattr(element, slot, None))
+    return size
+
+
+class _CacheEntry:
+    __slots__ = (
+        "fetched_at",
+        "nbytes",
+        "value",
+    )
+
+    def __init__(self, value: Any, age: float = 0.0) -> None:
+        self.value: Any = value
+        self.fetched_at: float = time.monotonic() - age
+        self.nbytes: Optional[int] = None
+
+
+class _EntryCache(TTLCache):
+    # Counts the entries that are dropped by the underlying TTLCache
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time: Optional[float] = None) -> List[Tuple[Any, Any]]:
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        return expired
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share the same key.
+
+    While a call for a key is in flight, every other call for the same key
+    waits for it instead of starting its own, and all callers receive the same
+    result or exception. Cancelling a waiting caller does not cancel the call
+    for the other waiters.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """*coroutine*
+        Runs ``func`` unless a call for ``key`` is already in flight and returns its result.
+
+        Parameters
+        ----------
+        key: :class:`collections.abc.Hashable`
+            The key identifying identical calls.
+        func: Callable[[], Awaitable[T]]
+            Creates the awaitable performing the call.
+
+        Returns
+        -------
+        T
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    def cancel(self) -> None:
+        """Cancels every call in flight."""
+        for task in tuple(self._calls.values()):
+            task.cancel()
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller has been cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+class ResponseCache:
+    """Caches the results of an endpoint according to a :class:`CachePolicy`.
+
+    Parameters
+    ----------
+    policy: :class:`CachePolicy`
+        The policy of the cache.
+    """
+
+    def __init__(self, policy: CachePolicy) -> None:
+        self.policy: CachePolicy = policy
+        self._entries: _EntryCache = _EntryCache(maxsize=policy.maxsize, ttl=policy.stale_ttl or policy.ttl)
+        self._refreshes: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._hits: int = 0
+        self._stale_hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """*coroutine*
+        Returns the cached value for ``key`` or fetches it on a miss.
+
+        Parameters
+        ----------
+        key: :class:`collections.abc.Hashable`
+            The cache key.
+        fetch: Callable[[], Awaitable[T]]
+            Creates the awaitable fetching a fresh value.
+
+        Returns
+        -------
+        T
+        """
+        entry: Optional[_CacheEntry] = self._entries.get(key)
+        age = time.monotonic() - entry.fetched_at if entry is not None else None
+        # Entries restored from the disk cache are older than their insertion into the TTLCache
+        if age is not None and age < (self.policy.stale_ttl or self.policy.ttl):
+            if age < self.policy.ttl:
+                self._hits += 1
+                return entry.value
+            if self.policy.stale_while_revalidate:
+                self._stale_hits += 1
+                self._revalidate(key, fetch)
+                return entry.value
+        self._misses += 1
+        return await self._fetch(key, fetch)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        ages: List[float] = []
+        token = _disk_ages.set(ages)
+        try:
+            value = await fetch()
+        finally:
+            _disk_ages.reset(token)
+        entry: Optional[_CacheEntry] = self._entries.get(key)
+        # A caller sharing the fetch of another one must not store the value again as freshly fetched
+        if entry is None or entry.value is not value:
+            self._entries[key] = _CacheEntry(value, age=max(ages, default=0.0))
+        return value
+
+    async def refresh(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """*coroutine*
+        Fetches a fresh value for ``key`` and stores it, regardless of what is cached.
+
+        Parameters
+        ----------
+        key: :class:`collections.abc.Hashable`
+            The cache key.
+        fetch: Callable[[], Awaitable[T]]
+            Creates the awaitable fetching a fresh value.
+
+        Returns
+        -------
+        T
+        """
+        return await self._fetch(key, fetch)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores ``value`` as a freshly fetched value for ``key``.
+
+        Parameters
+        ----------
+        key: :class:`collections.abc.Hashable`
+            The cache key.
+        value: Any
+            The value to cache.
+        """
+        self._entries[key] = _CacheEntry(value)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Removes the cached value for ``key``.
+
+        Parameters
+        ----------
+        key: :class:`collections.abc.Hashable`
+            The cache key.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether a value was removed.
+        """
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Removes all cached values."""
+        self._entries.clear()
+
+    def close(self) -> None:
+        """Cancels the background refreshes of stale values."""
+        for task in tuple(self._refreshes.values()):
+            task.cancel()
+
+    def stats(self) -> CacheStats:
+        """Returns the statistics of the cache.
+
+        Returns
+        -------
+        :class:`CacheStats`
+        """
+        self._entries.expire()
+        now = time.monotonic()
+        nbytes = 0
+        ages = []
+        for entry in self._entries.values():
+            if entry.nbytes is None:
+                entry.nbytes = _estimate_size(entry.value)
+            nbytes += entry.nbytes
+            ages.append(now - entry.fetched_at)
+        return CacheStats(
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            evictions=self._entries.evictions,
+            expirations=self._entries.expirations,
+            currsize=len(self._entries),
+            maxsize=self.policy.maxsize,
+            nbytes=nbytes,
+            oldest_age=max(ages, default=None),
+            newest_age=min(ages, default=None),
+        )
+
+    def _revalidate(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshes:
+            return
+        task = asyncio.ensure_future(self._fetch(key, fetch))
+        self._refreshes[key] = task
+        task.add_done_callback(functools.partial(self._on_revalidated, key))
+
+    def _on_revalidated(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        del self._refreshes[key]
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is None:
+            return
+        if self.policy.on_refresh_error is not None:
+            self.policy.on_refresh_error(key, exc)
+        else:
+            _log.warning("Refreshing the cached response for %s failed", key, exc_info=exc)
+
+
+class DiskCache:
+    """Stores raw API responses in an SQLite database so they survive restarts.
+
+    Only responses of the endpoints listed in ``ttls`` are stored, authenticated
+    endpoints are never cached. Response bodies are stored compressed together
+    with the time they were fetched and are served as long as they are younger
+    than the TTL of their endpoint.
+
+    .. note::
+
+        The in-memory cache of the :class:`Client` keeps the time a response read
+        from disk was fetched, and the :class:`Client` applies the TTLs of its
+        cache policies to the endpoints without a TTL override.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the database file. It is created if it does not exist.
+    ttls: Optional[Mapping[:class:`str`, :class:`float`]]
+        Overrides for the number of seconds a stored response is served, keyed by
+        endpoint. By default responses of ``items`` and ``sales_history`` are served
+        for 5 minutes and responses of ``sales_out_of_stock`` for an hour, or as long
+        as the cache policies of the :class:`Client` using the cache allow.
+    compression_level: :class:`int`
+        The zlib compression level of the stored bodies.
+        Defaults to ``6``.
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        "items": 300.0,
+        "sales_history": 300.0,
+        "sales_out_of_stock": 3600.0,
+    }
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        compression_level: int = 6,
+    ) -> None:
+        self.path: str = os.fspath(path)
+        self.ttls: Dict[str, float] = dict(self.DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self._overridden: FrozenSet[str] = frozenset(ttls or ())
+        self.compression_level: int = compression_level
+        self._connection: Optional[sqlite3.Connection] = None
+        # sqlite3 connections must not be used by multiple threads at once
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"DiskCache(path={self.path!r}, ttls={self.ttls!r})"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, fetched_at REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def handles(self, endpoint: Optional[str]) -> bool:
+        """Indicates if responses of the endpoint are stored.
+
+        Parameters
+        ----------
+        endpoint: Optional[:class:`str`]
+            The endpoint, i.e. the rate limit bucket of the route.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return endpoint is not None and endpoint in self.ttls
+
+    def follow(self, ttls: Mapping[str, float]) -> None:
+        """Uses the given TTLs for the endpoints whose TTL has not been overridden.
+
+        Parameters
+        ----------
+        ttls: Mapping[:class:`str`, :class:`float`]
+            The number of seconds a stored response is served, keyed by endpoint.
+        """
+        for endpoint, ttl in ttls.items():
+            if endpoint in self.ttls and endpoint not in self._overridden:
+                self.ttls[endpoint] = ttl
+
+    def _get(self, endpoint: str, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self._connect().execute("SELECT fetched_at, body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        age = max(time.time() - row[0], 0.0)
+        if age >= self.ttls[endpoint]:
+            return None
+        return zlib.decompress(row[1]).decode("utf-8"), age
+
+    def _set(self, endpoint: str, key: str, body: str) -> None:
+        compressed = zlib.compress(body.encode("utf-8"), self.compression_level)
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, fetched_at, body) VALUES (?, ?, ?, ?)",
+                (key, endpoint, time.time(), compressed),
+            )
+            connection.commit()
+
+    def _purge(self) -> int:
+        now = time.time()
+        removed = 0
+        with self._lock:
+            connection = self._connect()
+            for endpoint, ttl in self.ttls.items():
+                cursor = connection.execute("DELETE FROM responses WHERE endpoint = ? AND fetched_at <= ?", (endpoint, now - ttl))
+                removed += cursor.rowcount
+            connection.commit()
+        return removed
+
+    def _delete(self, endpoint: str, params: Optional[Mapping[str, Any]]) -> int:
+        with self._lock:
+            connection = self._connect()
+            if params is None:
+                cursor = connection.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
+            else:
+                # The keys end with the query of the request, the URL in front of it depends on the base URL
+                suffix = "?" + _encode_query(params)
+                cursor = connection.execute(
+                    "DELETE FROM responses WHERE endpoint = ? AND substr(key, ?) = ?", (endpoint, -len(suffix), suffix)
+                )
+            connection.commit()
+        return cursor.rowcount
+
+    def _clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM responses")
+            connection.commit()
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Returns the key of a request.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The HTTP method of the request.
+        url: :class:`str`
+            The URL of the request, without its query.
+        params: Optional[Mapping[:class:`str`, Any]]
+            The query parameters of the request.
+
+        Returns
+        -------
+        :class:`str`
+        """
+        return f"{method} {url}?{_encode_query(params)}"
+
+    async def get(self, endpoint: str, key: str) -> Optional[str]:
+        """*coroutine*
+        Returns the stored body of a response if it is still fresh.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The endpoint of the response.
+        key: :class:`str`
+            The key of the request.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+        """
+        stored = await asyncio.to_thread(self._get, endpoint, key)
+        if stored is None:
+            return None
+        body, age = stored
+        ages = _disk_ages.get()
+        if ages is not None:
+            ages.append(age)
+        return body
+
+    async def set(self, endpoint: str, key: str, body: str) -> None:
+        """*coroutine*
+        Stores the body of a response.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The endpoint of the response.
+        key: :class:`str`
+            The key of the request.
+        body: :class:`str`
+            The body of the response.
+        """
+        await asyncio.to_thread(self._set, endpoint, key, body)
+
+    async def purge(self) -> int:
+        """*coroutine*
+        Removes all responses that are too old to be served.
+
+        Returns
+        -------
+        :class:`int`
+            The number of removed responses.
+        """
+        return await asyncio.to_thread(self._purge)
+
+    def delete(self, endpoint: str, params: Optional[Mapping[str, Any]] = None) -> int:
+        """Removes the stored responses of an endpoint.
+
+        Unlike the other operations this blocks for a single SQLite statement,
+        so the responses are gone before the next request is made.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The endpoint of the responses.
+        params: Optional[Mapping[:class:`str`, Any]]
+            The query parameters of the request whose response is removed.
+            Removes every response of the endpoint if not given.
+
+        Returns
+        -------
+        :class:`int`
+            The number of removed responses.
+        """
+        return self._delete(endpoint, params)
+
+    async def clear(self) -> None:
+        """*coroutine*
+        Removes all stored responses."""
+        await asyncio.to_thread(self._clear)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -23,36 +23,222 @@ SOFTWARE.
 """
 
 import asyncio
+import functools
 import logging
-import ssl
+import time
 from collections.abc import Callable
-from typing import Any, Coroutine, List
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Coroutine, Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Union
+from urllib.parse import quote
 
 import aiohttp
 import socketio
-from asyncache import cached
-from cachetools import TTLCache
 
-from .enums import AppID, Currency, Locale
-from .http import HTTPClient
-from .item import Item, ItemOutOfStock, ItemWithSales
+from .cache import CachePolicy, CacheStats, DiskCache, ResponseCache, SingleFlight
+from .dedup import SaleDeduplicator
+from .dispatcher import EventDispatcher
+from .enums import AppID, Currency, Locale, OverflowPolicy
+from .http import HTTPClient, with_timeout
+from .instrumentation import Instrumentation, notify
+from .item import Item, ItemOutOfStock, ItemTable, ItemWithSales
 from .iterators import TransactionAsyncIterator
+from .ratelimit import RateLimit
+from .retry import RetryPolicy
+from .replay import PacketRecorder
+from .salefeed import SaleFeed
 from .skinport_msgpack_packet import SkinportMsgPackPacket
-from .transaction import Transaction
+from .stream import SaleFeedStream
+from .subscription import SaleFilter, SubscriptionIndex
+from .transaction import Transaction, TransactionCheckpoint
 
 __all__ = ("Client",)
 
 
 _log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _chunk_market_hash_names(market_hash_names: Iterable[str], max_length: int) -> List[List[str]]:
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    length = 0
+    for name in dict.fromkeys(market_hash_names):
+        # Every name after the first is preceded by an encoded comma
+        name_length = len(quote(name, safe="")) + (3 if chunk else 0)
+        if chunk and length + name_length > max_length:
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+            name_length -= 3
+        chunk.append(name)
+        length += name_length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
 
 class Client:
-    def __init__(self):
-        self.http: HTTPClient = HTTPClient()
+    """Represents a client connection that connects to the Skinport API and websocket.
+
+    Parameters
+    ----------
+    rate_limits: Optional[Mapping[:class:`str`, :class:`RateLimit`]]
+        Overrides for the request budgets of the rate limit buckets
+        ``items``, ``sales_history``, ``sales_out_of_stock`` and ``account``.
+        Requests to different buckets are sent concurrently.
+    connector_limit: :class:`int`
+        The maximum number of simultaneous connections to the API.
+        Defaults to ``100``.
+    keepalive_timeout: :class:`float`
+        The number of seconds idle connections are kept open for reuse.
+        Defaults to ``60``.
+    dns_cache_ttl: Optional[:class:`int`]
+        The number of seconds resolved host names are cached.
+        ``None`` disables the DNS cache. Defaults to ``300``.
+    cache_policies: Optional[Mapping[:class:`str`, :class:`CachePolicy`]]
+        Overrides for the cache policies of the endpoints ``items``, ``item_table``,
+        ``sales_history`` and ``sales_out_of_stock``. By default up to 128 responses of
+        :meth:`get_items`, :meth:`get_item_table` and :meth:`get_sales_history` are cached
+        for 5 minutes and up to 16 responses of :meth:`get_sales_out_of_stock` for an hour.
+    disk_cache: Optional[:class:`DiskCache`]
+        Stores the raw responses of the public endpoints on disk, so a restarted
+        process can serve them without downloading them again. They are served as
+        long as the cache policies allow, unless the disk cache overrides the TTL.
+        Defaults to ``None``.
+    listener_workers: :class:`int`
+        The number of asyncio tasks running the event listeners concurrently.
+        Defaults to ``0``, which runs the listeners inside the websocket's receive path.
+    listener_executor: Optional[:class:`concurrent.futures.Executor`]
+        Runs event listeners that are regular functions, e.g. a
+        :class:`~concurrent.futures.ThreadPoolExecutor` for CPU heavy handlers.
+        If not given, only coroutine functions can be registered as listeners.
+    ordered_listeners: :class:`bool`
+        Whether saleFeed events are handled in the order they were received for every sale
+        they contain when ``listener_workers`` is set. Defaults to ``False``.
+    raw_timestamps: :class:`bool`
+        Whether timestamps of websocket events are decoded to :class:`int` milliseconds
+        instead of :class:`msgpack.Timestamp`, which is faster if they are not needed.
+        Defaults to ``False``.
+    parse_sale_feed: :class:`bool`
+        Whether saleFeed listeners receive a :class:`SaleFeed` instead of the raw data.
+        It is built once per event and shared by all listeners and streams,
+        so its :attr:`SaleFeed.sales` are only built once as well.
+        Defaults to ``False``.
+    lazy_sales: :class:`bool`
+        Whether the sales of a parsed :class:`SaleFeed` are :class:`LazySaleFeedSale`,
+        which only read the fields that are accessed. Requires ``parse_sale_feed``.
+        Defaults to ``False``.
+    deduplicator: Optional[:class:`SaleDeduplicator`]
+        Drops sales of saleFeed events that were already received, e.g. from overlapping
+        sale feeds or after a reconnect, before they reach the listeners.
+        Defaults to ``None``.
+    recorder: Optional[:class:`PacketRecorder`]
+        Records the raw packets received by the websocket, so they can be replayed
+        with a :class:`PacketReplayer`. Defaults to ``None``.
+    base_url: Optional[:class:`str`]
+        The base URL of the REST API, e.g. the :attr:`~skinport.testing.FakeSkinportServer.url`
+        of a local stand-in. Defaults to ``https://api.skinport.com/v1``.
+    retry_policy: Optional[:class:`RetryPolicy`]
+        How requests that were rate limited or failed with a server or connection error are retried.
+        Defaults to ``RetryPolicy()``.
+    retry_policies: Optional[Mapping[:class:`str`, :class:`RetryPolicy`]]
+        Overrides for the retry policy of the rate limit buckets
+        ``items``, ``sales_history``, ``sales_out_of_stock`` and ``account``.
+    timeout: Optional[:class:`float`]
+        The seconds a request may take, including waiting for the rate limiter and retries,
+        before it is cancelled with :exc:`RequestTimeout`. Defaults to ``None``, no deadline.
+    connect_timeout: Optional[:class:`float`]
+        The seconds connecting to the API may take per attempt.
+        Defaults to ``30``.
+    read_timeout: Optional[:class:`float`]
+        The seconds until the first byte of a response and between two reads may take per attempt.
+        Defaults to ``60``.
+    instrumentation: Optional[:class:`Instrumentation`]
+        Receives the timings of every request and websocket event,
+        e.g. a :class:`PrometheusInstrumentation`. Defaults to ``None``.
+    """
+
+    DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+        "items": CachePolicy(maxsize=128, ttl=300.0),
+        "item_table": CachePolicy(maxsize=128, ttl=300.0),
+        "sales_history": CachePolicy(maxsize=128, ttl=300.0),
+        "sales_out_of_stock": CachePolicy(maxsize=16, ttl=3600.0),
+    }
+    # The rate limit buckets of the cached endpoints, i.e. the endpoints of the disk cache
+    _CACHE_BUCKETS: Dict[str, str] = {"item_table": "items"}
+
+    def __init__(
+        self,
+        *,
+        rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        connector_limit: int = 100,
+        keepalive_timeout: float = 60.0,
+        dns_cache_ttl: Optional[int] = 300,
+        cache_policies: Optional[Mapping[str, CachePolicy]] = None,
+        disk_cache: Optional[DiskCache] = None,
+        listener_workers: int = 0,
+        listener_executor: Optional[Executor] = None,
+        ordered_listeners: bool = False,
+        raw_timestamps: bool = False,
+        parse_sale_feed: bool = False,
+        lazy_sales: bool = False,
+        deduplicator: Optional[SaleDeduplicator] = None,
+        recorder: Optional[PacketRecorder] = None,
+        base_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Mapping[str, RetryPolicy]] = None,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = 30.0,
+        read_timeout: Optional[float] = 60.0,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        self.http: HTTPClient = HTTPClient(
+            rate_limits=rate_limits,
+            connector_limit=connector_limit,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+            disk_cache=disk_cache,
+            base_url=base_url,
+            retry_policy=retry_policy,
+            retry_policies=retry_policies,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            instrumentation=instrumentation,
+        )
+        self._single_flight: SingleFlight = SingleFlight()
+        policies = dict(self.DEFAULT_CACHE_POLICIES)
+        if cache_policies is not None:
+            policies.update(cache_policies)
+        self.caches: Dict[str, ResponseCache] = {name: ResponseCache(policy) for name, policy in policies.items()}
+        if disk_cache is not None:
+            # Serve stored responses only as long as the in-memory caches would serve them
+            ttls: Dict[str, float] = {}
+            for name, policy in policies.items():
+                bucket = self._CACHE_BUCKETS.get(name, name)
+                ttls[bucket] = min(policy.ttl, ttls.get(bucket, policy.ttl))
+            disk_cache.follow(ttls)
+        self._cached_requests = {
+            "items": self._items_request,
+            "item_table": self._item_table_request,
+            "sales_history": self._sales_history_request,
+            "sales_out_of_stock": self._sales_out_of_stock_request,
+        }
+        self.packet_class: Type[SkinportMsgPackPacket] = SkinportMsgPackPacket
+        if raw_timestamps or recorder is not None or instrumentation is not None:
+            self.packet_class = SkinportMsgPackPacket.configure(raw_timestamps=raw_timestamps, recorder=recorder, instrumentation=instrumentation)
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+        self.parse_sale_feed: bool = parse_sale_feed
+        self.lazy_sales: bool = lazy_sales
+        self.deduplicator: Optional[SaleDeduplicator] = deduplicator
         self._connected = False
         self.ws = None
-        self.listeners = dict()
+        self.dispatcher: EventDispatcher = EventDispatcher(workers=listener_workers, executor=listener_executor, ordered=ordered_listeners)
+        self.listeners: Dict[str, List[Callable[..., Any]]] = self.dispatcher.listeners
+        self.subscriptions: SubscriptionIndex = SubscriptionIndex()
         self.sale_feeds = list()
+        self.sale_feed_streams: List[SaleFeedStream] = []
 
     def set_auth(self, *, client_id: str, client_secret: str):
         self.http.set_auth(client_id, client_secret)
@@ -63,6 +249,7 @@ class Client:
         app_id: AppID = AppID.cs2,
         currency: Currency = Currency.eur,
         locale: Locale = Locale.en,
+        url: str = "https://skinport.com",
     ) -> None:
         """A blocking call that abstracts away the event loop
         initialisation from you.
@@ -80,6 +267,9 @@ class Client:
         locale: :class:`Locale`
             Whether or not to show only tradable items.
             Defaults to ``Locale.en``.
+        url: :class:`str`
+            The URL of the socket.io server.
+            Defaults to ``https://skinport.com``.
 
 
         .. warning::
@@ -91,7 +281,7 @@ class Client:
 
         async def runner():
             try:
-                await self.connect(app_id=app_id, currency=currency, locale=locale)
+                await self.connect(app_id=app_id, currency=currency, locale=locale, url=url)
             finally:
                 if self._connected:
                     await self.close()
@@ -105,11 +295,13 @@ class Client:
             return
 
     async def catch_all(self, event, data):
-        _log.debug(f"Received event {event} with data: {data}")
+        _log.debug("Received event %s with data: %s", event, data)
 
     def listen(self, name: str = None) -> Callable[[Callable[..., Coroutine[Any, Any, Any]]], Callable[..., Coroutine[Any, Any, Any]]]:
         """A decorator that registers an event listener.
         The events must be a coroutine, if not, :exc:`TypeError` is raised.
+        Regular functions are accepted if the client has a ``listener_executor``.
+        Multiple listeners can be registered for the same event.
 
         Example
         ---------
@@ -126,20 +318,97 @@ class Client:
         """
 
         def decorator(func):
-            if not asyncio.iscoroutinefunction(func):
-                raise TypeError("event listener registered must be a coroutine function")
-
             if name is None:
                 raise ValueError("name can't be None")
 
-            # Save the listeners to add them during connect
-            self.listeners[name] = func
+            self.add_listener(name, func)
+            return func
+
+        return decorator
+
+    def add_listener(self, name: str, func: Callable[..., Any]) -> None:
+        """Registers an event listener. Listeners of events other than saleFeed
+        have to be registered before calling :meth:`connect`.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event.
+        func: Callable[..., Any]
+            The listener.
+
+        Raises
+        --------
+        :exc:`TypeError`
+            The listener is not a coroutine function and the client has no ``listener_executor``.
+        """
+        # Save the listeners to add them during connect
+        self.dispatcher.add_listener(name, func)
+        _log.debug("%s has successfully been registered as an event", func.__name__)
+
+    def subscribe(self, sale_filter: Optional[SaleFilter] = None, **kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """A decorator that registers a handler for the sales of the sale feed that match a filter.
+
+        The handler is called once per matching sale with the :class:`SaleFeedSale`
+        and the :class:`EventType` of the event. Filters are indexed by their market
+        hash names, or their categories if they have no names. Filters with neither are
+        checked against every sale, so prefer narrowing them down by name or category.
+
+        Example
+        ---------
+        .. code-block:: python3
+
+           @client.subscribe(market_hash_names={"AK-47 | Redline (Field-Tested)"}, max_price=10)
+           async def on_cheap_redline(sale, event_type):
+               print(sale.sale_price, event_type)
+
+        Parameters
+        ----------
+        sale_filter: Optional[:class:`SaleFilter`]
+            The filter. If not given, it is created from the keyword arguments.
+        **kwargs: Any
+            The keyword arguments of :class:`SaleFilter`.
+
+        Raises
+        --------
+        :exc:`TypeError`
+            The handler is not a coroutine function and the client has no ``listener_executor``.
+        """
+        if sale_filter is None:
+            sale_filter = SaleFilter(**kwargs)
+        elif kwargs:
+            raise TypeError("pass either a SaleFilter or its keyword arguments")
 
-            _log.debug("%s has successfully been registered as an event", func.__name__)
+        def decorator(func):
+            if not asyncio.iscoroutinefunction(func) and self.dispatcher.executor is None:
+                raise TypeError("subscription handler registered must be a coroutine function")
+            self.subscriptions.add(sale_filter, func)
             return func
 
         return decorator
 
+    def unsubscribe(self, func: Callable[..., Any]) -> None:
+        """Removes every subscription of a handler.
+
+        Parameters
+        ----------
+        func: Callable[..., Any]
+            The handler.
+        """
+        self.subscriptions.remove(func)
+
+    def remove_listener(self, name: str, func: Callable[..., Any]) -> None:
+        """Removes an event listener. Does nothing if the listener is not registered.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event.
+        func: Callable[..., Any]
+            The listener.
+        """
+        self.dispatcher.remove_listener(name, func)
+
     async def connect(
         self,
         *,
@@ -147,6 +416,7 @@ class Client:
         currency: Currency = Currency.eur,
         locale: Locale = Locale.en,
         reconnection_delay_max: int = 300,
+        url: str = "https://skinport.com",
     ) -> None:
         """*coroutine*
         Connects to the socket.io websocket.
@@ -162,23 +432,25 @@ class Client:
         locale: :class:`Locale`
             Whether or not to show only tradable items.
             Defaults to ``en``.
+        url: :class:`str`
+            The URL of the socket.io server, e.g. of a :class:`~skinport.testing.FakeSaleFeedServer`.
+            Defaults to ``https://skinport.com``.
         """
         # Only create the aiohttp.ClientSession when the asyncio loop is already running
         await self.http.start_session()
 
-        # Pinning to TLS v1.3 (thanks CloudFlare)
-        ssl_context = ssl.create_default_context()
-        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
-        ssl_context.maximum_version = ssl.TLSVersion.TLSv1_3
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
+        # Reuse the TLS v1.3 pinned SSL context of the HTTPClient
+        connector = aiohttp.TCPConnector(ssl=self.http.ssl_context)
         http_session = aiohttp.ClientSession(connector=connector)
         self.ws: socketio.AsyncClient = socketio.AsyncClient(
-            serializer=SkinportMsgPackPacket, http_session=http_session, timestamp_requests=False, reconnection_delay_max=reconnection_delay_max
+            serializer=self.packet_class, http_session=http_session, timestamp_requests=False, reconnection_delay_max=reconnection_delay_max
         )
 
-        # Attach the listeners
-        for name, func in self.listeners.items():
-            self.ws.on(name, func)
+        # Attach the listeners, saleFeed events are dispatched by the client itself
+        for name in self.listeners:
+            if name != "saleFeed":
+                self.ws.on(name, functools.partial(self._handle_event, name))
+        self.ws.on("saleFeed", functools.partial(self._handle_event, "saleFeed"))
 
         if self._connected:
             _log.info("Client is already connected. Closing the existing connection.")
@@ -191,7 +463,7 @@ class Client:
         try:
             self.ws.on("*", self.catch_all)
             self.ws.on("connect", lambda: asyncio.ensure_future(self.on_connect()))
-            await self.ws.connect("https://skinport.com", transports=["websocket"], retry=True)
+            await self.ws.connect(url, transports=["websocket"], retry=True)
             self._connected = True
             await self.ws.wait()
         except asyncio.TimeoutError:
@@ -201,6 +473,74 @@ class Client:
         except socketio.exceptions.ConnectionError:
             _log.warning("Client is already connected. Skipping connection attempt.")
 
+    async def _handle_event(self, name: str, *args: Any) -> None:
+        if self.instrumentation is None:
+            await self._dispatch_event(name, *args)
+            return
+        started_at = time.perf_counter()
+        await self._dispatch_event(name, *args)
+        notify(self.instrumentation, "on_event", name, time.perf_counter() - started_at)
+
+    async def _dispatch_event(self, name: str, *args: Any) -> None:
+        if name == "saleFeed":
+            await self._on_sale_feed(*args)
+        else:
+            await self.dispatcher.dispatch(name, *args)
+
+    async def _on_sale_feed(self, data: Dict[str, Any]) -> None:
+        if self.deduplicator is not None:
+            data = self.deduplicator.filter(data)
+            if data is None:
+                return
+        event: Union[Dict[str, Any], SaleFeed] = data
+        if self.parse_sale_feed:
+            event = SaleFeed(data=data, lazy=self.lazy_sales)
+            # Build the sales once, before the event is shared with the listeners
+            event.sales
+        for stream in tuple(self.sale_feed_streams):
+            await stream.put(event)
+        await self.dispatcher.dispatch("saleFeed", event)
+
+        if self.subscriptions:
+            # Subscriptions only read a few fields of every sale
+            sale_feed = event if isinstance(event, SaleFeed) else SaleFeed(data=data, lazy=True)
+            event_type = sale_feed.event_type
+            for sale in sale_feed.sales:
+                for handler in self.subscriptions.match(sale):
+                    await self.dispatcher.submit(handler, sale, event_type, keys=(sale.sale_id,))
+
+    def sale_feed(self, *, maxsize: int = 1000, overflow: OverflowPolicy = OverflowPolicy.block) -> SaleFeedStream:
+        """Returns an asynchronous iterator over the saleFeed events of the websocket.
+
+        The stream buffers events in a bounded queue, so consuming it does not run
+        inside the websocket's receive path. It has to be created before or while
+        the client is connected and stops when it or the client is closed.
+
+        Example
+        ---------
+        .. code-block:: python3
+
+           async with client.sale_feed(overflow=OverflowPolicy.drop_oldest) as stream:
+               async for sale_feed in stream:
+                   print(sale_feed.event_type, stream.dropped)
+
+        Parameters
+        ----------
+        maxsize: :class:`int`
+            The maximum number of buffered events.
+            Defaults to ``1000``.
+        overflow: :class:`OverflowPolicy`
+            What happens to an event when the buffer is full.
+            Defaults to ``OverflowPolicy.block``, which makes the websocket wait for the consumer.
+
+        Returns
+        -------
+        :class:`SaleFeedStream`
+        """
+        stream = SaleFeedStream(maxsize=maxsize, overflow=overflow, on_close=self.sale_feed_streams.remove)
+        self.sale_feed_streams.append(stream)
+        return stream
+
     async def on_connect(self) -> None:
         _log.info("Connected to Skinport. Emitting saleFeedJoin event...")
         await self._emit_sale_feed_join()
@@ -225,7 +565,7 @@ class Client:
 
     async def _emit_sale_feed_join(self) -> None:
         for sale_feed in self.sale_feeds:
-            _log.debug(f"Emitting saleFeedJoin event for {sale_feed} ...")
+            _log.debug("Emitting saleFeedJoin event for %s ...", sale_feed)
             await self.ws.emit(
                 "saleFeedJoin",
                 {
@@ -242,21 +582,210 @@ class Client:
         """
         # Always close the underlying session of the HTTPClient
         await self.http.close()
+        for cache in self.caches.values():
+            cache.close()
+        self._single_flight.cancel()
+        if self.http.disk_cache is not None:
+            self.http.disk_cache.close()
+
+        for stream in tuple(self.sale_feed_streams):
+            stream.close()
+        await self.dispatcher.close()
 
         if not self._connected:
             return
 
         self._connected = False
+        if self.ws.connected:
+            await self.ws.disconnect()
         if self.ws.eio.http is not None:
             await self.ws.eio.http.close()
 
-    @cached(cache=TTLCache(maxsize=128, ttl=300))
+    def _get_cache(self, endpoint: str) -> ResponseCache:
+        try:
+            return self.caches[endpoint]
+        except KeyError:
+            raise ValueError(f"{endpoint!r} is not a cached endpoint") from None
+
+    def _delete_from_disk_cache(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> int:
+        disk_cache = self.http.disk_cache
+        bucket = self._CACHE_BUCKETS.get(endpoint, endpoint)
+        if disk_cache is None or not disk_cache.handles(bucket):
+            return 0
+        return disk_cache.delete(bucket, params)
+
+    async def _cached(self, endpoint: str, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        return await self._get_cache(endpoint).get(key, lambda: self._single_flight.do(key, fetch))
+
+    def _items_request(
+        self,
+        *,
+        app_id: AppID = AppID.csgo,
+        currency: Currency = Currency.eur,
+        tradable: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Hashable, Dict[str, Any], Callable[[], Awaitable[List[Item]]]]:
+        _tradable = str(tradable).lower()
+        params = {
+            "app_id": app_id,
+            "currency": currency.value,
+            "tradable": _tradable,
+        }
+
+        async def fetch() -> List[Item]:
+            data = await self.http.get_items(params=params, timeout=timeout)
+            return [Item(data=item) for item in data]
+
+        return ("items", *params.values()), params, fetch
+
+    def _item_table_request(
+        self,
+        *,
+        app_id: AppID = AppID.csgo,
+        currency: Currency = Currency.eur,
+        tradable: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Hashable, Dict[str, Any], Callable[[], Awaitable[ItemTable]]]:
+        _tradable = str(tradable).lower()
+        params = {
+            "app_id": app_id,
+            "currency": currency.value,
+            "tradable": _tradable,
+        }
+
+        async def fetch() -> ItemTable:
+            data = await self.http.get_items(params=params, timeout=timeout)
+            return ItemTable(data=data)
+
+        return ("item_table", *params.values()), params, fetch
+
+    def _sales_history_request(
+        self,
+        *market_hash_names: str,
+        app_id: AppID = AppID.csgo,
+        currency: Currency = Currency.eur,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Hashable, Dict[str, Any], Callable[[], Awaitable[List[ItemWithSales]]]]:
+        params = {
+            "app_id": app_id,
+            "currency": currency.value,
+        }
+
+        if len(market_hash_names) > 0:
+            params["market_hash_name"] = ",".join(market_hash_names)
+
+        async def fetch() -> List[ItemWithSales]:
+            data = await self.http.get_sales_history(params=params, timeout=timeout)
+            return [ItemWithSales(data=sale) for sale in data]
+
+        return ("sales_history", *params.values()), params, fetch
+
+    def _sales_out_of_stock_request(
+        self, *, app_id: AppID = AppID.csgo, currency: Currency = Currency.eur, timeout: Optional[float] = None
+    ) -> Tuple[Hashable, Dict[str, Any], Callable[[], Awaitable[List[ItemOutOfStock]]]]:
+        params = {"app_id": app_id, "currency": currency.value}
+
+        async def fetch() -> List[ItemOutOfStock]:
+            data = await self.http.get_sales_out_of_stock(params=params, timeout=timeout)
+            return [ItemOutOfStock(data=sale) for sale in data]
+
+        return ("sales_out_of_stock", *params.values()), params, fetch
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """Returns the statistics of the response caches of this client.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`CacheStats`]
+            The statistics keyed by endpoint, i.e. ``items``, ``item_table``, ``sales_history`` and ``sales_out_of_stock``.
+        """
+        return {name: cache.stats() for name, cache in self.caches.items()}
+
+    def clear_cache(self, endpoint: Optional[str] = None) -> None:
+        """Removes all cached responses of an endpoint, including those stored in the disk cache.
+
+        Parameters
+        ----------
+        endpoint: Optional[:class:`str`]
+            The endpoint whose cache is cleared, i.e. ``items``, ``item_table``, ``sales_history`` or ``sales_out_of_stock``.
+            Clears the caches of all endpoints if not given.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The endpoint is not cached.
+        """
+        endpoints = self.caches if endpoint is None else (endpoint,)
+        for name in endpoints:
+            self._get_cache(name).clear()
+            self._delete_from_disk_cache(name)
+
+    def invalidate_cache(self, endpoint: str, /, *args: Any, **kwargs: Any) -> bool:
+        """Removes the cached response of a single request, including the one stored in the disk cache.
+
+        The arguments after ``endpoint`` are the same as those of the method of the endpoint.
+
+        Example
+        ---------
+        .. code-block:: python3
+
+           client.invalidate_cache("items", app_id=AppID.rust, currency=Currency.usd)
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The endpoint of the request, i.e. ``items``, ``item_table``, ``sales_history`` or ``sales_out_of_stock``.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether a cached response was removed.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The endpoint is not cached.
+        """
+        cache = self._get_cache(endpoint)
+        key, params, _ = self._cached_requests[endpoint](*args, **kwargs)
+        removed = cache.invalidate(key)
+        return self._delete_from_disk_cache(endpoint, params) > 0 or removed
+
+    async def prefill_cache(self, endpoint: str, /, *args: Any, **kwargs: Any) -> Any:
+        """*coroutine*
+        Fetches the response of a single request from the API and stores it in the cache,
+        even if a cached response exists in memory or in the disk cache.
+
+        The arguments after ``endpoint`` are the same as those of the method of the endpoint.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The endpoint of the request, i.e. ``items``, ``item_table``, ``sales_history`` or ``sales_out_of_stock``.
+
+        Returns
+        -------
+        Any
+            The fetched response, as returned by the method of the endpoint.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The endpoint is not cached.
+        """
+        cache = self._get_cache(endpoint)
+        key, params, fetch = self._cached_requests[endpoint](*args, **kwargs)
+        # The response is fetched from the API, not from the disk cache
+        self._delete_from_disk_cache(endpoint, params)
+        return await cache.refresh(key, lambda: self._single_flight.do(key, fetch))
+
     async def get_items(
         self,
         *,
         app_id: AppID = AppID.csgo,
         currency: Currency = Currency.eur,
         tradable: bool = False,
+        timeout: Optional[float] = None,
     ) -> List[Item]:
         """*coroutine*
         Returns a :class:`list` of :class:`Item`.
@@ -272,28 +801,62 @@ class Client:
         tradable: :class:`bool`
             Whether or not to show only tradable items.
             Defaults to ``False``.
+        timeout: Optional[:class:`float`]
+            The seconds after which waiting for the response is given up with :exc:`RequestTimeout`.
+            Defaults to the ``timeout`` of the client.
+            A request that is already in flight for another caller keeps its own deadline.
 
         Returns
         -------
         :class:`list` of :class:`Item`
         """
+        key, _, fetch = self._items_request(app_id=app_id, currency=currency, tradable=tradable, timeout=timeout)
+        return await with_timeout(self._cached("items", key, fetch), timeout)
 
-        _tradable = str(tradable).lower()
-        params = {
-            "app_id": app_id,
-            "currency": currency.value,
-            "tradable": _tradable,
-        }
-        data = await self.http.get_items(params=params)
-        return [Item(data=item) for item in data]
+    async def get_item_table(
+        self,
+        *,
+        app_id: AppID = AppID.csgo,
+        currency: Currency = Currency.eur,
+        tradable: bool = False,
+        timeout: Optional[float] = None,
+    ) -> ItemTable:
+        """*coroutine*
+        Returns the same items as :meth:`get_items` as an :class:`ItemTable`.
+
+        The table stores the items column by column, which needs considerably less
+        memory than a :class:`list` of :class:`Item` and can be filtered quickly.
+
+        Parameters
+        ----------
+        app_id: :class:`.AppID`
+            The app_id for the inventory's game.
+            Defaults to ``730``.
+        currency: :class:`.Currency`
+            The currency for pricing.
+            Defaults to ``EUR``.
+        tradable: :class:`bool`
+            Whether or not to show only tradable items.
+            Defaults to ``False``.
+        timeout: Optional[:class:`float`]
+            The seconds after which waiting for the response is given up with :exc:`RequestTimeout`.
+            Defaults to the ``timeout`` of the client.
+            A request that is already in flight for another caller keeps its own deadline.
+
+        Returns
+        -------
+        :class:`ItemTable`
+        """
+        key, _, fetch = self._item_table_request(app_id=app_id, currency=currency, tradable=tradable, timeout=timeout)
+        return await with_timeout(self._cached("item_table", key, fetch), timeout)
 
-    @cached(cache=TTLCache(maxsize=128, ttl=300))
     async def get_sales_history(
         self,
         /,
         *market_hash_names,
         app_id: AppID = AppID.csgo,
         currency: Currency = Currency.eur,
+        timeout: Optional[float] = None,
     ) -> List[ItemWithSales]:  # sourcery skip: default-mutable-arg
         """*coroutine*
         Returns a :class:`list` of :class:`ItemWithSales`.
@@ -310,25 +873,63 @@ class Client:
         currency: :class:`.Currency`
             The currency for pricing.
             Defaults to ``EUR``.
+        timeout: Optional[:class:`float`]
+            The seconds after which waiting for the response is given up with :exc:`RequestTimeout`.
+            Defaults to the ``timeout`` of the client.
+            A request that is already in flight for another caller keeps its own deadline.
 
         Returns
         -------
         :class:`list` of :class:`ItemWithSales`
         """
-        params = {
-            "app_id": app_id,
-            "currency": currency.value,
-        }
+        key, _, fetch = self._sales_history_request(*market_hash_names, app_id=app_id, currency=currency, timeout=timeout)
+        return await with_timeout(self._cached("sales_history", key, fetch), timeout)
 
-        if len(market_hash_names) > 0:
-            params["market_hash_name"] = ",".join(market_hash_names)
+    async def get_sales_history_bulk(
+        self,
+        market_hash_names: Iterable[str],
+        *,
+        app_id: AppID = AppID.csgo,
+        currency: Currency = Currency.eur,
+        max_query_length: int = 2000,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, ItemWithSales]:
+        """*coroutine*
+        Returns the sale history of an arbitrary number of items.
 
-        data = await self.http.get_sales_history(params=params)
-        return [ItemWithSales(data=sale) for sale in data]
+        The market hash names are split into chunks that fit into a URL, which are
+        requested concurrently within the rate limit using :meth:`get_sales_history`.
+
+        Parameters
+        ----------
+        market_hash_names: Iterable[:class:`str`]
+            The market hash names to get the sale history for. Duplicates are requested once.
+        app_id: :class:`.AppID`
+            The app_id for the inventory's game.
+            Defaults to ``730``.
+        currency: :class:`.Currency`
+            The currency for pricing.
+            Defaults to ``EUR``.
+        max_query_length: :class:`int`
+            The maximum length of the URL encoded ``market_hash_name`` parameter of a single request.
+            Defaults to ``2000``.
+        timeout: Optional[:class:`float`]
+            The seconds after which waiting for all responses is given up with :exc:`RequestTimeout`.
+            Defaults to the ``timeout`` of the client per request.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`ItemWithSales`]
+            The sale histories keyed by market hash name.
+            Items without a sale history are missing.
+        """
+        chunks = _chunk_market_hash_names(market_hash_names, max_query_length)
+        requests = asyncio.gather(*(self.get_sales_history(*chunk, app_id=app_id, currency=currency, timeout=timeout) for chunk in chunks))
+        results = await with_timeout(requests, timeout)
+        return {item.market_hash_name: item for result in results for item in result}
 
-    @cached(cache=TTLCache(maxsize=16, ttl=3600))
     async def get_sales_out_of_stock(
-        self, *, app_id: AppID = AppID.csgo, currency: Currency = Currency.eur
+        self, *, app_id: AppID = AppID.csgo, currency: Currency = Currency.eur, timeout: Optional[float] = None
     ) -> List[ItemOutOfStock]:
         """*coroutine*
         Returns a :class:`list` of :class:`ItemOutOfStock`.
@@ -341,16 +942,21 @@ class Client:
         currency: :class:`.Currency`
             The currency for pricing.
             Defaults to ``EUR``.
+        timeout: Optional[:class:`float`]
+            The seconds after which waiting for the response is given up with :exc:`RequestTimeout`.
+            Defaults to the ``timeout`` of the client.
+            A request that is already in flight for another caller keeps its own deadline.
 
         Returns
         -------
         :class:`list` of :class:`ItemOutOfStock`
         """
-        params = {"app_id": app_id, "currency": currency.value}
-        data = await self.http.get_sales_out_of_stock(params=params)
-        return [ItemOutOfStock(data=sale) for sale in data]
+        key, _, fetch = self._sales_out_of_stock_request(app_id=app_id, currency=currency, timeout=timeout)
+        return await with_timeout(self._cached("sales_out_of_stock", key, fetch), timeout)
 
-    async def get_account_transactions(self, *, page: int = 1, limit: int = 100, order: str = "desc") -> List[Transaction]:
+    async def get_account_transactions(
+        self, *, page: int = 1, limit: int = 100, order: str = "desc", timeout: Optional[float] = None
+    ) -> List[Transaction]:
         """*coroutine*
         Returns a :class:`list` of :class:`Transaction`.
 
@@ -365,6 +971,9 @@ class Client:
         order: :class:`str`
             Order results by asc or desc.
             Defaults to ``desc``.
+        timeout: Optional[:class:`float`]
+            The seconds after which waiting for the response is given up with :exc:`RequestTimeout`.
+            Defaults to the ``timeout`` of the client.
 
         Returns
         -------
@@ -375,17 +984,25 @@ class Client:
         :exc:`AuthenticationError`
         """
         params = {"page": page, "limit": limit, "order": order}
-        data = await self.http.get_account_transactions(params=params)
+        data = await self.http.get_account_transactions(params=params, timeout=timeout)
 
         transactions: List[Transaction] = []
         for transaction in data["data"]:
             transactions.append(Transaction(data=transaction))
         return transactions
 
-    async def fetch_all_account_transactions(self) -> TransactionAsyncIterator:
+    async def fetch_all_account_transactions(self, *, prefetch: int = 0) -> TransactionAsyncIterator:
         """
         Returns an AsyncIterator that iterates over all transactions of the authenticated client.
 
+        Parameters
+        ----------
+        prefetch: :class:`int`
+            The number of pages that are requested concurrently ahead of the page
+            being consumed, once the total number of pages is known.
+            Transactions are still yielded in order. Defaults to ``0``.
+            Use the iterator as an async context manager to cancel the
+            prefetched requests when the iteration is stopped early.
 
         Returns
         -------
@@ -395,4 +1012,70 @@ class Client:
         ------
         :exc:`AuthenticationError`
         """
-        return TransactionAsyncIterator(self.http.get_account_transactions)
+        return TransactionAsyncIterator(self.http.get_account_transactions, prefetch=prefetch)
+
+    async def sync_account_transactions(
+        self, checkpoint: Optional[TransactionCheckpoint] = None, *, limit: int = 100, timeout: Optional[float] = None
+    ) -> Tuple[List[Transaction], Optional[TransactionCheckpoint]]:
+        """*coroutine*
+        Returns the transactions of the authenticated client that are newer than the checkpoint.
+
+        Pages are requested newest first and paging stops as soon as an already seen
+        transaction is reached. Persist the returned checkpoint, e.g. with
+        :meth:`TransactionCheckpoint.to_dict`, and pass it to the next call.
+
+        .. note::
+
+            Transactions that were already seen are not returned again, even if their status changed.
+
+        Parameters
+        ----------
+        checkpoint: Optional[:class:`TransactionCheckpoint`]
+            The checkpoint returned by the previous sync.
+            If not given, all transactions are returned.
+        limit: :class:`int`
+            The number of transactions requested per page, between ``1`` and ``100``.
+            Defaults to ``100``.
+        timeout: Optional[:class:`float`]
+            The seconds after which the sync is given up with :exc:`RequestTimeout`.
+            Defaults to the ``timeout`` of the client per request.
+
+        Returns
+        -------
+        Tuple[List[:class:`Transaction`], Optional[:class:`TransactionCheckpoint`]]
+            The new transactions, newest first, and the checkpoint for the next sync.
+            The checkpoint is unchanged if there are no new transactions.
+
+        Raises
+        ------
+        :exc:`AuthenticationError`
+        """
+        return await with_timeout(self._sync_account_transactions(checkpoint, limit=limit), timeout)
+
+    async def _sync_account_transactions(
+        self, checkpoint: Optional[TransactionCheckpoint], *, limit: int
+    ) -> Tuple[List[Transaction], Optional[TransactionCheckpoint]]:
+        transactions: List[Transaction] = []
+        # New transactions shift older ones onto the next page while paginating, skip the ones already collected
+        seen: Set[int] = set()
+        page = 1
+        while True:
+            data = await self.http.get_account_transactions(params={"page": page, "limit": limit, "order": "desc"})
+            reached_checkpoint = False
+            for transaction_data in data.get("data", []):
+                transaction = Transaction(data=transaction_data)
+                if checkpoint is not None and checkpoint.includes(transaction):
+                    reached_checkpoint = True
+                    break
+                if transaction.transaction_id in seen:
+                    continue
+                seen.add(transaction.transaction_id)
+                transactions.append(transaction)
+
+            if reached_checkpoint or page >= data["pagination"].get("pages", page):
+                break
+            page += 1
+
+        if transactions:
+            checkpoint = TransactionCheckpoint.from_transaction(transactions[0])
+        return transactions, checkpoint
@@ -0,0 +1,133 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+__all__ = ("SaleDeduplicator",)
+
+
+class SaleDeduplicator:
+    """Drops saleFeed events that were already received.
+
+    Overlapping sale feeds and the saleFeedJoin events emitted after a reconnect can
+    deliver the same sale more than once. Sales are identified by their sale ID and
+    the event type and remembered in a bounded window, the oldest sales are forgotten
+    first.
+
+    Parameters
+    ----------
+    maxlen: :class:`int`
+        The maximum number of remembered sales.
+        Defaults to ``10000``.
+    ttl: Optional[:class:`float`]
+        The number of seconds a sale is remembered.
+        Defaults to ``None``, which only limits the number of sales.
+    """
+
+    __slots__ = (
+        "maxlen",
+        "ttl",
+        "duplicates",
+        "_seen",
+    )
+
+    def __init__(self, *, maxlen: int = 10000, ttl: Optional[float] = None) -> None:
+        if maxlen < 1:
+            raise ValueError("maxlen must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxlen: int = maxlen
+        self.ttl: Optional[float] = ttl
+        self.duplicates: int = 0
+        self._seen: OrderedDict[Tuple[Hashable, str], float] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<SaleDeduplicator maxlen={self.maxlen} ttl={self.ttl} size={len(self._seen)} duplicates={self.duplicates}>"
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def _expire(self, now: float) -> None:
+        if self.ttl is None:
+            return
+        # Sales are remembered in the order they were received, so the expired ones are at the front
+        deadline = now - self.ttl
+        while self._seen:
+            key, seen_at = next(iter(self._seen.items()))
+            if seen_at > deadline:
+                break
+            del self._seen[key]
+
+    def seen(self, sale_id: Hashable, event_type: str) -> bool:
+        """Returns whether a sale was already received and remembers it otherwise.
+
+        Parameters
+        ----------
+        sale_id: Hashable
+            The ID of the sale.
+        event_type: :class:`str`
+            The type of the event.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        now = time.monotonic()
+        self._expire(now)
+        key = (sale_id, event_type)
+        if key in self._seen:
+            self.duplicates += 1
+            return True
+        self._seen[key] = now
+        if len(self._seen) > self.maxlen:
+            self._seen.popitem(last=False)
+        return False
+
+    def filter(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Removes the sales of a saleFeed event that were already received.
+
+        Parameters
+        ----------
+        data: Dict[:class:`str`, Any]
+            The data of the saleFeed event. It is not modified.
+
+        Returns
+        -------
+        Optional[Dict[:class:`str`, Any]]
+            The event, a copy of it without the duplicate sales or ``None`` if every sale was a duplicate.
+        """
+        event_type = data.get("eventType", "")
+        sales = data.get("sales", [])
+        new_sales = [sale for sale in sales if not self.seen(sale.get("saleId"), event_type)]
+        if len(new_sales) == len(sales):
+            return data
+        if not new_sales:
+            return None
+        return {**data, "sales": new_sales}
+
+    def clear(self) -> None:
+        """Forgets all sales."""
+        self._seen.clear()
@@ -0,0 +1,245 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .salefeed import SaleFeed
+
+__all__ = ("EventDispatcher",)
+
+
+_log = logging.getLogger(__name__)
+
+
+def _sale_id_keys(name: str, args: Tuple[Any, ...]) -> Iterable[Hashable]:
+    """Returns the sale IDs of all sales of a saleFeed event and the event name otherwise."""
+    if name == "saleFeed" and args:
+        if isinstance(args[0], SaleFeed):
+            sales = args[0].sales
+            if sales:
+                return [sale.sale_id for sale in sales]
+        elif isinstance(args[0], dict):
+            sales = args[0].get("sales")
+            if sales:
+                return [sale.get("saleId") for sale in sales]
+    return (name,)
+
+
+class _Barrier:
+    # Runs a call that spans several ordered queues once the worker of every queue reached it,
+    # and holds these workers until it is done
+
+    __slots__ = ("parties", "arrived", "done")
+
+    def __init__(self, parties: int) -> None:
+        self.parties: int = parties
+        self.arrived: int = 0
+        self.done: asyncio.Event = asyncio.Event()
+
+    async def arrive(self, call: Callable[[], Any]) -> None:
+        self.arrived += 1
+        if self.arrived < self.parties:
+            await self.done.wait()
+            return
+        try:
+            await call()
+        finally:
+            self.done.set()
+
+
+class EventDispatcher:
+    """Dispatches websocket events to their listeners.
+
+    Every event can have multiple listeners. Without workers, the listeners of an
+    event are awaited one after another when the event is dispatched. With workers,
+    dispatching only enqueues the event and a pool of asyncio tasks calls the listeners
+    concurrently.
+
+    Parameters
+    ----------
+    workers: :class:`int`
+        The number of worker tasks calling the listeners.
+        Defaults to ``0``, which calls the listeners inline.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor that runs listeners which are regular functions instead of coroutine functions.
+        If not given, only coroutine functions can be registered.
+    ordered: :class:`bool`
+        Whether events sharing a key are handled in the order they were received.
+        An event with several keys waits for all earlier events of each of its keys,
+        and later events of these keys wait for it. Defaults to ``False``.
+    keys: Optional[Callable[[:class:`str`, :class:`tuple`], Iterable[Hashable]]]
+        Returns the ordering keys of an event from its name and arguments.
+        Defaults to the sale IDs of all sales of saleFeed events and the event name for other events.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 0,
+        executor: Optional[Executor] = None,
+        ordered: bool = False,
+        keys: Optional[Callable[[str, Tuple[Any, ...]], Iterable[Hashable]]] = None,
+    ) -> None:
+        if workers < 0:
+            raise ValueError("workers must not be negative")
+        self.workers: int = workers
+        self.executor: Optional[Executor] = executor
+        self.ordered: bool = ordered
+        self.keys: Callable[[str, Tuple[Any, ...]], Iterable[Hashable]] = keys or _sale_id_keys
+        self.listeners: Dict[str, List[Callable[..., Any]]] = {}
+        self._queues: List[asyncio.Queue[Tuple[Callable[..., Any], Tuple[Any, ...], Optional[_Barrier]]]] = []
+        self._tasks: List[asyncio.Task[None]] = []
+
+    def add_listener(self, name: str, func: Callable[..., Any]) -> None:
+        """Registers a listener for an event.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event.
+        func: Callable[..., Any]
+            The listener.
+
+        Raises
+        ------
+        :exc:`TypeError`
+            The listener is not a coroutine function and no executor is configured.
+        """
+        if not asyncio.iscoroutinefunction(func) and self.executor is None:
+            raise TypeError("event listener registered must be a coroutine function")
+        self.listeners.setdefault(name, []).append(func)
+
+    def remove_listener(self, name: str, func: Callable[..., Any]) -> None:
+        """Removes a listener of an event. Does nothing if the listener is not registered.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event.
+        func: Callable[..., Any]
+            The listener.
+        """
+        listeners = self.listeners.get(name, [])
+        if func in listeners:
+            listeners.remove(func)
+        if not listeners:
+            self.listeners.pop(name, None)
+
+    async def dispatch(self, name: str, *args: Any) -> None:
+        """*coroutine*
+        Dispatches an event to its listeners.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event.
+        *args: Any
+            The arguments the listeners are called with.
+        """
+        listeners = self.listeners.get(name)
+        if not listeners:
+            return
+
+        keys = tuple(self.keys(name, args)) if self.ordered and self.workers else ()
+        for func in tuple(listeners):
+            await self.submit(func, *args, keys=keys)
+
+    async def submit(self, func: Callable[..., Any], *args: Any, keys: Iterable[Hashable] = ()) -> None:
+        """*coroutine*
+        Runs a single function like a listener.
+
+        Parameters
+        ----------
+        func: Callable[..., Any]
+            The function.
+        *args: Any
+            The arguments the function is called with.
+        keys: Iterable[Hashable]
+            The ordering keys if the dispatcher is ordered.
+        """
+        if self.workers == 0:
+            await self._call(func, args)
+            return
+
+        self._start()
+        if len(self._queues) == 1:
+            self._queues[0].put_nowait((func, args, None))
+            return
+        indexes = {hash(key) % len(self._queues) for key in keys} or {hash(None) % len(self._queues)}
+        if len(indexes) == 1:
+            self._queues[indexes.pop()].put_nowait((func, args, None))
+            return
+        # The barrier is put into every queue without yielding, so all queues see
+        # the events in the same order and two barriers can never wait for each other
+        barrier = _Barrier(len(indexes))
+        for index in indexes:
+            self._queues[index].put_nowait((func, args, barrier))
+
+    async def _call(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        try:
+            if asyncio.iscoroutinefunction(func):
+                await func(*args)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self.executor, functools.partial(func, *args))
+        except Exception:
+            _log.exception("Ignoring exception in event listener %s", getattr(func, "__name__", func))
+
+    def _start(self) -> None:
+        if self._tasks:
+            return
+        # Unordered events share one queue, so an idle worker picks up the next event.
+        # Ordered events are sharded by key, so events with the same key never overlap.
+        self._queues = [asyncio.Queue() for _ in range(self.workers if self.ordered else 1)]
+        self._tasks = [asyncio.ensure_future(self._worker(self._queues[i % len(self._queues)])) for i in range(self.workers)]
+
+    async def _worker(self, queue: "asyncio.Queue[Tuple[Callable[..., Any], Tuple[Any, ...], Optional[_Barrier]]]") -> None:
+        while True:
+            func, args, barrier = await queue.get()
+            try:
+                if barrier is None:
+                    await self._call(func, args)
+                else:
+                    await barrier.arrive(functools.partial(self._call, func, args))
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        """*coroutine*
+        Waits until all dispatched events have been handled."""
+        for queue in self._queues:
+            await queue.join()
+
+    async def close(self) -> None:
+        """*coroutine*
+        Stops the workers. Events that have not been handled yet are discarded."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
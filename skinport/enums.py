@@ -30,6 +30,7 @@ __all__ = (
     "Exterior",
     "Locale",
     "EventType",
+    "OverflowPolicy",
     "SaleType",
     "TransactionStatus",
     "TransactionType",
@@ -90,6 +91,15 @@ class EventType(StrEnum):
         return self.value
 
 
+class OverflowPolicy(StrEnum):
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+    def __str__(self) -> str:
+        return self.value
+
+
 class SaleType(StrEnum):
     public = "public"
     private = "private"
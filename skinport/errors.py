@@ -33,6 +33,8 @@ __all__ = (
     "NotAcceptable",
     "NotFound",
     "ParamRequired",
+    "RateLimited",
+    "RequestTimeout",
     "SkinportException",
     "ValidationError",
 )
@@ -92,6 +94,26 @@ class HTTPException(SkinportException):
         super().__init__(fmt.format(self.response, self.text))
 
 
+class RequestTimeout(SkinportException, TimeoutError):
+    """Exception that's raised when a request did not complete within its deadline.
+
+    The request is cancelled, so it neither holds a connection nor waits for the rate limiter anymore.
+    Subclass of :exc:`TimeoutError`, so it is also caught by ``except asyncio.TimeoutError``.
+
+    Attributes
+    ------------
+    timeout: Optional[:class:`float`]
+        The deadline in seconds, or ``None`` if the connection or read timeout of the socket expired.
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+        if timeout is None:
+            super().__init__("The request timed out")
+        else:
+            super().__init__(f"The request did not complete within {timeout} seconds")
+
+
 class ParamRequired(ClientException):
     """Exception that's raised when a required parameter is not passed."""
 
@@ -150,6 +172,23 @@ class NotAcceptable(HTTPException):
     pass
 
 
+class RateLimited(HTTPException):
+    """Exception that's raised for when status code 429 occurs and the request
+    could not be retried within its :class:`RetryPolicy`.
+
+    Subclass of :exc:`HTTPException`
+
+    Attributes
+    ------------
+    retry_after: Optional[:class:`float`]
+        The number of seconds after which the request may be sent again, if the response told.
+    """
+
+    def __init__(self, response, message, retry_after=None):
+        super().__init__(response, message)
+        self.retry_after = retry_after
+
+
 class InternalServerError(HTTPException):
     """Exception that's raised for when a 500 range status code occurs.
 
@@ -23,16 +23,19 @@ SOFTWARE.
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import ssl
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Union
+import time
+from typing import Any, Awaitable, Dict, Iterable, List, Mapping, Optional, TypeVar, Union
 
 import aiohttp
 
 from skinport import __version__
 
+from .cache import DiskCache
 from .errors import (
     AuthenticationError,
     HTTPException,
@@ -40,10 +43,17 @@ from .errors import (
     InternalServerError,
     InvalidScope,
     NotFound,
+    RateLimited,
+    RequestTimeout,
 )
+from .instrumentation import Instrumentation, RequestMetrics, notify, create_trace_config
+from .ratelimit import RateLimit, RateLimiter
+from .retry import RetryPolicy
 
 _log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any], str]:
     text = await response.text(encoding="utf-8")
@@ -56,12 +66,57 @@ async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any]
     return text
 
 
+def _exception_for(response: aiohttp.ClientResponse, data: Union[Dict[str, Any], str], retry_after: Optional[float]) -> HTTPException:
+    if response.status == 401:
+        return AuthenticationError(response, data)
+    if response.status == 402:
+        return InsufficientFunds(response, data)
+    if response.status == 403:
+        return InvalidScope(response, data)
+    if response.status == 404:
+        return NotFound(response, data)
+    if response.status == 429:
+        return RateLimited(response, data, retry_after)
+    if response.status >= 500:
+        return InternalServerError(response, data)
+    return HTTPException(response, data)
+
+
+async def with_timeout(awaitable: Awaitable[T], timeout: Optional[float]) -> T:
+    """Awaits ``awaitable`` and cancels it if it does not complete within ``timeout`` seconds.
+
+    Every timeout, including those of the sockets, is raised as :exc:`RequestTimeout`.
+    Its ``timeout`` is only set if the deadline itself has expired.
+    """
+    deadline: Optional[asyncio.Timeout] = None
+    try:
+        if timeout is None:
+            return await awaitable
+        async with asyncio.timeout(timeout) as deadline:
+            return await awaitable
+    except asyncio.TimeoutError as exc:
+        if isinstance(exc, RequestTimeout):
+            raise
+        if deadline is not None and deadline.expired():
+            raise RequestTimeout(timeout) from exc
+        raise RequestTimeout() from exc
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    # Pinning to TLS v1.3 (thanks CloudFlare)
+    ssl_context = ssl.create_default_context()
+    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
+    ssl_context.maximum_version = ssl.TLSVersion.TLSv1_3
+    return ssl_context
+
+
 class Route:
     BASE = "https://api.skinport.com/v1"
 
-    def __init__(self, method: str, path: str) -> None:
+    def __init__(self, method: str, path: str, *, bucket: Optional[str] = None) -> None:
         self.path: str = path
         self.method: str = method
+        self.bucket: Optional[str] = bucket
         self.url: str = self.BASE + self.path
 
 
@@ -71,18 +126,48 @@ class HTTPClient:
         *,
         proxy: Optional[str] = None,
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
+        rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        connector_limit: int = 100,
+        keepalive_timeout: float = 60.0,
+        dns_cache_ttl: Optional[int] = 300,
+        disk_cache: Optional[DiskCache] = None,
+        base_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Mapping[str, RetryPolicy]] = None,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = 30.0,
+        read_timeout: Optional[float] = 60.0,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> None:
+        # The SSL context is expensive to build, so it is created once and
+        # shared by all connections, including the websocket connection.
+        self.ssl_context: ssl.SSLContext = _create_ssl_context()
+        self.connector_limit: int = connector_limit
+        self.keepalive_timeout: float = keepalive_timeout
+        self.dns_cache_ttl: Optional[int] = dns_cache_ttl
+        # The deadline of a request including rate limit waits and retries, the
+        # socket timeouts apply to every attempt
+        self.timeout: Optional[float] = timeout
+        self.connect_timeout: Optional[float] = connect_timeout
+        self.read_timeout: Optional[float] = read_timeout
+        self.instrumentation: Optional[Instrumentation] = instrumentation
         # Checks if the skinport.Client was initialized before or after the event loop started
         # If it was not initialized, you have to call start_session()
         try:
             asyncio.get_running_loop()
-            self.__session = aiohttp.ClientSession()
+            self.__session = self._create_session()
         except RuntimeError:
             self.__session = None
         self.auth = None
         self.proxy: Optional[str] = proxy
         self.proxy_auth: Optional[aiohttp.BasicAuth] = proxy_auth
-        self.ratelimit_lock: asyncio.Lock = asyncio.Lock()
+        self.ratelimiter: RateLimiter = RateLimiter(rate_limits)
+        self.disk_cache: Optional[DiskCache] = disk_cache
+        # Overrides Route.BASE, e.g. to point the client at a FakeSkinportServer
+        self.base_url: Optional[str] = base_url.rstrip("/") if base_url is not None else None
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Overrides of the retry policy per rate limit bucket
+        self.retry_policies: Dict[str, RetryPolicy] = dict(retry_policies or {})
 
         user_agent = "skinport.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
         self.user_agent: str = user_agent.format(__version__, sys.version_info, str(aiohttp.__version__))  #
@@ -94,17 +179,60 @@ class HTTPClient:
         if self.__session:
             await self.__session.close()
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            ssl=self.ssl_context,
+            limit=self.connector_limit,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=self.dns_cache_ttl is not None,
+        )
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.connect_timeout, sock_read=self.read_timeout)
+        trace_configs = [create_trace_config()] if self.instrumentation is not None else None
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, trace_configs=trace_configs)
+
     async def start_session(self):
-        self.__session = aiohttp.ClientSession()
+        # Keep the existing session alive so its pooled connections can be reused
+        if self.__session is None or self.__session.closed:
+            self.__session = self._create_session()
 
     async def request(
         self,
         route: Route,
         params: Optional[Iterable[Dict[str, Any]]] = None,
+        *,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if timeout is None:
+            timeout = self.timeout
+        if self.instrumentation is None:
+            return await with_timeout(self._request(route, params, timeout=timeout, **kwargs), timeout)
+
+        metrics = RequestMetrics(route.method, route.path, route.bucket)
+        started_at = time.perf_counter()
+        try:
+            return await with_timeout(self._request(route, params, timeout=timeout, metrics=metrics, **kwargs), timeout)
+        except BaseException as exc:
+            metrics.error = type(exc).__name__
+            raise
+        finally:
+            metrics.total = time.perf_counter() - started_at
+            notify(self.instrumentation, "on_request", metrics)
+
+    async def _request(
+        self,
+        route: Route,
+        params: Optional[Iterable[Dict[str, Any]]],
+        *,
+        timeout: Optional[float],
+        metrics: Optional[RequestMetrics] = None,
         **kwargs: Any,
     ) -> Any:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
         method = route.method
-        url = route.url
+        url = route.url if self.base_url is None else self.base_url + route.path
 
         # header creation
         headers: Dict[str, str] = {
@@ -117,49 +245,70 @@ class HTTPClient:
         if params:
             kwargs["params"] = params
 
-        # Pinning to TLS v1.3 (thanks CloudFlare)
-        ssl_context = ssl.create_default_context()
-        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
-        ssl_context.maximum_version = ssl.TLSVersion.TLSv1_3
-
-        async with self.ratelimit_lock:
-            for _ in range(2):
-                async with self.__session.request(method, url, auth=self.auth, ssl=ssl_context, **kwargs) as response:
-                    _log.debug(f"{method} {url} with {kwargs} has returned {response.status}")
+        cache_key = None
+        if self.disk_cache is not None and method == "GET" and self.disk_cache.handles(route.bucket):
+            cache_key = DiskCache.key(method, url, params)
+            body = await self.disk_cache.get(route.bucket, cache_key)
+            if body is not None:
+                _log.debug("%s %s has been served from the disk cache", method, url)
+                return json.loads(body)
+
+        policy = self.retry_policies.get(route.bucket, self.retry_policy)
+        started_at = loop.time()
+        for attempt in itertools.count(1):
+            # Fail right away instead of waiting for a budget that is not available before the deadline
+            if deadline is not None and loop.time() + self.ratelimiter.delay(route.bucket) > deadline:
+                raise RequestTimeout(timeout)
+            waited = await self.ratelimiter.acquire(route.bucket)
+            if metrics is not None:
+                metrics.attempts = attempt
+                metrics.ratelimit_wait += waited
+            retry_after = None
+            try:
+                async with self.__session.request(method, url, auth=self.auth, trace_request_ctx=metrics, **kwargs) as response:
+                    _log.debug("%s %s with %s has returned %s", method, url, kwargs, response.status)
 
                     data = await json_or_text(response)
+                    if metrics is not None:
+                        metrics.status = response.status
+                        metrics.size = len(await response.read())
 
                     if 300 > response.status >= 200:
-                        _log.debug(f"{method} {url} has received {data}")
+                        _log.debug("%s %s has received %s", method, url, data)
+                        if cache_key is not None and not isinstance(data, str):
+                            await self.disk_cache.set(route.bucket, cache_key, await response.text(encoding="utf-8"))
                         return data
 
-                    if response.status in {500, 503}:
-                        raise InternalServerError(response, data)
-
-                    if response.status == 401:
-                        raise AuthenticationError(response, data)
-                    if response.status == 402:
-                        raise InsufficientFunds(response, data)
-                    if response.status == 403:
-                        raise InvalidScope(response, data)
-                    if response.status == 404:
-                        raise NotFound(response, data)
                     if response.status == 429:
-                        # We are getting rate-limited, read retry-after header and try again
-                        retry_after = int(headers.get("Retry-After", 60))
-                        _log.debug(f"{method} {url} is getting rate-limited, retry after {retry_after} seconds")
-                        await asyncio.sleep(retry_after)
-                        continue
-                    raise HTTPException(response, data)
+                        retry_after = policy.parse_retry_after(response.headers.get("Retry-After"))
+                    error: Exception = _exception_for(response, data, retry_after)
+                    if response.status not in policy.statuses:
+                        raise error
+            except aiohttp.ClientConnectionError as exc:
+                if not policy.connection_errors:
+                    raise
+                error = exc
+            finally:
+                self.ratelimiter.release(route.bucket)
+
+            delay = retry_after if retry_after is not None else policy.backoff(attempt)
+            if not policy.allows(attempt, loop.time() - started_at + delay) or (deadline is not None and loop.time() + delay >= deadline):
+                raise error
+
+            _log.debug("%s %s has failed with %r, retrying in %.2f seconds", method, url, error, delay)
+            # A rate limited bucket holds back every request to it, not only this retry
+            if isinstance(error, RateLimited) and self.ratelimiter.pause(route.bucket, delay):
+                continue
+            await asyncio.sleep(delay)
 
     async def get_items(self, **parameters: Any) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", "/items"), **parameters)
+        return await self.request(Route("GET", "/items", bucket="items"), **parameters)
 
     async def get_sales_history(self, **parameters: Any) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", "/sales/history"), **parameters)
+        return await self.request(Route("GET", "/sales/history", bucket="sales_history"), **parameters)
 
     async def get_sales_out_of_stock(self, **parameters: Any) -> List[Dict[str, Any]]:
-        return await self.request(Route("GET", "/sales/out-of-stock"), **parameters)
+        return await self.request(Route("GET", "/sales/out-of-stock", bucket="sales_out_of_stock"), **parameters)
 
     async def get_account_transactions(self, **parameters: Any) -> Dict[str, Any]:
-        return await self.request(Route("GET", "/account/transactions"), **parameters)
+        return await self.request(Route("GET", "/account/transactions", bucket="account"), **parameters)
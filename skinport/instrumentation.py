@@ -0,0 +1,313 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import logging
+import time
+import types
+from typing import Any, Optional
+
+import aiohttp
+
+__all__ = (
+    "Instrumentation",
+    "PrometheusInstrumentation",
+    "RequestMetrics",
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class RequestMetrics:
+    """The measurements of a single request to the REST API, including its retries.
+
+    The phases are measured for the last attempt. A phase is ``None`` if it did not
+    happen, e.g. ``connect`` if a pooled connection was reused.
+
+    Attributes
+    ------------
+    method: :class:`str`
+        The HTTP method.
+    path: :class:`str`
+        The path of the route, e.g. ``/items``.
+    bucket: Optional[:class:`str`]
+        The rate limit bucket of the route.
+    status: Optional[:class:`int`]
+        The status code of the last response, ``None`` if there was none.
+    size: :class:`int`
+        The number of bytes of the last response body.
+    attempts: :class:`int`
+        The number of times the request was sent, ``0`` if it was served from the disk cache.
+    ratelimit_wait: :class:`float`
+        The seconds spent waiting for the rate limiter, over all attempts.
+    dns: Optional[:class:`float`]
+        The seconds spent resolving the host name.
+    connect: Optional[:class:`float`]
+        The seconds spent opening the connection, including the TLS handshake.
+    ttfb: Optional[:class:`float`]
+        The seconds from sending the request until the response headers were received.
+    body: Optional[:class:`float`]
+        The seconds from receiving the headers until the body was received.
+    total: :class:`float`
+        The seconds from calling the request until it returned or raised.
+    error: Optional[:class:`str`]
+        The name of the exception the request raised.
+    """
+
+    __slots__ = (
+        "attempts",
+        "body",
+        "bucket",
+        "connect",
+        "dns",
+        "error",
+        "method",
+        "path",
+        "ratelimit_wait",
+        "size",
+        "status",
+        "total",
+        "ttfb",
+    )
+
+    def __init__(self, method: str, path: str, bucket: Optional[str] = None) -> None:
+        self.method: str = method
+        self.path: str = path
+        self.bucket: Optional[str] = bucket
+        self.status: Optional[int] = None
+        self.size: int = 0
+        self.attempts: int = 0
+        self.ratelimit_wait: float = 0.0
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.body: Optional[float] = None
+        self.total: float = 0.0
+        self.error: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<RequestMetrics method={self.method!r} path={self.path!r} status={self.status!r} total={self.total:.3f}>"
+
+    @property
+    def retries(self) -> int:
+        """:class:`int`: The number of retries."""
+        return max(0, self.attempts - 1)
+
+
+class Instrumentation:
+    """Receives the measurements of a :class:`Client`.
+
+    Subclass it and override the methods of the measurements you are interested in.
+    The methods are called synchronously on the event loop, so they should return quickly.
+    Exceptions raised by them are logged and otherwise ignored.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       class LogSlowRequests(Instrumentation):
+           def on_request(self, metrics):
+               if metrics.total > 1:
+                   print(metrics.path, metrics.ttfb, metrics.body, metrics.ratelimit_wait)
+
+       client = Client(instrumentation=LogSlowRequests())
+    """
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        """Called when a request to the REST API returned or raised.
+
+        Parameters
+        ----------
+        metrics: :class:`RequestMetrics`
+            The measurements of the request.
+        """
+        pass
+
+    def on_packet(self, size: int, seconds: float) -> None:
+        """Called when a websocket packet was decoded.
+
+        Parameters
+        ----------
+        size: :class:`int`
+            The number of bytes of the packet.
+        seconds: :class:`float`
+            The seconds spent decoding it.
+        """
+        pass
+
+    def on_event(self, name: str, seconds: float) -> None:
+        """Called when a websocket event was dispatched.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event.
+        seconds: :class:`float`
+            The seconds until the listeners, streams and subscriptions handled the event,
+            or until it was queued if the client has ``listener_workers``.
+        """
+        pass
+
+
+def notify(instrumentation: Instrumentation, method: str, *args: Any) -> None:
+    """Calls a method of the instrumentation and logs its exceptions."""
+    try:
+        getattr(instrumentation, method)(*args)
+    except Exception:
+        _log.exception("Ignoring exception in %s.%s", type(instrumentation).__name__, method)
+
+
+# The TraceConfig callbacks receive the RequestMetrics of the request as trace_request_ctx
+# and keep the start times of the phases in their per request context.
+
+
+async def _on_request_start(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    metrics = context.trace_request_ctx
+    if metrics is not None:
+        metrics.dns = metrics.connect = metrics.ttfb = metrics.body = None
+
+
+async def _on_dns_resolvehost_start(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    context.dns_started_at = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.dns = time.perf_counter() - context.dns_started_at
+
+
+async def _on_connection_create_start(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    context.connect_started_at = time.perf_counter()
+
+
+async def _on_connection_create_end(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.connect = time.perf_counter() - context.connect_started_at
+
+
+async def _on_request_headers_sent(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    context.sent_at = time.perf_counter()
+
+
+async def _on_request_end(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    context.headers_received_at = now = time.perf_counter()
+    if context.trace_request_ctx is not None and hasattr(context, "sent_at"):
+        context.trace_request_ctx.ttfb = now - context.sent_at
+
+
+async def _on_response_chunk_received(session: aiohttp.ClientSession, context: types.SimpleNamespace, params: Any) -> None:
+    if context.trace_request_ctx is not None and hasattr(context, "headers_received_at"):
+        context.trace_request_ctx.body = time.perf_counter() - context.headers_received_at
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Returns a :class:`aiohttp.TraceConfig` that measures the phases of the requests into their :class:`RequestMetrics`."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_request_headers_sent.append(_on_request_headers_sent)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_response_chunk_received.append(_on_response_chunk_received)
+    return trace_config
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Exports the measurements of a :class:`Client` as Prometheus metrics.
+
+    Requires the ``prometheus-client`` package, e.g. ``pip install skinport.py[prometheus]``.
+
+    The following metrics are registered, prefixed with ``namespace``:
+
+    - ``request_duration_seconds``, a histogram labelled by ``path`` and ``phase``,
+      which is one of ``total``, ``ratelimit_wait``, ``dns``, ``connect``, ``ttfb`` and ``body``
+    - ``requests_total``, a counter labelled by ``path`` and ``status``
+    - ``request_retries_total``, a counter labelled by ``path``
+    - ``response_size_bytes``, a histogram labelled by ``path``
+    - ``packet_decode_seconds``, a histogram
+    - ``event_dispatch_seconds``, a histogram labelled by ``event``
+
+    Parameters
+    ----------
+    registry: Optional[:class:`prometheus_client.CollectorRegistry`]
+        The registry of the metrics. Defaults to the global registry.
+    namespace: :class:`str`
+        The prefix of the metric names. Defaults to ``skinport``.
+    """
+
+    def __init__(self, *, registry: Any = None, namespace: str = "skinport") -> None:
+        try:
+            import prometheus_client
+        except ImportError as exc:
+            raise ImportError("PrometheusInstrumentation requires the prometheus-client package") from exc
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        self.request_duration = prometheus_client.Histogram(
+            "request_duration_seconds", "Duration of the requests to the Skinport API", ["path", "phase"], namespace=namespace, registry=registry
+        )
+        self.requests = prometheus_client.Counter(
+            "requests", "Requests to the Skinport API", ["path", "status"], namespace=namespace, registry=registry
+        )
+        self.retries = prometheus_client.Counter(
+            "request_retries", "Retried requests to the Skinport API", ["path"], namespace=namespace, registry=registry
+        )
+        self.response_size = prometheus_client.Histogram(
+            "response_size_bytes",
+            "Size of the responses of the Skinport API",
+            ["path"],
+            namespace=namespace,
+            registry=registry,
+            buckets=(1024, 16 * 1024, 256 * 1024, 1024**2, 4 * 1024**2, 16 * 1024**2, 64 * 1024**2),
+        )
+        self.packet_decode = prometheus_client.Histogram(
+            "packet_decode_seconds",
+            "Duration of decoding the websocket packets",
+            namespace=namespace,
+            registry=registry,
+            buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05),
+        )
+        self.event_dispatch = prometheus_client.Histogram(
+            "event_dispatch_seconds", "Duration of dispatching the websocket events", ["event"], namespace=namespace, registry=registry
+        )
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        self.requests.labels(metrics.path, str(metrics.status) if metrics.status is not None else metrics.error or "").inc()
+        if metrics.retries:
+            self.retries.labels(metrics.path).inc(metrics.retries)
+        if metrics.status is not None:
+            self.response_size.labels(metrics.path).observe(metrics.size)
+        for phase in ("total", "ratelimit_wait", "dns", "connect", "ttfb", "body"):
+            seconds = getattr(metrics, phase)
+            if seconds is not None:
+                self.request_duration.labels(metrics.path, phase).observe(seconds)
+
+    def on_packet(self, size: int, seconds: float) -> None:
+        self.packet_decode.observe(seconds)
+
+    def on_event(self, name: str, seconds: float) -> None:
+        self.event_dispatch.labels(name).observe(seconds)
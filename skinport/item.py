@@ -23,7 +23,11 @@ SOFTWARE.
 """
 
 import datetime
-from typing import Any, Dict, Optional
+import inspect
+import math
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union
 
 from .enums import Currency
 from .sale import LastXDays
@@ -31,6 +35,7 @@ from .sale import LastXDays
 __all__ = (
     "Item",
     "ItemOutOfStock",
+    "ItemTable",
     "ItemWithSales",
 )
 
@@ -274,3 +279,231 @@ class ItemWithSales:
     def last_90_days(self) -> LastXDays:
         """:class:`LastXDays`: Returns information about sales of the item in the last 90 days."""
         return LastXDays(data=self._last_90_days)
+
+
+def _price_or_nan(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class ItemTable:
+    """Represents a list of items stored column by column.
+
+    Compared to a :class:`list` of :class:`Item`, prices, quantities and timestamps are
+    stored in :class:`array.array` columns and market hash names are interned, which
+    keeps large catalogues small and makes scanning them fast.
+
+    Missing prices are stored as ``nan`` in the price columns, so comparisons
+    involving them are always ``False``.
+
+    Rows can be accessed by position or by market hash name and are returned as :class:`Item`.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       table = await client.get_item_table()
+       cheap = table.filter(lambda quantity, min_price, suggested_price: quantity > 0 and min_price < suggested_price * 0.8)
+       for item in cheap:
+           print(item.market_hash_name, item.min_price)
+    """
+
+    FLOAT_COLUMNS = ("suggested_price", "min_price", "max_price", "mean_price", "median_price")
+    INT_COLUMNS = ("quantity", "created_at", "updated_at")
+    OBJECT_COLUMNS = ("market_hash_name", "currency", "item_page", "market_page", "version")
+    COLUMNS = OBJECT_COLUMNS[:2] + FLOAT_COLUMNS + INT_COLUMNS + OBJECT_COLUMNS[2:]
+
+    __slots__ = (
+        "_columns",
+        "_index",
+    )
+
+    def __init__(self, *, data: Iterable[Dict[str, Any]]) -> None:
+        columns: Dict[str, Union[array, List[Any]]] = {}
+        for name in self.FLOAT_COLUMNS:
+            columns[name] = array("d")
+        for name in self.INT_COLUMNS:
+            columns[name] = array("q")
+        for name in self.OBJECT_COLUMNS:
+            columns[name] = []
+
+        intern = sys.intern
+        for item in data:
+            columns["market_hash_name"].append(intern(item.get("market_hash_name") or ""))
+            columns["currency"].append(intern(item.get("currency") or ""))
+            columns["item_page"].append(item.get("item_page"))
+            columns["market_page"].append(item.get("market_page"))
+            version = item.get("version")
+            columns["version"].append(intern(version) if version is not None else None)
+            for name in self.FLOAT_COLUMNS:
+                columns[name].append(_price_or_nan(item.get(name)))
+            for name in self.INT_COLUMNS:
+                columns[name].append(item.get(name) or 0)
+
+        self._columns: Dict[str, Union[array, List[Any]]] = columns
+        self._index: Dict[str, int] = {name: row for row, name in enumerate(columns["market_hash_name"])}
+
+    @classmethod
+    def _from_columns(cls, columns: Dict[str, Union[array, List[Any]]]) -> "ItemTable":
+        self = cls.__new__(cls)
+        self._columns = columns
+        self._index = {name: row for row, name in enumerate(columns["market_hash_name"])}
+        return self
+
+    def __repr__(self) -> str:
+        return f"<ItemTable rows={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._columns["market_hash_name"])
+
+    def __sizeof__(self) -> int:
+        # sys.getsizeof of an array includes its buffer, the values of the object columns
+        # are counted once since interned strings are shared between rows
+        size = object.__sizeof__(self) + sys.getsizeof(self._columns) + sys.getsizeof(self._index)
+        seen: Set[int] = set()
+        for column in self._columns.values():
+            size += sys.getsizeof(column)
+            if isinstance(column, list):
+                for value in column:
+                    if value is not None and id(value) not in seen:
+                        seen.add(id(value))
+                        size += sys.getsizeof(value)
+        return size
+
+    def __iter__(self) -> Iterator[Item]:
+        for row in range(len(self)):
+            yield self._item(row)
+
+    def __contains__(self, market_hash_name: object) -> bool:
+        return market_hash_name in self._index
+
+    def __getitem__(self, key: Union[int, str]) -> Item:
+        if isinstance(key, str):
+            return self._item(self._index[key])
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("ItemTable index out of range")
+        return self._item(key)
+
+    def _item(self, row: int) -> Item:
+        data: Dict[str, Any] = {}
+        for name in self.OBJECT_COLUMNS + self.INT_COLUMNS:
+            data[name] = self._columns[name][row]
+        for name in self.FLOAT_COLUMNS:
+            data[name] = _nan_to_none(self._columns[name][row])
+        return Item(data=data)
+
+    def get(self, market_hash_name: str) -> Optional[Item]:
+        """Returns the item with the market hash name.
+
+        Parameters
+        ----------
+        market_hash_name: :class:`str`
+            The market hash name of the item.
+
+        Returns
+        -------
+        Optional[:class:`Item`]
+        """
+        row = self._index.get(market_hash_name)
+        return self._item(row) if row is not None else None
+
+    def row(self, market_hash_name: str) -> Optional[int]:
+        """Returns the position of the item with the market hash name.
+
+        Parameters
+        ----------
+        market_hash_name: :class:`str`
+            The market hash name of the item.
+
+        Returns
+        -------
+        Optional[:class:`int`]
+        """
+        return self._index.get(market_hash_name)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Returns a column of the table.
+
+        The price columns are :class:`array.array` of :class:`float` with ``nan`` for missing prices,
+        ``quantity``, ``created_at`` and ``updated_at`` are :class:`array.array` of :class:`int`
+        and all other columns are :class:`list`. The returned column must not be modified.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the column, one of :attr:`COLUMNS`.
+
+        Returns
+        -------
+        Sequence[Any]
+
+        Raises
+        ------
+        :exc:`KeyError`
+            The column does not exist.
+        """
+        return self._columns[name]
+
+    def take(self, rows: Iterable[int]) -> "ItemTable":
+        """Returns a new table with the rows at the given positions.
+
+        Parameters
+        ----------
+        rows: Iterable[:class:`int`]
+            The positions of the rows.
+
+        Returns
+        -------
+        :class:`ItemTable`
+        """
+        rows = list(rows)
+        columns: Dict[str, Union[array, List[Any]]] = {}
+        for name, column in self._columns.items():
+            values = [column[row] for row in rows]
+            columns[name] = array(column.typecode, values) if isinstance(column, array) else values
+        return self._from_columns(columns)
+
+    def where(self, predicate: Callable[..., bool]) -> List[int]:
+        """Returns the positions of the rows matching the predicate.
+
+        The predicate is called once per row with the values of the columns named
+        by its parameters, e.g. ``lambda quantity, min_price: quantity > 0 and min_price < 5``.
+        Only these columns are read, so no :class:`Item` is created.
+
+        Parameters
+        ----------
+        predicate: Callable[..., :class:`bool`]
+            The predicate to evaluate.
+
+        Returns
+        -------
+        List[:class:`int`]
+
+        Raises
+        ------
+        :exc:`KeyError`
+            A parameter of the predicate does not name a column.
+        """
+        columns = [self._columns[name] for name in inspect.signature(predicate).parameters]
+        return [row for row, values in enumerate(zip(*columns)) if predicate(*values)]
+
+    def filter(self, predicate: Callable[..., bool]) -> "ItemTable":
+        """Returns a new table with the rows matching the predicate.
+
+        See :meth:`where` for how the predicate is called.
+
+        Parameters
+        ----------
+        predicate: Callable[..., :class:`bool`]
+            The predicate to evaluate.
+
+        Returns
+        -------
+        :class:`ItemTable`
+        """
+        return self.take(self.where(predicate))
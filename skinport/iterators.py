@@ -34,16 +34,20 @@ class TransactionAsyncIterator:
         getter: Callable[..., Coroutine[Any, Any, Any]],
         limit: Optional[int] = None,
         pagination_token: int = 1,
+        prefetch: int = 0,
         **kwargs: Dict[str, Any],
     ) -> None:
         self.limit = limit
         self.has_more = True
         self.getter = getter
         self.kwargs = kwargs
+        self.prefetch = prefetch
 
         self.transactions: asyncio.Queue[Transaction] = asyncio.Queue()
         self.previous_token = pagination_token
         self.next_token = pagination_token
+        self.pages: Optional[int] = None
+        self._prefetched: Dict[int, asyncio.Task[Dict[str, Any]]] = {}
 
     async def __anext__(self):
         try:
@@ -54,6 +58,12 @@ class TransactionAsyncIterator:
     def __aiter__(self):
         return self
 
+    async def __aenter__(self) -> "TransactionAsyncIterator":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
     async def flatten(self):
         return [element async for element in self]
 
@@ -66,11 +76,50 @@ class TransactionAsyncIterator:
         except asyncio.QueueEmpty as e:
             raise StopAsyncIteration from e
 
+    def close(self) -> None:
+        """Cancels the requests of all prefetched pages that have not been consumed yet."""
+        for task in self._prefetched.values():
+            if task.done():
+                # Retrieve the exception of a failed request, so it isn't logged as never retrieved
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
+        self._prefetched.clear()
+
+    async def aclose(self) -> None:
+        """*coroutine*
+        Cancels the requests of all prefetched pages that have not been consumed yet
+        and waits until they are finished.
+        """
+        tasks = list(self._prefetched.values())
+        self.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _get_page(self, page: int) -> Coroutine[Any, Any, Dict[str, Any]]:
+        return self.getter(params={**self.kwargs, "page": page})
+
+    def _prefetch_pages(self) -> None:
+        # Keep up to `prefetch` requests for the pages following the current one in flight,
+        # the rate limiter of the getter delays them if necessary.
+        last_page = min(self.next_token + self.prefetch - 1, self.pages)
+        for page in range(self.next_token, last_page + 1):
+            if page not in self._prefetched:
+                self._prefetched[page] = asyncio.ensure_future(self._get_page(page))
+
     async def fill_transactions(self):
         if not self.has_more:
             raise StopAsyncIteration
 
-        data: Dict[str, Any] = await self.getter(params=self.kwargs)
+        task = self._prefetched.pop(self.next_token, None)
+        try:
+            if task is not None:
+                data: Dict[str, Any] = await task
+            else:
+                data: Dict[str, Any] = await self.getter(params=self.kwargs)
+        except BaseException:
+            self.close()
+            raise
         transactions: List[Dict[str, Any]] = data.get("data", [])
 
         for t in reversed(transactions):
@@ -78,6 +127,10 @@ class TransactionAsyncIterator:
         self.previous_token = data["pagination"].get("page")
         self.next_token = data["pagination"].get("page") + 1
         self.kwargs["page"] = self.next_token
+        self.pages = data["pagination"].get("pages")
 
-        if self.next_token > data["pagination"].get("pages"):
+        if self.next_token > self.pages:
             self.has_more = False
+            self.close()
+        elif self.prefetch > 0:
+            self._prefetch_pages()
@@ -0,0 +1,258 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import bisect
+import sys
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .enums import AppID, Currency, EventType
+from .salefeed import SaleFeed, SaleFeedSale
+
+__all__ = ("Listing", "OrderBook")
+
+
+class Listing(NamedTuple):
+    """An active listing of an :class:`OrderBook`."""
+
+    sale_id: int
+    market_hash_name: str
+    sale_price: float
+    currency: Currency
+    app_id: AppID
+    wear: Optional[float]
+
+    @classmethod
+    def from_sale(cls, sale: SaleFeedSale) -> "Listing":
+        """Creates a listing from a sale of the sale feed.
+
+        Parameters
+        ----------
+        sale: :class:`SaleFeedSale`
+            The listed sale.
+        """
+        return cls(sale.sale_id, sys.intern(sale.market_hash_name), sale.sale_price, sale.currency, sale.app_id, sale.wear)
+
+
+class OrderBook:
+    """An index of the listings that are currently on sale, maintained from the saleFeed events.
+
+    Listings are indexed by their sale ID, by their market hash name and currency
+    sorted by price, by their app ID and by their currency. Looking up the cheapest
+    listing of an item is ``O(1)``, adding or removing a listing ``O(log n)`` plus
+    the shift of the price sorted list of the item.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       order_book = OrderBook()
+
+       @client.listen("saleFeed")
+       async def on_sale_feed(data):
+           order_book.update(data)
+
+       listing = order_book.cheapest("AK-47 | Redline (Field-Tested)", Currency.eur)
+
+    .. note::
+
+        The order book only knows the listings that were listed while it was updated.
+        Listing and sold events of the same sale have to be applied in order, so the
+        dispatcher of the client should be inline or ordered.
+    """
+
+    __slots__ = (
+        "_listings",
+        "_by_name",
+        "_by_app_id",
+        "_by_currency",
+    )
+
+    def __init__(self) -> None:
+        self._listings: Dict[int, Listing] = {}
+        self._by_name: Dict[Tuple[str, Currency], List[Tuple[float, int]]] = {}
+        self._by_app_id: Dict[AppID, Set[int]] = {}
+        self._by_currency: Dict[Currency, Set[int]] = {}
+
+    def __repr__(self) -> str:
+        return f"<OrderBook listings={len(self._listings)} items={len(self._by_name)}>"
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def __contains__(self, sale_id: object) -> bool:
+        return sale_id in self._listings
+
+    def __iter__(self) -> Iterator[Listing]:
+        return iter(self._listings.values())
+
+    def update(self, sale_feed: Union[SaleFeed, Dict[str, Any]]) -> None:
+        """Applies a saleFeed event. Listed sales are added and sold sales are removed.
+
+        Parameters
+        ----------
+        sale_feed: Union[:class:`SaleFeed`, Dict[:class:`str`, Any]]
+            The saleFeed event or its raw data.
+        """
+        if not isinstance(sale_feed, SaleFeed):
+            sale_feed = SaleFeed(data=sale_feed, lazy=True)
+        if sale_feed.event_type is EventType.listed:
+            for sale in sale_feed.sales:
+                self.add(Listing.from_sale(sale))
+        else:
+            for sale in sale_feed.sales:
+                self.remove(sale.sale_id)
+
+    def add(self, listing: Listing) -> None:
+        """Adds a listing, replacing a listing with the same sale ID.
+
+        Parameters
+        ----------
+        listing: :class:`Listing`
+            The listing to add.
+        """
+        if listing.sale_id in self._listings:
+            self.remove(listing.sale_id)
+        self._listings[listing.sale_id] = listing
+        bisect.insort(self._by_name.setdefault((listing.market_hash_name, listing.currency), []), (listing.sale_price, listing.sale_id))
+        self._by_app_id.setdefault(listing.app_id, set()).add(listing.sale_id)
+        self._by_currency.setdefault(listing.currency, set()).add(listing.sale_id)
+
+    def remove(self, sale_id: int) -> Optional[Listing]:
+        """Removes a listing.
+
+        Parameters
+        ----------
+        sale_id: :class:`int`
+            The sale ID of the listing.
+
+        Returns
+        -------
+        Optional[:class:`Listing`]
+            The removed listing or ``None`` if it was not in the order book.
+        """
+        listing = self._listings.pop(sale_id, None)
+        if listing is None:
+            return None
+
+        key = (listing.market_hash_name, listing.currency)
+        prices = self._by_name[key]
+        del prices[bisect.bisect_left(prices, (listing.sale_price, sale_id))]
+        if not prices:
+            del self._by_name[key]
+        for index, key in ((self._by_app_id, listing.app_id), (self._by_currency, listing.currency)):
+            sale_ids = index[key]
+            sale_ids.discard(sale_id)
+            if not sale_ids:
+                del index[key]
+        return listing
+
+    def clear(self) -> None:
+        """Removes all listings."""
+        self._listings.clear()
+        self._by_name.clear()
+        self._by_app_id.clear()
+        self._by_currency.clear()
+
+    def get(self, sale_id: int) -> Optional[Listing]:
+        """Returns the listing with the given sale ID.
+
+        Parameters
+        ----------
+        sale_id: :class:`int`
+            The sale ID of the listing.
+
+        Returns
+        -------
+        Optional[:class:`Listing`]
+        """
+        return self._listings.get(sale_id)
+
+    def cheapest(self, market_hash_name: str, currency: Currency = Currency.eur) -> Optional[Listing]:
+        """Returns the cheapest listing of an item.
+
+        Parameters
+        ----------
+        market_hash_name: :class:`str`
+            The market hash name of the item.
+        currency: :class:`Currency`
+            The currency of the listing.
+            Defaults to ``EUR``.
+
+        Returns
+        -------
+        Optional[:class:`Listing`]
+            The cheapest listing or ``None`` if the item is not on sale.
+        """
+        prices = self._by_name.get((market_hash_name, currency))
+        return self._listings[prices[0][1]] if prices else None
+
+    def listings(self, market_hash_name: str, currency: Currency = Currency.eur, *, max_price: Optional[float] = None) -> List[Listing]:
+        """Returns the listings of an item sorted by price.
+
+        Parameters
+        ----------
+        market_hash_name: :class:`str`
+            The market hash name of the item.
+        currency: :class:`Currency`
+            The currency of the listings.
+            Defaults to ``EUR``.
+        max_price: Optional[:class:`float`]
+            Only returns listings up to this price.
+
+        Returns
+        -------
+        List[:class:`Listing`]
+        """
+        prices = self._by_name.get((market_hash_name, currency), [])
+        if max_price is not None:
+            prices = prices[: bisect.bisect_right(prices, (max_price, float("inf")))]
+        return [self._listings[sale_id] for _, sale_id in prices]
+
+    def by_app_id(self, app_id: AppID) -> List[Listing]:
+        """Returns the listings of an app.
+
+        Parameters
+        ----------
+        app_id: :class:`AppID`
+            The app ID of the listings.
+
+        Returns
+        -------
+        List[:class:`Listing`]
+        """
+        return [self._listings[sale_id] for sale_id in self._by_app_id.get(app_id, ())]
+
+    def by_currency(self, currency: Currency) -> List[Listing]:
+        """Returns the listings in a currency.
+
+        Parameters
+        ----------
+        currency: :class:`Currency`
+            The currency of the listings.
+
+        Returns
+        -------
+        List[:class:`Listing`]
+        """
+        return [self._listings[sale_id] for sale_id in self._by_currency.get(currency, ())]
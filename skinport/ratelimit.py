@@ -0,0 +1,243 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import bisect
+import collections
+import itertools
+import logging
+import time
+from typing import Deque, Dict, List, Mapping, Optional
+
+__all__ = (
+    "RateLimit",
+    "RateLimiter",
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class RateLimit:
+    """Represents the request budget of a rate limit bucket.
+
+    Attributes
+    ------------
+    rate: :class:`int`
+        The number of requests allowed per period.
+    per: :class:`float`
+        The length of the period in seconds.
+    """
+
+    __slots__ = (
+        "per",
+        "rate",
+    )
+
+    def __init__(self, rate: int, per: float) -> None:
+        if rate < 1:
+            raise ValueError("rate must be at least 1")
+        if per <= 0:
+            raise ValueError("per must be greater than 0")
+        self.rate: int = rate
+        self.per: float = per
+
+    def __repr__(self) -> str:
+        return f"RateLimit(rate={self.rate!r}, per={self.per!r})"
+
+    def __eq__(self, __o: object) -> bool:
+        if isinstance(__o, RateLimit):
+            return self.rate == __o.rate and self.per == __o.per
+        return False
+
+
+class _SlidingWindow:
+    __slots__ = (
+        "_finished",
+        "_lock",
+        "_paused_until",
+        "_sent",
+        "limit",
+    )
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit: RateLimit = limit
+        # Skinport counts a request when it arrives, which can be later than when it was sent,
+        # so a finished request is counted from when its response was received instead.
+        self._sent: Deque[float] = collections.deque()
+        self._finished: List[float] = []
+        self._paused_until: float = 0.0
+        # asyncio.Lock wakes up its waiters in FIFO order, so requests that
+        # have to wait for the window are sent in the order they were issued.
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _expire(self, now: float) -> None:
+        start = now - self.limit.per
+        while self._sent and self._sent[0] <= start:
+            self._sent.popleft()
+        del self._finished[: bisect.bisect_right(self._finished, start)]
+
+    def delay(self) -> float:
+        now = time.monotonic()
+        self._expire(now)
+        if self._paused_until > now:
+            return self._paused_until - now
+        excess = len(self._sent) + len(self._finished) - self.limit.rate
+        if excess < 0:
+            return 0.0
+        # Wait until enough requests have left the window to send one more
+        return sorted(itertools.chain(self._sent, self._finished))[excess] + self.limit.per - now
+
+    def pause(self, seconds: float) -> None:
+        # The server tells when its budget is available again, so the local window is not reset
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> float:
+        waited = 0.0
+        async with self._lock:
+            while (delay := self.delay()) > 0:
+                waited += delay
+                await asyncio.sleep(delay)
+            self._sent.append(time.monotonic())
+        return waited
+
+    def release(self) -> None:
+        # Replacing the oldest pending request keeps the window at least as full as the server's
+        if self._sent:
+            self._sent.popleft()
+        bisect.insort(self._finished, time.monotonic())
+
+
+class RateLimiter:
+    """Schedules requests according to the rate limits of the Skinport API.
+
+    Every route is assigned to a bucket. Requests to different buckets never
+    wait for each other, requests to the same bucket are only delayed when
+    ``rate`` requests have been sent to the bucket within the last ``per`` seconds.
+
+    Parameters
+    ----------
+    limits: Optional[Mapping[:class:`str`, :class:`RateLimit`]]
+        Overrides for the default budgets, keyed by bucket name.
+        Known buckets are ``items``, ``sales_history``, ``sales_out_of_stock``
+        and ``account``.
+    """
+
+    DEFAULT_LIMITS: Dict[str, RateLimit] = {
+        "items": RateLimit(8, 300.0),
+        "sales_history": RateLimit(8, 300.0),
+        "sales_out_of_stock": RateLimit(8, 300.0),
+        "account": RateLimit(60, 60.0),
+    }
+
+    def __init__(self, limits: Optional[Mapping[str, RateLimit]] = None) -> None:
+        self.limits: Dict[str, RateLimit] = dict(self.DEFAULT_LIMITS)
+        if limits is not None:
+            self.limits.update(limits)
+        self._buckets: Dict[str, _SlidingWindow] = {}
+
+    def _get_bucket(self, name: Optional[str]) -> Optional[_SlidingWindow]:
+        if name is None or name not in self.limits:
+            return None
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            bucket = self._buckets[name] = _SlidingWindow(self.limits[name])
+        return bucket
+
+    def delay(self, name: Optional[str]) -> float:
+        """Returns the number of seconds a request to the bucket would currently have to wait.
+
+        Parameters
+        ----------
+        name: Optional[:class:`str`]
+            The name of the bucket.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        bucket = self._get_bucket(name)
+        return bucket.delay() if bucket is not None else 0.0
+
+    def pause(self, name: Optional[str], seconds: float) -> bool:
+        """Holds back all requests to the bucket for a number of seconds,
+        e.g. for the ``Retry-After`` of a rate limited response.
+
+        Parameters
+        ----------
+        name: Optional[:class:`str`]
+            The name of the bucket.
+        seconds: :class:`float`
+            The number of seconds to pause.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the bucket is paused. Unknown buckets cannot be paused.
+        """
+        bucket = self._get_bucket(name)
+        if bucket is None:
+            return False
+        bucket.pause(seconds)
+        _log.debug("Bucket %s is paused for %.2f seconds", name, seconds)
+        return True
+
+    async def acquire(self, name: Optional[str]) -> float:
+        """*coroutine*
+        Waits until a request to the bucket may be sent and consumes one request of its budget.
+
+        Requests to unknown buckets are never delayed.
+
+        Parameters
+        ----------
+        name: Optional[:class:`str`]
+            The name of the bucket.
+
+        Returns
+        -------
+        :class:`float`
+            The number of seconds spent waiting.
+        """
+        bucket = self._get_bucket(name)
+        if bucket is None:
+            return 0.0
+        waited = await bucket.acquire()
+        if waited:
+            _log.debug("Bucket %s was exhausted, waited %.2f seconds", name, waited)
+        return waited
+
+    def release(self, name: Optional[str]) -> None:
+        """Marks a request acquired from the bucket as finished.
+
+        The request then counts against the budget from now on instead of from
+        when it was acquired, since the API counts it when it arrives.
+
+        Parameters
+        ----------
+        name: Optional[:class:`str`]
+            The name of the bucket.
+        """
+        bucket = self._get_bucket(name)
+        if bucket is not None:
+            bucket.release()
@@ -0,0 +1,216 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+import os
+import struct
+import time
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional, Tuple, Union
+
+from socketio import packet
+
+from .errors import ClientException
+from .skinport_msgpack_packet import SkinportMsgPackPacket
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = ("PacketRecorder", "PacketReplayer")
+
+
+_log = logging.getLogger(__name__)
+
+_MAGIC = b"SKPREC1\n"
+# The receive time in seconds since the epoch and the length of the packet
+_HEADER = struct.Struct("!dI")
+
+
+class PacketRecorder:
+    """Appends the raw packets received by the websocket to a file.
+
+    Every packet is stored with the time it was received, so it can be replayed
+    with the original timing by a :class:`PacketReplayer`.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       with PacketRecorder("sale_feed.rec") as recorder:
+           client = Client(recorder=recorder)
+           await client.connect()
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file. Packets are appended if it exists.
+    """
+
+    __slots__ = (
+        "path",
+        "packets",
+        "_file",
+    )
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = path
+        self.packets: int = 0
+        self._file: Optional[BinaryIO] = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_MAGIC)
+
+    def __repr__(self) -> str:
+        return f"<PacketRecorder path={self.path!r} packets={self.packets}>"
+
+    def __enter__(self) -> "PacketRecorder":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Whether the recorder is closed."""
+        return self._file is None
+
+    def record(self, encoded_packet: bytes, received_at: Optional[float] = None) -> None:
+        """Appends a packet to the file. Does nothing if the recorder is closed.
+
+        Parameters
+        ----------
+        encoded_packet: :class:`bytes`
+            The raw packet.
+        received_at: Optional[:class:`float`]
+            The time the packet was received in seconds since the epoch.
+            Defaults to now.
+        """
+        if self._file is None:
+            return
+        if isinstance(encoded_packet, str):
+            encoded_packet = encoded_packet.encode()
+        self._file.write(_HEADER.pack(time.time() if received_at is None else received_at, len(encoded_packet)))
+        self._file.write(encoded_packet)
+        self.packets += 1
+
+    def flush(self) -> None:
+        """Writes the buffered packets to the file."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PacketReplayer:
+    """Replays the packets recorded by a :class:`PacketRecorder` to a :class:`Client`.
+
+    The packets are decoded and dispatched like packets from the websocket, so the
+    listeners, streams and subscriptions of the client receive them without a connection.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       replayer = PacketReplayer("sale_feed.rec")
+       await replayer.replay(client, speed=10)
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the recorded file.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"<PacketReplayer path={self.path!r}>"
+
+    def __iter__(self) -> Iterator[Tuple[float, bytes]]:
+        with open(self.path, "rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ClientException(f"{self.path} is not a packet recording")
+            while True:
+                header = file.read(_HEADER.size)
+                if not header:
+                    return
+                if len(header) < _HEADER.size:
+                    _log.warning("Ignoring the truncated last packet of %s", self.path)
+                    return
+                received_at, length = _HEADER.unpack(header)
+                encoded_packet = file.read(length)
+                if len(encoded_packet) < length:
+                    _log.warning("Ignoring the truncated last packet of %s", self.path)
+                    return
+                yield received_at, encoded_packet
+
+    async def replay(self, client: "Client", *, speed: Optional[float] = 1.0) -> int:
+        """*coroutine*
+        Dispatches the recorded events to a client and waits until its listeners handled them.
+
+        Parameters
+        ----------
+        client: :class:`Client`
+            The client.
+        speed: Optional[:class:`float`]
+            How much faster than recorded the packets are replayed.
+            Defaults to ``1.0``, the original speed. ``None`` replays them as fast as possible.
+
+        Returns
+        -------
+        :class:`int`
+            The number of replayed events.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+
+        # Decode like the client does, but without recording the packets again
+        packet_class = SkinportMsgPackPacket.configure(
+            raw_timestamps=client.packet_class.raw_timestamps, instrumentation=client.packet_class.instrumentation
+        )
+        loop = asyncio.get_running_loop()
+        events = 0
+        first_received_at: Optional[float] = None
+        started_at = loop.time()
+        for received_at, encoded_packet in self:
+            if speed is not None:
+                if first_received_at is None:
+                    first_received_at = received_at
+                delay = started_at + (received_at - first_received_at) / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            decoded = packet_class(encoded_packet=encoded_packet)
+            if decoded.packet_type not in (packet.EVENT, packet.BINARY_EVENT) or not decoded.data:
+                continue
+            await client._handle_event(*decoded.data)
+            events += 1
+
+        await client.dispatcher.join()
+        return events
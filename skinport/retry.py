@@ -0,0 +1,160 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import datetime
+import email.utils
+import random
+from typing import Collection, FrozenSet, Optional
+
+__all__ = ("RetryPolicy",)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again.
+
+    Rate limited requests are retried after the ``Retry-After`` of the response.
+    Server errors, rate limited responses without ``Retry-After`` and connection
+    errors are retried with an exponential backoff with full jitter, so many
+    clients failing at once do not retry in lockstep.
+
+    Parameters
+    ----------
+    max_attempts: :class:`int`
+        The maximum number of times a request is sent, including the first time.
+        Defaults to ``3``.
+    backoff_base: :class:`float`
+        The upper bound of the seconds before the first retry, doubled for every further retry.
+        Defaults to ``0.5``.
+    backoff_max: :class:`float`
+        The maximum seconds before a retry caused by an error.
+        Defaults to ``30``.
+    max_elapsed: Optional[:class:`float`]
+        The maximum seconds from the first attempt until a retry is sent.
+        A request is given up instead of waiting past it. Defaults to ``300``.
+    statuses: Collection[:class:`int`]
+        The status codes that are retried.
+        Defaults to ``429``, ``500``, ``502``, ``503`` and ``504``.
+    connection_errors: :class:`bool`
+        Whether requests that failed to connect or were disconnected are retried.
+        Defaults to ``True``.
+    jitter: :class:`bool`
+        Whether the backoff is randomized. Defaults to ``True``.
+    """
+
+    __slots__ = (
+        "backoff_base",
+        "backoff_max",
+        "connection_errors",
+        "jitter",
+        "max_attempts",
+        "max_elapsed",
+        "statuses",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_elapsed: Optional[float] = 300.0,
+        statuses: Collection[int] = (429, 500, 502, 503, 504),
+        connection_errors: bool = True,
+        jitter: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max must not be negative")
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.max_elapsed: Optional[float] = max_elapsed
+        self.statuses: FrozenSet[int] = frozenset(statuses)
+        self.connection_errors: bool = connection_errors
+        self.jitter: bool = jitter
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(max_attempts={self.max_attempts!r}, backoff_base={self.backoff_base!r}, max_elapsed={self.max_elapsed!r})"
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the seconds to wait before retrying a request that failed ``attempt`` times.
+
+        Parameters
+        ----------
+        attempt: :class:`int`
+            The number of failed attempts.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def allows(self, attempt: int, elapsed: float) -> bool:
+        """Whether a request that failed ``attempt`` times may be retried ``elapsed`` seconds after its first attempt.
+
+        Parameters
+        ----------
+        attempt: :class:`int`
+            The number of failed attempts.
+        elapsed: :class:`float`
+            The seconds from the first attempt until the retry would be sent.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return attempt < self.max_attempts and (self.max_elapsed is None or elapsed <= self.max_elapsed)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parses the value of a ``Retry-After`` header.
+
+        Parameters
+        ----------
+        value: Optional[:class:`str`]
+            The number of seconds or an HTTP date.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The number of seconds to wait, or ``None`` if the value is missing or invalid.
+        """
+        if value is None:
+            return None
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
@@ -23,12 +23,12 @@ SOFTWARE.
 """
 
 import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .color import Color
 from .enums import AppID, Currency, EventType, SaleType
 
-__all__ = ("SaleFeed", "SaleFeedSale", "Sticker", "Tag", "Charm")
+__all__ = ("SaleFeed", "SaleFeedSale", "LazySaleFeedSale", "Sticker", "Tag", "Charm")
 
 
 class Charm:
@@ -479,7 +479,12 @@ class SaleFeedSale:
     @property
     def lock(self) -> Optional[datetime.datetime]:
         """Optional[:class:`datetime.datetime`]`: Returns the time until the item is trade-locked."""
-        return self._lock.to_datetime() if self._lock is not None else None
+        if self._lock is None:
+            return None
+        # Timestamps are plain milliseconds when the client decodes them raw
+        if isinstance(self._lock, int):
+            return datetime.datetime.fromtimestamp(self._lock / 1000, tz=datetime.timezone.utc)
+        return self._lock.to_datetime()
 
     @property
     def version(self) -> str:
@@ -662,15 +667,110 @@ class SaleFeedSale:
         return self._ownItem
 
 
+# Maps the slots of SaleFeedSale to the keys of the raw sale and their defaults.
+# ``list`` stands for a new empty list, so the defaults are never shared between sales.
+_SALE_FIELDS: Dict[str, Tuple[str, Any]] = {
+    "_id": ("id", 0),
+    "_saleId": ("saleId", 0),
+    "_shortId": ("shortId", ""),
+    "_productId": ("productId", 0),
+    "_assetId": ("assetId", 0),
+    "_itemId": ("itemId", 0),
+    "_appid": ("appid", 0),
+    "_steamid": ("steamid", ""),
+    "_url": ("url", ""),
+    "_family": ("family", ""),
+    "_family_localized": ("family_localized", ""),
+    "_name": ("name", ""),
+    "_title": ("title", ""),
+    "_text": ("text", ""),
+    "_marketName": ("marketName", ""),
+    "_marketHashName": ("marketHashName", ""),
+    "_color": ("color", ""),
+    "_bgColor": ("bgColor", None),
+    "_image": ("image", ""),
+    "_classid": ("classid", ""),
+    "_assetid": ("assetid", ""),
+    "_lock": ("lock", None),
+    "_version": ("version", ""),
+    "_versionType": ("versionType", ""),
+    "_stackAble": ("stackAble", False),
+    "_suggestedPrice": ("suggestedPrice", 0),
+    "_referencePrice": ("referencePrice", 0),
+    "_salePrice": ("salePrice", 0),
+    "_currency": ("currency", ""),
+    "_saleStatus": ("saleStatus", ""),
+    "_saleType": ("saleType", ""),
+    "_category": ("category", ""),
+    "_category_localized": ("category_localized", ""),
+    "_subCategory": ("subCategory", None),
+    "_subCategory_localized": ("subCategory_localized", None),
+    "_pattern": ("pattern", None),
+    "_finish": ("finish", None),
+    "_customName": ("customName", None),
+    "_wear": ("wear", None),
+    "_link": ("link", None),
+    "_type": ("type", ""),
+    "_exterior": ("exterior", None),
+    "_quality": ("quality", ""),
+    "_rarity": ("rarity", ""),
+    "_rarity_localized": ("rarity_localized", ""),
+    "_rarityColor": ("rarityColor", ""),
+    "_collection": ("collection", None),
+    "_collection_localized": ("collection_localized", None),
+    "_stickers": ("stickers", list),
+    "_charms": ("charms", list),
+    "_canHaveScreenshots": ("canHaveScreenshots", False),
+    "_screenshots": ("screenshots", list),
+    "_souvenir": ("souvenir", False),
+    "_stattrak": ("stattrak", False),
+    "_tags": ("tags", list),
+    "_fade": ("fade", None),
+    "_blue": ("blue", None),
+    "_ownItem": ("ownItem", False),
+}
+_MISSING = object()
+
+
+class LazySaleFeedSale(SaleFeedSale):
+    """A :class:`SaleFeedSale` that reads its fields from the raw sale on first access.
+
+    Creating it only stores a reference to the raw sale, which makes it cheaper
+    than :class:`SaleFeedSale` for consumers that read only a few fields.
+    It has the same attributes and defaults as :class:`SaleFeedSale`.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, *, data: Dict[str, Any]) -> None:
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for slots that have not been read yet
+        try:
+            key, default = _SALE_FIELDS[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            value = default() if default is list else default
+        setattr(self, name, value)
+        return value
+
+
 class SaleFeed:
     __slots__ = (
         "_event_type",
         "_sales",
+        "_sale_objects",
+        "_lazy",
     )
 
-    def __init__(self, *, data: Dict[str, Any]) -> None:
+    def __init__(self, *, data: Dict[str, Any], lazy: bool = False) -> None:
         self._event_type = data.get("eventType", "")
         self._sales = data.get("sales", [])
+        self._sale_objects: Optional[List[SaleFeedSale]] = None
+        self._lazy = lazy
 
     def __repr__(self) -> str:
         return f"<SaleFeed event_type={self._event_type}>"
@@ -682,5 +782,12 @@ class SaleFeed:
 
     @property
     def sales(self) -> List[SaleFeedSale]:
-        """List[:class:`SaleFeedSale`]: Returns a :class:`list` of :class:`SaleFeedSale`."""
-        return [SaleFeedSale(data=sale) for sale in self._sales]
+        """List[:class:`SaleFeedSale`]: Returns a :class:`list` of :class:`SaleFeedSale`.
+
+        The sales are built on first access and the same list is returned afterwards.
+        They are :class:`LazySaleFeedSale` if the sale feed was created with ``lazy=True``.
+        """
+        if self._sale_objects is None:
+            cls = LazySaleFeedSale if self._lazy else SaleFeedSale
+            self._sale_objects = [cls(data=sale) for sale in self._sales]
+        return self._sale_objects
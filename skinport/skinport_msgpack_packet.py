@@ -23,37 +23,110 @@ SOFTWARE.
 """
 
 import struct
+import time
+from typing import TYPE_CHECKING, Optional, Type
 
 import msgpack
 from msgpack import ExtType, Timestamp
 from socketio.msgpack_packet import MsgPackPacket
 
+from .instrumentation import Instrumentation, notify
+
+if TYPE_CHECKING:
+    from .replay import PacketRecorder
+
 __all__ = ("SkinportMsgPackPacket",)
 
 
 class SkinportMsgPackPacket(MsgPackPacket):
+    """The socket.io packet of the Skinport websocket.
+
+    Skinport encodes timestamps as the msgpack extension type ``0`` holding the
+    milliseconds since the epoch as an unsigned 64 bit integer. They are decoded
+    to :class:`msgpack.Timestamp`, or to :class:`int` milliseconds if
+    :attr:`raw_timestamps` is set.
+    """
+
+    raw_timestamps: bool = False
+    recorder: Optional["PacketRecorder"] = None
+    instrumentation: Optional[Instrumentation] = None
+
+    @classmethod
+    def configure(
+        cls,
+        *,
+        raw_timestamps: bool = False,
+        recorder: Optional["PacketRecorder"] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Type["SkinportMsgPackPacket"]:
+        """Returns a packet class with different decoding options.
+
+        Parameters
+        ----------
+        raw_timestamps: :class:`bool`
+            Whether timestamps are decoded to :class:`int` milliseconds
+            instead of :class:`msgpack.Timestamp`.
+        recorder: Optional[:class:`PacketRecorder`]
+            Records every decoded packet.
+        instrumentation: Optional[:class:`Instrumentation`]
+            Receives the size and decoding time of every packet.
+        """
+        attributes = {"raw_timestamps": raw_timestamps, "recorder": recorder, "instrumentation": instrumentation}
+        return type(cls.__name__, (cls,), attributes)
 
     def encode(self):
         """Encode the packet for transmission."""
-        return msgpack.dumps(self._to_dict(), default=self._default)
+        # msgpack packs Timestamp natively as the extension type -1 without calling default,
+        # so timestamps are converted to the extension type 0 of Skinport before packing
+        return msgpack.dumps(self._convert_timestamps(self._to_dict()), default=self._default)
+
+    @classmethod
+    def _convert_timestamps(cls, obj):
+        if isinstance(obj, Timestamp):
+            return cls._encode_timestamp_to_ext(obj)
+        if isinstance(obj, dict):
+            return {key: cls._convert_timestamps(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [cls._convert_timestamps(value) for value in obj]
+        return obj
 
     def decode(self, encoded_packet):
         """Decode a transmitted package."""
-        decoded = msgpack.loads(encoded_packet, ext_hook=self._ext_hook)
+        cls = type(self)
+        if cls.recorder is not None:
+            cls.recorder.record(encoded_packet)
+        if cls.instrumentation is None:
+            self._decode(encoded_packet)
+            return
+        started_at = time.perf_counter()
+        self._decode(encoded_packet)
+        notify(cls.instrumentation, "on_packet", len(encoded_packet), time.perf_counter() - started_at)
+
+    def _decode(self, encoded_packet):
+        ext_hook = self._raw_ext_hook if self.raw_timestamps else self._ext_hook
+        decoded = msgpack.loads(encoded_packet, ext_hook=ext_hook)
         self.packet_type = decoded['type']
         self.data = decoded.get('data')
         self.id = decoded.get('id')
         self.namespace = decoded['nsp']
 
-    def _ext_hook(self, code, data):
+    @staticmethod
+    def _ext_hook(code, data):
+        if code == 0 and len(data) == 8:
+            return SkinportMsgPackPacket._decode_timestamp_from_ext(code, data)
+        return ExtType(code, data)
+
+    @staticmethod
+    def _raw_ext_hook(code, data):
         if code == 0 and len(data) == 8:
-            return self._decode_timestamp_from_ext(code, data)
+            return int.from_bytes(data, "big")
         return ExtType(code, data)
 
     @staticmethod
     def _decode_timestamp_from_ext(code, data):
-        milliseconds = struct.unpack("!Q", data)[0]
-        return Timestamp.from_unix(milliseconds / 1000)
+        # Split the milliseconds exactly instead of going through a float
+        seconds, milliseconds = divmod(int.from_bytes(data, "big"), 1000)
+        return Timestamp(seconds, milliseconds * 1_000_000)
 
     def _default(self, obj):
         if isinstance(obj, Timestamp):
@@ -62,5 +135,5 @@ class SkinportMsgPackPacket(MsgPackPacket):
 
     @staticmethod
     def _encode_timestamp_to_ext(obj):
-        milliseconds = int(obj.to_unix() * 1000)
+        milliseconds = obj.seconds * 1000 + obj.nanoseconds // 1_000_000
         return ExtType(0, struct.pack("!Q", milliseconds))
@@ -0,0 +1,164 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .enums import OverflowPolicy
+from .salefeed import SaleFeed
+
+__all__ = ("SaleFeedStream",)
+
+_CLOSED = object()
+
+
+class SaleFeedStream:
+    """An asynchronous iterator over the saleFeed events received by a :class:`Client`.
+
+    Events are buffered in a bounded queue, so a slow consumer does not stall the
+    websocket unless the ``block`` overflow policy is used.
+    Streams are usually created with :meth:`Client.sale_feed`.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       async with client.sale_feed(maxsize=500, overflow=OverflowPolicy.drop_oldest) as stream:
+           async for sale_feed in stream:
+               print(sale_feed.event_type, stream.lag)
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        The maximum number of buffered events.
+        Defaults to ``1000``.
+    overflow: :class:`OverflowPolicy`
+        What happens to an event when the buffer is full. ``block`` makes the
+        websocket wait until the consumer caught up, ``drop_oldest`` discards
+        the oldest buffered event and ``drop_newest`` discards the new event.
+        Defaults to ``OverflowPolicy.block``.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.block,
+        on_close: Optional[Callable[["SaleFeedStream"], Any]] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize: int = maxsize
+        self.overflow: OverflowPolicy = OverflowPolicy(overflow)
+        self.queued: int = 0
+        self.dropped: int = 0
+        self.lag: float = 0.0
+        # The queue itself is unbounded so close() can always enqueue the sentinel,
+        # maxsize is enforced by put() instead.
+        self._queue: asyncio.Queue[Tuple[float, Dict[str, Any]]] = asyncio.Queue()
+        self._not_full: asyncio.Event = asyncio.Event()
+        self._not_full.set()
+        self._closed: bool = False
+        self._on_close: Optional[Callable[["SaleFeedStream"], Any]] = on_close
+
+    def __repr__(self) -> str:
+        return f"<SaleFeedStream qsize={self.qsize} queued={self.queued} dropped={self.dropped} overflow={self.overflow}>"
+
+    @property
+    def qsize(self) -> int:
+        """:class:`int`: Returns the number of buffered events."""
+        return self._queue.qsize()
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Indicates if the stream has been closed."""
+        return self._closed
+
+    async def put(self, data: Union[Dict[str, Any], SaleFeed]) -> bool:
+        """*coroutine*
+        Buffers the data of a saleFeed event according to the overflow policy.
+
+        Parameters
+        ----------
+        data: Union[Dict[:class:`str`, Any], :class:`SaleFeed`]
+            The data of the saleFeed event or the already built :class:`SaleFeed`.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the event was buffered.
+        """
+        if self._closed:
+            return False
+
+        if self.overflow is OverflowPolicy.block:
+            while self._queue.qsize() >= self.maxsize:
+                self._not_full.clear()
+                await self._not_full.wait()
+                if self._closed:
+                    return False
+        elif self._queue.qsize() >= self.maxsize:
+            self.dropped += 1
+            if self.overflow is OverflowPolicy.drop_newest:
+                return False
+            self._queue.get_nowait()
+
+        self._queue.put_nowait((time.monotonic(), data))
+
+        self.queued += 1
+        return True
+
+    def close(self) -> None:
+        """Closes the stream. Buffered events are discarded and iterating the stream stops."""
+        if self._closed:
+            return
+        self._closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        # Wake up a waiting consumer and producers waiting for free space
+        self._queue.put_nowait(_CLOSED)
+        self._not_full.set()
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def __aiter__(self) -> "SaleFeedStream":
+        return self
+
+    async def __anext__(self) -> SaleFeed:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        self._not_full.set()
+        received_at, data = item
+        self.lag = time.monotonic() - received_at
+        return data if isinstance(data, SaleFeed) else SaleFeed(data=data)
+
+    async def __aenter__(self) -> "SaleFeedStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
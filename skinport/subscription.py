@@ -0,0 +1,222 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import itertools
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from .salefeed import SaleFeedSale
+
+__all__ = ("SaleFilter", "SubscriptionIndex")
+
+
+class SaleFilter:
+    """A declarative filter for the sales of the sale feed.
+
+    A sale matches if it satisfies every condition that is not ``None``.
+
+    Parameters
+    ----------
+    market_hash_names: Optional[Iterable[:class:`str`]]
+        The market hash names of the items.
+    min_price: Optional[:class:`float`]
+        The minimum sale price, inclusive.
+    max_price: Optional[:class:`float`]
+        The maximum sale price, inclusive.
+    min_wear: Optional[:class:`float`]
+        The minimum wear, inclusive. Sales without wear don't match.
+    max_wear: Optional[:class:`float`]
+        The maximum wear, inclusive. Sales without wear don't match.
+    categories: Optional[Iterable[:class:`str`]]
+        The categories of the items.
+    stattrak: Optional[:class:`bool`]
+        Whether the items have to be StatTrak™ or not.
+    souvenir: Optional[:class:`bool`]
+        Whether the items have to be of Souvenir quality or not.
+    """
+
+    __slots__ = (
+        "market_hash_names",
+        "min_price",
+        "max_price",
+        "min_wear",
+        "max_wear",
+        "categories",
+        "stattrak",
+        "souvenir",
+    )
+
+    def __init__(
+        self,
+        *,
+        market_hash_names: Optional[Iterable[str]] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_wear: Optional[float] = None,
+        max_wear: Optional[float] = None,
+        categories: Optional[Iterable[str]] = None,
+        stattrak: Optional[bool] = None,
+        souvenir: Optional[bool] = None,
+    ) -> None:
+        self.market_hash_names: Optional[FrozenSet[str]] = frozenset(market_hash_names) if market_hash_names is not None else None
+        self.min_price: Optional[float] = min_price
+        self.max_price: Optional[float] = max_price
+        self.min_wear: Optional[float] = min_wear
+        self.max_wear: Optional[float] = max_wear
+        self.categories: Optional[FrozenSet[str]] = frozenset(categories) if categories is not None else None
+        self.stattrak: Optional[bool] = stattrak
+        self.souvenir: Optional[bool] = souvenir
+
+    def __repr__(self) -> str:
+        conditions = " ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ if getattr(self, name) is not None)
+        return f"<SaleFilter {conditions}>"
+
+    def matches(self, sale: SaleFeedSale) -> bool:
+        """Returns whether a sale matches the filter.
+
+        Parameters
+        ----------
+        sale: :class:`SaleFeedSale`
+            The sale.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        if self.market_hash_names is not None and sale.market_hash_name not in self.market_hash_names:
+            return False
+        if self.categories is not None and sale.category not in self.categories:
+            return False
+        if self.min_price is not None or self.max_price is not None:
+            price = sale.sale_price
+            if self.min_price is not None and price < self.min_price:
+                return False
+            if self.max_price is not None and price > self.max_price:
+                return False
+        if self.min_wear is not None or self.max_wear is not None:
+            wear = sale.wear
+            if wear is None:
+                return False
+            if self.min_wear is not None and wear < self.min_wear:
+                return False
+            if self.max_wear is not None and wear > self.max_wear:
+                return False
+        if self.stattrak is not None and sale.stattrak != self.stattrak:
+            return False
+        if self.souvenir is not None and sale.souvenir != self.souvenir:
+            return False
+        return True
+
+
+class _Subscription:
+    __slots__ = ("order", "sale_filter", "handler")
+
+    def __init__(self, order: int, sale_filter: SaleFilter, handler: Callable[..., Any]) -> None:
+        self.order = order
+        self.sale_filter = sale_filter
+        self.handler = handler
+
+
+class SubscriptionIndex:
+    """Finds the handlers whose :class:`SaleFilter` matches a sale.
+
+    Filters with market hash names are indexed by every name and filters with only
+    categories by every category, so a sale is only checked against the filters
+    that can match its name or category and the filters with neither.
+
+    Only names and categories are indexed. Filters that only have price, wear,
+    StatTrak™ or Souvenir conditions are checked against every sale, which costs
+    time proportional to the number of such filters per sale.
+    """
+
+    __slots__ = (
+        "_by_name",
+        "_by_category",
+        "_unindexed",
+        "_counter",
+    )
+
+    def __init__(self) -> None:
+        self._by_name: Dict[str, List[_Subscription]] = {}
+        self._by_category: Dict[str, List[_Subscription]] = {}
+        self._unindexed: List[_Subscription] = []
+        self._counter = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self._by_name or self._by_category or self._unindexed)
+
+    def add(self, sale_filter: SaleFilter, handler: Callable[..., Any]) -> None:
+        """Registers a handler for the sales matching a filter.
+
+        Parameters
+        ----------
+        sale_filter: :class:`SaleFilter`
+            The filter.
+        handler: Callable[..., Any]
+            The handler.
+        """
+        subscription = _Subscription(next(self._counter), sale_filter, handler)
+        if sale_filter.market_hash_names is not None:
+            for name in sale_filter.market_hash_names:
+                self._by_name.setdefault(name, []).append(subscription)
+        elif sale_filter.categories is not None:
+            for category in sale_filter.categories:
+                self._by_category.setdefault(category, []).append(subscription)
+        else:
+            self._unindexed.append(subscription)
+
+    def remove(self, handler: Callable[..., Any]) -> None:
+        """Removes every subscription of a handler.
+
+        Parameters
+        ----------
+        handler: Callable[..., Any]
+            The handler.
+        """
+        for index in (self._by_name, self._by_category):
+            for key in list(index):
+                index[key] = [subscription for subscription in index[key] if subscription.handler != handler]
+                if not index[key]:
+                    del index[key]
+        self._unindexed = [subscription for subscription in self._unindexed if subscription.handler != handler]
+
+    def match(self, sale: SaleFeedSale) -> List[Callable[..., Any]]:
+        """Returns the handlers whose filter matches a sale, in the order they were registered.
+
+        Parameters
+        ----------
+        sale: :class:`SaleFeedSale`
+            The sale.
+
+        Returns
+        -------
+        List[Callable[..., Any]]
+        """
+        candidates = self._by_name.get(sale.market_hash_name, [])
+        if self._by_category:
+            candidates = candidates + self._by_category.get(sale.category, [])
+        if self._unindexed:
+            candidates = candidates + self._unindexed
+        if len(candidates) > 1:
+            candidates = sorted(candidates, key=lambda subscription: subscription.order)
+        return [subscription.handler for subscription in candidates if subscription.sale_filter.matches(sale)]
@@ -0,0 +1,259 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import random
+from typing import Any, Dict, List
+
+import msgpack
+
+__all__ = (
+    "make_items",
+    "make_items_with_sales",
+    "make_items_out_of_stock",
+    "make_transactions",
+    "make_sales",
+    "make_sale_feed",
+    "make_sale_feed_packet",
+    "make_colors",
+)
+
+WEAPONS = ("AK-47", "M4A4", "AWP", "USP-S", "Glock-18", "Desert Eagle", "★ Karambit", "★ M9 Bayonet")
+FINISHES = ("Redline", "Asiimov", "Fade", "Slaughter", "Hyper Beast", "Vulcan", "Doppler", "Case Hardened")
+EXTERIORS = ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")
+CURRENCIES = ("EUR", "USD", "GBP")
+
+
+def _market_hash_name(rng: random.Random) -> str:
+    return f"{rng.choice(WEAPONS)} | {rng.choice(FINISHES)} ({rng.choice(EXTERIORS)})"
+
+
+def _slug(market_hash_name: str) -> str:
+    return "".join(c if c.isalnum() else "-" for c in market_hash_name.lower()).strip("-")
+
+
+def make_items(n: int, *, seed: int = 0) -> List[Dict[str, Any]]:
+    """Returns ``n`` items like the ``/v1/items`` endpoint."""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(n):
+        name = _market_hash_name(rng)
+        price = round(rng.uniform(0.03, 2500), 2)
+        items.append(
+            {
+                "market_hash_name": name,
+                "currency": rng.choice(CURRENCIES),
+                "suggested_price": price,
+                "item_page": f"https://skinport.com/item/{_slug(name)}",
+                "market_page": f"https://skinport.com/market/730?item={_slug(name)}",
+                "min_price": round(price * 0.8, 2),
+                "max_price": round(price * 1.5, 2),
+                "mean_price": round(price * 1.1, 2),
+                "median_price": price,
+                "quantity": rng.randint(0, 500),
+                "created_at": 1535988253 + rng.randint(0, 10**8),
+                "updated_at": 1700000000 + rng.randint(0, 10**7),
+            }
+        )
+    return items
+
+
+def _sales_window(rng: random.Random) -> Dict[str, Any]:
+    price = round(rng.uniform(0.03, 2500), 2)
+    return {"min": round(price * 0.9, 2), "max": round(price * 1.2, 2), "avg": price, "median": price, "volume": rng.randint(0, 1000)}
+
+
+def make_items_with_sales(n: int, *, seed: int = 0) -> List[Dict[str, Any]]:
+    """Returns ``n`` items like the ``/v1/sales/history`` endpoint."""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(n):
+        name = _market_hash_name(rng)
+        items.append(
+            {
+                "market_hash_name": name,
+                "version": None,
+                "currency": rng.choice(CURRENCIES),
+                "item_page": f"https://skinport.com/item/{_slug(name)}",
+                "market_page": f"https://skinport.com/market/730?item={_slug(name)}",
+                "last_24_hours": _sales_window(rng),
+                "last_7_days": _sales_window(rng),
+                "last_30_days": _sales_window(rng),
+                "last_90_days": _sales_window(rng),
+            }
+        )
+    return items
+
+
+def make_items_out_of_stock(n: int, *, seed: int = 0) -> List[Dict[str, Any]]:
+    """Returns ``n`` items like the ``/v1/sales/out-of-stock`` endpoint."""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(n):
+        price = round(rng.uniform(0.03, 2500), 2)
+        items.append(
+            {
+                "market_hash_name": _market_hash_name(rng),
+                "version": None,
+                "currency": rng.choice(CURRENCIES),
+                "suggested_price": price,
+                "avg_sale_price": round(price * 0.95, 2),
+                "sales_last_90d": rng.randint(1, 200),
+            }
+        )
+    return items
+
+
+def make_transactions(n: int, *, items_per_transaction: int = 2, seed: int = 0) -> List[Dict[str, Any]]:
+    """Returns ``n`` transactions like the ``/v1/account/transactions`` endpoint."""
+    rng = random.Random(seed)
+    transactions = []
+    for transaction_id in range(n, 0, -1):
+        items = [
+            {
+                "asset_id": rng.randint(10**9, 10**10),
+                "sale_id": rng.randint(10**6, 10**7),
+                "market_hash_name": _market_hash_name(rng),
+                "seller_country": "DE",
+                "buyer_country": "FR",
+                "amount": round(rng.uniform(0.03, 2500), 2),
+                "currency": "EUR",
+            }
+            for _ in range(items_per_transaction)
+        ]
+        transactions.append(
+            {
+                "id": transaction_id,
+                "type": "purchase",
+                "sub_type": None,
+                "status": "complete",
+                "amount": round(sum(item["amount"] for item in items), 2),
+                "fee": None,
+                "currency": "EUR",
+                "items": items,
+                "created_at": "2024-01-01T00:00:00.000Z",
+                "updated_at": "2024-01-01T00:05:00.000Z",
+            }
+        )
+    return transactions
+
+
+def make_sales(n: int, *, seed: int = 0, timestamps: bool = False) -> List[Dict[str, Any]]:
+    """Returns ``n`` sales like the ``saleFeed`` event of the websocket.
+
+    With ``timestamps``, the lock is a :class:`msgpack.Timestamp` like the decoded websocket packets.
+    """
+    rng = random.Random(seed)
+    sales = []
+    for index in range(n):
+        name = _market_hash_name(rng)
+        weapon, rest = name.split(" | ")
+        price = rng.randint(3, 250000)
+        lock = 1739088000 + rng.randint(0, 7 * 24 * 3600)
+        sales.append(
+            {
+                "id": index,
+                "saleId": 6934215 + index,
+                "shortId": f"{index:08x}",
+                "productId": rng.randint(10**6, 10**7),
+                "assetId": rng.randint(10**7, 10**8),
+                "itemId": rng.randint(10**4, 10**5),
+                "appid": 730,
+                "steamid": "76561198837215063",
+                "url": _slug(name),
+                "family": rest.split(" (")[0],
+                "family_localized": rest.split(" (")[0],
+                "name": rest.split(" (")[0],
+                "title": weapon,
+                "text": f"Covert {weapon}",
+                "marketName": name,
+                "marketHashName": name,
+                "color": "#EB4B4B",
+                "bgColor": None,
+                "image": "-9a81dlWLwJ2UUGcVs_nsVtzdOEdtWwKGZZLQHTxDZ7I56KU0Zwwo4NUX4oFJZEHLbXH5ApeO4YmlhxYQknCRvCo04DEVlxkKgpot621FAR17PLfYQJD_9W7m5a0mvLwOq7c2G9SupUijOjAotyg3w2x_0ZkZ2rzd4OXdgRoYQuE8gDtyL_mg5K4tJ7XiSw0WqKv8kM",
+                "classid": str(rng.randint(10**9, 10**10)),
+                "assetid": str(rng.randint(10**10, 10**11)),
+                "lock": msgpack.Timestamp(lock, 0) if timestamps else None,
+                "version": "default",
+                "versionType": "default",
+                "stackAble": False,
+                "suggestedPrice": int(price * 1.1),
+                "referencePrice": price,
+                "salePrice": price,
+                "currency": rng.choice(CURRENCIES),
+                "saleStatus": "listed",
+                "saleType": "public",
+                "category": "Rifle",
+                "category_localized": "Rifle",
+                "subCategory": weapon,
+                "subCategory_localized": weapon,
+                "pattern": rng.randint(0, 1000),
+                "finish": rng.randint(0, 1000),
+                "customName": None,
+                "wear": rng.random(),
+                "link": "steam://rungame/730/76561202255233023/+csgo_econ_action_preview",
+                "type": "Rifle",
+                "exterior": name.rsplit("(", 1)[1].rstrip(")"),
+                "quality": "★" if weapon.startswith("★") else "Normal",
+                "rarity": "Covert",
+                "rarity_localized": "Covert",
+                "rarityColor": "#eb4b4b",
+                "collection": None,
+                "collection_localized": None,
+                "stickers": [{"img": "sticker.png", "name": "Sticker | Skinport", "slot": slot, "wear": None} for slot in range(rng.randint(0, 4))],
+                "charms": [],
+                "canHaveScreenshots": True,
+                "screenshots": [],
+                "souvenir": False,
+                "stattrak": rng.random() < 0.1,
+                "tags": [{"name": "Covert", "name_localized": "Covert"}, {"name": "Rifle", "name_localized": "Rifle"}],
+                "fade": None,
+                "blue": None,
+                "ownItem": False,
+            }
+        )
+    return sales
+
+
+def make_sale_feed(n: int, *, event_type: str = "listed", seed: int = 0, timestamps: bool = False) -> Dict[str, Any]:
+    """Returns the data of a ``saleFeed`` event with ``n`` sales."""
+    return {"eventType": event_type, "sales": make_sales(n, seed=seed, timestamps=timestamps)}
+
+
+def make_sale_feed_packet(n: int, *, event_type: str = "listed", seed: int = 0) -> bytes:
+    """Returns an encoded socket.io packet of a ``saleFeed`` event with ``n`` sales, like Skinport sends it.
+
+    The locks are encoded like Skinport does, as the extension type ``0`` holding the milliseconds since the epoch.
+    """
+    data = make_sale_feed(n, event_type=event_type, seed=seed, timestamps=True)
+    for sale in data["sales"]:
+        # msgpack packs Timestamp natively as the extension type -1, so it is converted by hand
+        lock = sale["lock"]
+        sale["lock"] = msgpack.ExtType(0, (lock.seconds * 1000 + lock.nanoseconds // 1_000_000).to_bytes(8, "big"))
+    return msgpack.dumps({"type": 2, "data": ["saleFeed", data], "nsp": "/"})
+
+
+def make_colors(n: int, *, seed: int = 0) -> List[str]:
+    """Returns ``n`` hex color strings, half of them prefixed with ``#``."""
+    rng = random.Random(seed)
+    return [("#" if index % 2 else "") + f"{rng.randrange(0x1000000):06x}" for index in range(n)]
@@ -0,0 +1,230 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import collections
+import logging
+import random
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import socketio
+from aiohttp import web
+
+from ..skinport_msgpack_packet import SkinportMsgPackPacket
+from . import payloads
+
+__all__ = ("FakeSaleFeedServer",)
+
+
+_log = logging.getLogger(__name__)
+
+
+class FakeSaleFeedServer:
+    """A local stand-in for the socket.io websocket of Skinport.
+
+    It speaks the msgpack format of Skinport, puts every client into a room per
+    ``saleFeedJoin`` event and emits synthetic ``saleFeed`` events with ``listed``
+    and ``sold`` sales to every joined room, so the websocket path of the
+    :class:`Client` can be tested and stress-tested without a network.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       async with FakeSaleFeedServer(rate=5000, burst=50) as server:
+           task = asyncio.create_task(client.connect(url=server.url))
+           await server.wait_for_join()
+
+    Parameters
+    ----------
+    rate: :class:`float`
+        The number of events emitted per second to every room.
+        Defaults to ``10``. ``0`` emits only the events passed to :meth:`emit`.
+    burst: :class:`int`
+        The number of events emitted back to back, the bursts are spread out to keep ``rate``.
+        Defaults to ``1``.
+    sales_per_event: :class:`int`
+        The number of sales of every event.
+        Defaults to ``1``.
+    sold_ratio: :class:`float`
+        The probability that an event sells previously listed sales instead of listing new ones.
+        Defaults to ``0.5``.
+    max_events: Optional[:class:`int`]
+        The number of events after which the server stops emitting.
+        Defaults to ``None``, which emits until the server is closed.
+    seed: :class:`int`
+        The seed of the sales. Defaults to ``0``.
+    host: :class:`str`
+        The host to listen on. Defaults to ``127.0.0.1``.
+    port: :class:`int`
+        The port to listen on. Defaults to ``0``, a free port.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 10.0,
+        burst: int = 1,
+        sales_per_event: int = 1,
+        sold_ratio: float = 0.5,
+        max_events: Optional[int] = None,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if rate < 0:
+            raise ValueError("rate must not be negative")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate: float = rate
+        self.burst: int = burst
+        self.sales_per_event: int = sales_per_event
+        self.sold_ratio: float = sold_ratio
+        self.max_events: Optional[int] = max_events
+        self.host: str = host
+        self.port: int = port
+        # The joined rooms mapped to their app ID, currency and locale
+        self.rooms: Dict[str, Tuple[int, str, str]] = {}
+        self.emitted: int = 0
+
+        self._random = random.Random(seed)
+        self._sales = payloads.make_sales(max(100, sales_per_event), seed=seed, timestamps=True)
+        self._next_sale_id = 1
+        self._listed: Dict[str, Deque[Dict[str, Any]]] = collections.defaultdict(lambda: collections.deque(maxlen=10000))
+        self._joined = asyncio.Event()
+        self._runner: Optional[web.AppRunner] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+        self.sio: socketio.AsyncServer = socketio.AsyncServer(async_mode="aiohttp", serializer=SkinportMsgPackPacket)
+        self.sio.on("saleFeedJoin", self._on_sale_feed_join)
+        self.app: web.Application = web.Application()
+        self.sio.attach(self.app)
+
+    def __repr__(self) -> str:
+        return f"<FakeSaleFeedServer url={self.url!r} rooms={len(self.rooms)} emitted={self.emitted}>"
+
+    async def __aenter__(self) -> "FakeSaleFeedServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def url(self) -> str:
+        """:class:`str`: The URL of the server, to be passed as ``url`` to :meth:`Client.connect`."""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """*coroutine*
+        Starts listening and emitting.
+
+        Returns
+        -------
+        :class:`str`
+            The URL of the server.
+        """
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        if self.rate > 0:
+            self._task = asyncio.create_task(self._emit_loop())
+        return self.url
+
+    async def close(self) -> None:
+        """*coroutine*
+        Stops emitting and disconnects the clients."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._runner is not None:
+            await self.sio.shutdown()
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def wait_for_join(self, rooms: int = 1) -> None:
+        """*coroutine*
+        Waits until clients joined at least ``rooms`` rooms."""
+        while len(self.rooms) < rooms:
+            self._joined.clear()
+            await self._joined.wait()
+
+    async def emit(self, data: Optional[Dict[str, Any]] = None, *, room: Optional[str] = None) -> None:
+        """*coroutine*
+        Emits a single ``saleFeed`` event.
+
+        Parameters
+        ----------
+        data: Optional[:class:`dict`]
+            The data of the event. Defaults to a synthetic event for every room.
+        room: Optional[:class:`str`]
+            The room to emit to, like ``"730:EUR:en"``. Defaults to every joined room.
+        """
+        for key in (room,) if room is not None else tuple(self.rooms):
+            app_id, currency, _ = self.rooms[key]
+            await self.sio.emit("saleFeed", data if data is not None else self._make_event(key, app_id, currency), room=key)
+            self.emitted += 1
+
+    async def _on_sale_feed_join(self, sid: str, data: Dict[str, Any]) -> None:
+        key = f"{data['appid']}:{data['currency']}:{data['locale']}"
+        _log.debug("Client %s joined the sale feed %s", sid, key)
+        await self.sio.enter_room(sid, key)
+        self.rooms[key] = (data["appid"], data["currency"], data["locale"])
+        self._joined.set()
+
+    def _make_event(self, room: str, app_id: int, currency: str) -> Dict[str, Any]:
+        listed = self._listed[room]
+        if len(listed) >= self.sales_per_event and self._random.random() < self.sold_ratio:
+            return {"eventType": "sold", "sales": [listed.popleft() for _ in range(self.sales_per_event)]}
+
+        sales: List[Dict[str, Any]] = []
+        for _ in range(self.sales_per_event):
+            sale = {**self._random.choice(self._sales), "saleId": self._next_sale_id, "appid": app_id, "currency": currency}
+            self._next_sale_id += 1
+            sales.append(sale)
+        listed.extend(sales)
+        return {"eventType": "listed", "sales": sales}
+
+    async def _emit_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.burst / self.rate
+        next_at = loop.time()
+        while self.max_events is None or self.emitted < self.max_events:
+            if not self.rooms:
+                # Nobody listens, start the schedule once somebody joins
+                await self._joined.wait()
+                next_at = loop.time()
+            for _ in range(self.burst):
+                await self.emit()
+                if self.max_events is not None and self.emitted >= self.max_events:
+                    return
+            # Keep the schedule, so a slow emit is caught up by the next bursts
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
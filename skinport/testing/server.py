@@ -0,0 +1,260 @@
+"""
+MIT License
+
+Copyright (c) 2022-present PaxxPatriot
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import collections
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+from aiohttp import BasicAuth, web
+
+from ..ratelimit import RateLimit
+from . import payloads
+
+__all__ = ("FakeSkinportServer",)
+
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class FakeSkinportServer:
+    """A local stand-in for the Skinport REST API.
+
+    It serves synthetic catalogues from ``/v1/items``, ``/v1/sales/history``,
+    ``/v1/sales/out-of-stock`` and ``/v1/account/transactions`` and can add latency,
+    rate limit responses and server errors, so the :class:`Client` can be tested
+    and benchmarked without a network.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+       async with FakeSkinportServer(items=10000, latency=0.05) as server:
+           client = Client(base_url=server.url)
+           items = await client.get_items()
+
+    Parameters
+    ----------
+    items: :class:`int`
+        The number of items of the catalogue.
+        Defaults to ``1000``.
+    transactions: :class:`int`
+        The number of account transactions.
+        Defaults to ``250``.
+    latency: Union[:class:`float`, Tuple[:class:`float`, :class:`float`]]
+        The seconds every response is delayed, or the range of a uniformly random delay.
+        Defaults to ``0``.
+    rate_limits: Optional[Mapping[:class:`str`, :class:`RateLimit`]]
+        The budgets of the rate limit buckets ``items``, ``sales_history``,
+        ``sales_out_of_stock`` and ``account``. Requests over budget are answered with
+        ``429 Too Many Requests`` and a ``Retry-After`` header. Defaults to no rate limits.
+    error_rate: :class:`float`
+        The probability that a request is answered with a ``500`` or ``503`` error.
+        Defaults to ``0``.
+    credentials: Optional[Tuple[:class:`str`, :class:`str`]]
+        The client ID and secret the account endpoint accepts.
+        Defaults to ``None``, which accepts any credentials.
+    seed: :class:`int`
+        The seed of the catalogues and the random latency and errors.
+        Defaults to ``0``.
+    host: :class:`str`
+        The host to listen on. Defaults to ``127.0.0.1``.
+    port: :class:`int`
+        The port to listen on. Defaults to ``0``, a free port.
+    """
+
+    def __init__(
+        self,
+        *,
+        items: int = 1000,
+        transactions: int = 250,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        error_rate: float = 0.0,
+        credentials: Optional[Tuple[str, str]] = None,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency: Union[float, Tuple[float, float]] = latency
+        self.rate_limits: Dict[str, RateLimit] = dict(rate_limits or {})
+        self.error_rate: float = error_rate
+        self.credentials: Optional[Tuple[str, str]] = credentials
+        self.host: str = host
+        self.port: int = port
+        self.requests: collections.Counter[str] = collections.Counter()
+        self.responses: collections.Counter[int] = collections.Counter()
+
+        self._random = random.Random(seed)
+        self._items = payloads.make_items(items, seed=seed)
+        self._items_with_sales = {item["market_hash_name"]: item for item in payloads.make_items_with_sales(items, seed=seed)}
+        self._items_out_of_stock = payloads.make_items_out_of_stock(max(1, items // 10), seed=seed)
+        self._transactions = payloads.make_transactions(transactions, seed=seed)
+        self._requests_by_bucket: Dict[str, Deque[float]] = collections.defaultdict(collections.deque)
+        self._injected: Deque[Tuple[int, Optional[float]]] = collections.deque()
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app: web.Application = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/v1/items", self._route("items", self._get_items))
+        self.app.router.add_get("/v1/sales/history", self._route("sales_history", self._get_sales_history))
+        self.app.router.add_get("/v1/sales/out-of-stock", self._route("sales_out_of_stock", self._get_sales_out_of_stock))
+        self.app.router.add_get("/v1/account/transactions", self._route("account", self._get_account_transactions))
+
+    def __repr__(self) -> str:
+        return f"<FakeSkinportServer url={self.url!r} requests={sum(self.requests.values())}>"
+
+    async def __aenter__(self) -> "FakeSkinportServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def url(self) -> str:
+        """:class:`str`: The base URL of the API, to be passed as ``base_url`` to the :class:`Client`."""
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def start(self) -> str:
+        """*coroutine*
+        Starts listening.
+
+        Returns
+        -------
+        :class:`str`
+            The base URL of the API.
+        """
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self.url
+
+    async def close(self) -> None:
+        """*coroutine*
+        Stops listening."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def inject(self, status: int, *, count: int = 1, retry_after: Optional[float] = None) -> None:
+        """Answers the next requests with an error, regardless of the configured behaviour.
+
+        Parameters
+        ----------
+        status: :class:`int`
+            The status code of the responses.
+        count: :class:`int`
+            The number of requests to answer with the error.
+            Defaults to ``1``.
+        retry_after: Optional[:class:`float`]
+            The value of the ``Retry-After`` header.
+        """
+        self._injected.extend([(status, retry_after)] * count)
+
+    @staticmethod
+    def _error(status: int, message: str, retry_after: Optional[float] = None) -> web.Response:
+        headers = {"Retry-After": str(math.ceil(retry_after))} if retry_after is not None else None
+        return web.json_response({"errors": [{"id": str(status), "message": message}]}, status=status, headers=headers)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        self.requests[request.path] += 1
+        latency = self.latency
+        if isinstance(latency, tuple):
+            latency = self._random.uniform(*latency)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        if self._injected:
+            status, retry_after = self._injected.popleft()
+            response: web.StreamResponse = self._error(status, "Injected error", retry_after)
+        elif self.error_rate > 0 and self._random.random() < self.error_rate:
+            response = self._error(self._random.choice((500, 503)), "Internal Server Error")
+        else:
+            response = await handler(request)
+        self.responses[response.status] += 1
+        return response
+
+    def _route(self, bucket: str, handler: Handler) -> Handler:
+        async def limited(request: web.Request) -> web.StreamResponse:
+            limit = self.rate_limits.get(bucket)
+            if limit is not None:
+                # Sliding window of the requests of the bucket
+                now = time.monotonic()
+                window = self._requests_by_bucket[bucket]
+                while window and window[0] <= now - limit.per:
+                    window.popleft()
+                if len(window) >= limit.rate:
+                    return self._error(429, "Too Many Requests", window[0] + limit.per - now)
+                window.append(now)
+            return await handler(request)
+
+        return limited
+
+    @staticmethod
+    def _with_currency(items: List[Dict[str, Any]], request: web.Request) -> List[Dict[str, Any]]:
+        currency = request.query.get("currency", "EUR")
+        return [{**item, "currency": currency} for item in items]
+
+    async def _get_items(self, request: web.Request) -> web.Response:
+        return web.json_response(self._with_currency(self._items, request))
+
+    async def _get_sales_history(self, request: web.Request) -> web.Response:
+        names = request.query.get("market_hash_name")
+        if names is None:
+            items = list(self._items_with_sales.values())
+        else:
+            items = [self._items_with_sales[name] for name in names.split(",") if name in self._items_with_sales]
+        return web.json_response(self._with_currency(items, request))
+
+    async def _get_sales_out_of_stock(self, request: web.Request) -> web.Response:
+        return web.json_response(self._with_currency(self._items_out_of_stock, request))
+
+    async def _get_account_transactions(self, request: web.Request) -> web.Response:
+        if request.headers.get("Authorization") is None:
+            return self._error(401, "Authentication required")
+        if self.credentials is not None:
+            try:
+                auth = BasicAuth.decode(request.headers["Authorization"])
+            except ValueError:
+                return self._error(401, "Invalid credentials")
+            if (auth.login, auth.password) != self.credentials:
+                return self._error(401, "Invalid credentials")
+
+        page = max(1, int(request.query.get("page", 1)))
+        limit = min(100, max(1, int(request.query.get("limit", 100))))
+        transactions = self._transactions
+        if request.query.get("order", "desc") == "asc":
+            transactions = transactions[::-1]
+        pages = max(1, math.ceil(len(transactions) / limit))
+        return web.json_response(
+            {
+                "pagination": {"page": page, "pages": pages},
+                "data": transactions[(page - 1) * limit : page * limit],
+            }
+        )
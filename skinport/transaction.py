@@ -29,6 +29,7 @@ from .enums import Currency, TransactionStatus, TransactionType
 
 __all__ = (
     "Transaction",
+    "TransactionCheckpoint",
     "TransactionItem",
 )
 
@@ -179,3 +180,88 @@ class Transaction:
     def updated_at(self) -> datetime.datetime:
         """:class:`datetime.datetime`: Returns the date and time the transaction was updated."""
         return datetime.datetime.strptime(self._updated_at, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class TransactionCheckpoint:
+    """Represents the newest transaction seen by an incremental transaction sync.
+
+    Transaction IDs are assigned in ascending order, so every transaction with an ID
+    up to :attr:`transaction_id` is considered to be already seen.
+
+    Attributes
+    ------------
+    transaction_id: :class:`int`
+        The ID of the newest seen transaction.
+    created_at: Optional[:class:`str`]
+        The raw creation time of the newest seen transaction.
+    """
+
+    __slots__ = (
+        "created_at",
+        "transaction_id",
+    )
+
+    def __init__(self, *, transaction_id: int, created_at: Optional[str] = None) -> None:
+        self.transaction_id: int = transaction_id
+        self.created_at: Optional[str] = created_at
+
+    def __repr__(self) -> str:
+        return f"TransactionCheckpoint(transaction_id={self.transaction_id!r}, created_at={self.created_at!r})"
+
+    def __eq__(self, __o: object) -> bool:
+        if isinstance(__o, TransactionCheckpoint):
+            return self.transaction_id == __o.transaction_id and self.created_at == __o.created_at
+        return False
+
+    @classmethod
+    def from_transaction(cls, transaction: Transaction) -> "TransactionCheckpoint":
+        """Creates a checkpoint pointing at the transaction.
+
+        Parameters
+        ----------
+        transaction: :class:`Transaction`
+            The newest seen transaction.
+
+        Returns
+        -------
+        :class:`TransactionCheckpoint`
+        """
+        return cls(transaction_id=transaction.transaction_id, created_at=transaction._created_at)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TransactionCheckpoint":
+        """Restores a checkpoint persisted with :meth:`to_dict`.
+
+        Parameters
+        ----------
+        data: Dict[:class:`str`, Any]
+            The persisted checkpoint.
+
+        Returns
+        -------
+        :class:`TransactionCheckpoint`
+        """
+        return cls(transaction_id=data["transaction_id"], created_at=data.get("created_at"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON serializable representation of the checkpoint.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+        """
+        return {"transaction_id": self.transaction_id, "created_at": self.created_at}
+
+    def includes(self, transaction: Transaction) -> bool:
+        """Indicates if the transaction has already been seen.
+
+        Parameters
+        ----------
+        transaction: :class:`Transaction`
+            The transaction to check.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return transaction.transaction_id <= self.transaction_id
@@ -0,0 +1,25 @@
+import os
+import sys
+import unittest
+
+# The benchmarks are not installed with the package, they live next to the tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from benchmarks.suite import BENCHMARKS, Result, compare, run
+
+
+class BenchmarksTestCase(unittest.TestCase):
+    def test_every_benchmark_runs(self):
+        results = run(sizes=(2,), repeat=1, min_time=0)
+
+        self.assertEqual([result.name for result in results], list(BENCHMARKS))
+        for result in results:
+            self.assertGreater(result.ops_per_sec, 0)
+            self.assertGreater(result.peak_bytes, 0)
+
+    def test_compare(self):
+        baseline = {"item[10]": {"ops_per_sec": 1000, "peak_bytes": 1000}}
+
+        self.assertEqual(compare([Result("item", 10, 950, 1050)], baseline), [])
+        self.assertEqual(len(compare([Result("item", 10, 800, 1200)], baseline)), 2)
+        self.assertEqual(compare([Result("color", 10, 1, 1)], baseline), [])
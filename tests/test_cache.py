@@ -0,0 +1,419 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import skinport
+from skinport.cache import CachePolicy, DiskCache, ResponseCache, SingleFlight
+from skinport.http import HTTPClient, Route
+from skinport.testing import FakeSkinportServer
+
+
+class SingleFlightTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_are_coalesced(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [calls]
+
+        results = await asyncio.gather(*(single_flight.do("key", fetch) for _ in range(5)))
+
+        self.assertEqual(calls, 1)
+        for result in results:
+            self.assertIs(result, results[0])
+        self.assertEqual(len(single_flight), 0)
+
+    async def test_different_keys_are_not_coalesced(self):
+        single_flight = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(single_flight.do("a", lambda: fetch(1)), single_flight.do("b", lambda: fetch(2)))
+
+        self.assertEqual(results, [1, 2])
+
+    async def test_exception_is_shared(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(single_flight.do("key", fetch) for _ in range(3)), return_exceptions=True)
+
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+        self.assertNotIn("key", single_flight)
+
+    async def test_cancelled_waiter_does_not_cancel_call(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.ensure_future(single_flight.do("key", fetch))
+        second = asyncio.ensure_future(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, "done")
+
+    async def test_client_coalesces_get_items(self):
+        client = skinport.Client()
+        calls = 0
+
+        async def get_items(**parameters):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"market_hash_name": "Glove Case Key", "currency": "EUR"}]
+
+        client.http.get_items = get_items
+        try:
+            results = await asyncio.gather(*(client.get_items(app_id=skinport.AppID.rust) for _ in range(5)))
+        finally:
+            await client.close()
+
+        self.assertEqual(calls, 1)
+        for result in results:
+            self.assertIs(result, results[0])
+
+
+class ResponseCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    def make_fetch(self):
+        self.calls = 0
+
+        async def fetch():
+            self.calls += 1
+            return self.calls
+
+        return fetch
+
+    async def test_fresh_value_is_served_from_cache(self):
+        cache = ResponseCache(CachePolicy(ttl=10))
+        fetch = self.make_fetch()
+
+        self.assertEqual(await cache.get("key", fetch), 1)
+        self.assertEqual(await cache.get("key", fetch), 1)
+        self.assertEqual(self.calls, 1)
+
+    async def test_expired_value_is_fetched_inline(self):
+        cache = ResponseCache(CachePolicy(ttl=0.01))
+        fetch = self.make_fetch()
+        await cache.get("key", fetch)
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(await cache.get("key", fetch), 2)
+
+    async def test_stale_value_is_served_while_revalidating(self):
+        cache = ResponseCache(CachePolicy(ttl=0.01, stale_ttl=10))
+        fetch = self.make_fetch()
+        await cache.get("key", fetch)
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(await cache.get("key", fetch), 1)
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(await cache.get("key", fetch), 2)
+
+    async def test_refresh_error_hook(self):
+        errors = []
+        cache = ResponseCache(CachePolicy(ttl=0.01, stale_ttl=10, on_refresh_error=lambda key, exc: errors.append((key, exc))))
+        await cache.get("key", self.make_fetch())
+        await asyncio.sleep(0.02)
+
+        async def failing_fetch():
+            raise ValueError("boom")
+
+        self.assertEqual(await cache.get("key", failing_fetch), 1)
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], "key")
+        self.assertIsInstance(errors[0][1], ValueError)
+
+    async def test_stats(self):
+        cache = ResponseCache(CachePolicy(maxsize=2, ttl=10))
+        fetch = self.make_fetch()
+        await cache.get("a", fetch)
+        await cache.get("a", fetch)
+        await cache.get("b", fetch)
+        await cache.get("c", fetch)
+
+        stats = cache.stats()
+
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 3)
+        self.assertEqual(stats.evictions, 1)
+        self.assertEqual(stats.currsize, 2)
+        self.assertEqual(stats.maxsize, 2)
+        self.assertGreater(stats.nbytes, 0)
+        self.assertGreaterEqual(stats.oldest_age, stats.newest_age)
+
+    async def test_stats_size_of_item_table(self):
+        cache = ResponseCache(CachePolicy(ttl=10))
+        item = {"market_hash_name": "Glove Case Key", "currency": "EUR", "min_price": 1.0, "quantity": 1}
+        cache.set("small", skinport.ItemTable(data=[item] * 10))
+        small = cache.stats().nbytes
+        cache.set("large", skinport.ItemTable(data=[{**item, "market_hash_name": str(row)} for row in range(10000)]))
+
+        self.assertGreater(cache.stats().nbytes - small, 100 * small)
+
+    async def test_expirations(self):
+        cache = ResponseCache(CachePolicy(ttl=0.01))
+        await cache.get("key", self.make_fetch())
+        await asyncio.sleep(0.02)
+
+        stats = cache.stats()
+
+        self.assertEqual(stats.expirations, 1)
+        self.assertEqual(stats.currsize, 0)
+        self.assertIsNone(stats.oldest_age)
+
+    async def test_invalidate_and_refresh(self):
+        cache = ResponseCache(CachePolicy(ttl=10))
+        fetch = self.make_fetch()
+        await cache.get("key", fetch)
+
+        self.assertTrue(cache.invalidate("key"))
+        self.assertFalse(cache.invalidate("key"))
+        self.assertEqual(await cache.refresh("key", fetch), 2)
+        self.assertEqual(await cache.get("key", fetch), 2)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            CachePolicy(ttl=10, stale_ttl=5)
+
+
+class ClientCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = skinport.Client(cache_policies={"items": CachePolicy(maxsize=4, ttl=60)})
+        self.calls = 0
+
+        async def get_items(**parameters):
+            self.calls += 1
+            return [{"market_hash_name": "Glove Case Key", "currency": parameters["params"]["currency"]}]
+
+        self.client.http.get_items = get_items
+
+    async def test_caches_are_per_client(self):
+        other = skinport.Client()
+
+        self.assertIsNot(self.client.caches["items"], other.caches["items"])
+        self.assertEqual(self.client.caches["items"].policy.maxsize, 4)
+        self.assertEqual(self.client.caches["sales_out_of_stock"].policy.ttl, 3600)
+        await other.close()
+
+    async def test_cache_stats(self):
+        await self.client.get_items()
+        await self.client.get_items()
+
+        stats = self.client.cache_stats()["items"]
+
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(self.calls, 1)
+
+    async def test_invalidate_cache(self):
+        await self.client.get_items(currency=skinport.Currency.usd)
+
+        self.assertFalse(self.client.invalidate_cache("items", currency=skinport.Currency.eur))
+        self.assertTrue(self.client.invalidate_cache("items", currency=skinport.Currency.usd))
+        await self.client.get_items(currency=skinport.Currency.usd)
+        self.assertEqual(self.calls, 2)
+
+    async def test_prefill_cache(self):
+        items = await self.client.prefill_cache("items", currency=skinport.Currency.usd)
+
+        self.assertIs(await self.client.get_items(currency=skinport.Currency.usd), items)
+        self.assertEqual(self.calls, 1)
+
+    async def test_clear_cache(self):
+        await self.client.get_items()
+
+        self.client.clear_cache("items")
+
+        self.assertEqual(len(self.client.caches["items"]), 0)
+        with self.assertRaises(ValueError):
+            self.client.clear_cache("account")
+
+    async def test_close_cancels_background_refreshes(self):
+        self.client.caches["items"] = cache = ResponseCache(CachePolicy(ttl=0.01, stale_ttl=10))
+        await self.client.get_items()
+        await asyncio.sleep(0.02)
+
+        async def get_items(**parameters):
+            await asyncio.sleep(10)
+
+        self.client.http.get_items = get_items
+        await self.client.get_items()
+        refreshes = list(cache._refreshes.values())
+        calls = list(self.client._single_flight._calls.values())
+        await self.client.close()
+        await asyncio.gather(*refreshes, *calls, return_exceptions=True)
+
+        self.assertEqual(len(refreshes), 1)
+        self.assertTrue(refreshes[0].cancelled())
+        self.assertTrue(all(call.cancelled() for call in calls))
+        self.assertEqual(cache._refreshes, {})
+        self.assertEqual(len(self.client._single_flight), 0)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+
+class DiskCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "responses.sqlite3")
+        self.cache = DiskCache(self.path, ttls={"items": 10})
+
+    async def test_set_and_get(self):
+        await self.cache.set("items", "key", '[{"market_hash_name": "Glove Case Key"}]')
+
+        self.assertEqual(await self.cache.get("items", "key"), '[{"market_hash_name": "Glove Case Key"}]')
+        self.assertIsNone(await self.cache.get("items", "other"))
+
+    async def test_survives_reopening(self):
+        await self.cache.set("items", "key", "[]")
+        self.cache.close()
+
+        self.assertEqual(await DiskCache(self.path).get("items", "key"), "[]")
+
+    async def test_expired_response_is_not_served(self):
+        cache = DiskCache(self.path, ttls={"items": 0.01})
+        await cache.set("items", "key", "[]")
+        await asyncio.sleep(0.02)
+
+        self.assertIsNone(await cache.get("items", "key"))
+        self.assertEqual(await cache.purge(), 1)
+        cache.close()
+
+    def test_handles(self):
+        self.assertTrue(self.cache.handles("items"))
+        self.assertTrue(self.cache.handles("sales_out_of_stock"))
+        self.assertFalse(self.cache.handles("account"))
+        self.assertFalse(self.cache.handles(None))
+
+    async def test_http_client_serves_from_disk(self):
+        calls = 0
+
+        async def items(request):
+            nonlocal calls
+            calls += 1
+            return web.json_response([{"market_hash_name": "Glove Case Key", "currency": request.query["currency"]}])
+
+        app = web.Application()
+        app.router.add_get("/v1/items", items)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            with mock.patch.object(Route, "BASE", str(server.make_url("/v1"))):
+                for _ in range(2):
+                    http = HTTPClient(disk_cache=DiskCache(self.path))
+                    data = await http.get_items(params={"currency": "EUR"})
+                    await http.close()
+                    http.disk_cache.close()
+        finally:
+            await server.close()
+
+        self.assertEqual(data, [{"market_hash_name": "Glove Case Key", "currency": "EUR"}])
+        self.assertEqual(calls, 1)
+
+    def test_follow_keeps_overridden_ttls(self):
+        self.cache.follow({"items": 60, "sales_history": 30, "account": 1})
+
+        self.assertEqual(self.cache.ttls["items"], 10)
+        self.assertEqual(self.cache.ttls["sales_history"], 30)
+        self.assertNotIn("account", self.cache.ttls)
+
+    async def test_client_applies_cache_policies(self):
+        cache = DiskCache(self.path)
+        client = skinport.Client(cache_policies={"item_table": CachePolicy(ttl=60)}, disk_cache=cache)
+        await client.close()
+
+        self.assertEqual(cache.ttls, {"items": 60, "sales_history": 300, "sales_out_of_stock": 3600})
+
+    async def test_response_cache_keeps_fetch_time_of_disk_response(self):
+        await self.cache.set("items", "key", "[]")
+        with self.cache._lock:
+            self.cache._connect().execute("UPDATE responses SET fetched_at = fetched_at - 8")
+        cache = ResponseCache(CachePolicy(ttl=10))
+        single_flight = SingleFlight()
+
+        async def fetch():
+            return await self.cache.get("items", "key")
+
+        await asyncio.gather(*(cache.get("key", lambda: single_flight.do("key", fetch)) for _ in range(2)))
+
+        self.assertGreaterEqual(cache.stats().newest_age, 8)
+
+    async def test_disk_response_is_not_served_past_stale_ttl(self):
+        await self.cache.set("items", "key", "1")
+        with self.cache._lock:
+            self.cache._connect().execute("UPDATE responses SET fetched_at = fetched_at - 9")
+        cache = ResponseCache(CachePolicy(ttl=5, stale_ttl=9.5))
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return await self.cache.get("items", "key") if calls == 1 else "2"
+
+        self.assertEqual(await cache.get("key", fetch), "1")
+        await asyncio.sleep(0.6)
+
+        self.assertEqual(await cache.get("key", fetch), "2")
+        self.assertEqual(cache.stats().stale_hits, 0)
+        self.assertEqual(calls, 2)
+
+    async def test_client_close_closes_connection(self):
+        client = skinport.Client(disk_cache=self.cache)
+        await self.cache.set("items", "key", "[]")
+
+        await client.close()
+
+        self.assertIsNone(self.cache._connection)
+
+    async def test_delete(self):
+        await self.cache.set("items", DiskCache.key("GET", "https://api.skinport.com/v1/items", {"currency": "EUR"}), "[]")
+        await self.cache.set("items", DiskCache.key("GET", "https://api.skinport.com/v1/items", {"currency": "USD"}), "[]")
+
+        self.assertEqual(self.cache.delete("items", {"currency": "EUR"}), 1)
+        self.assertIsNotNone(await self.cache.get("items", DiskCache.key("GET", "https://api.skinport.com/v1/items", {"currency": "USD"})))
+        self.assertEqual(self.cache.delete("items"), 1)
+
+    async def test_client_cache_management_bypasses_disk(self):
+        async with FakeSkinportServer(items=1) as server:
+            client = skinport.Client(base_url=server.url, disk_cache=self.cache)
+            await client.get_items()
+
+            self.assertTrue(client.invalidate_cache("items"))
+            await client.get_items()
+            self.assertEqual(server.requests["/v1/items"], 2)
+
+            await client.prefill_cache("items")
+            self.assertEqual(server.requests["/v1/items"], 3)
+
+            client.clear_cache()
+            await client.get_items()
+            self.assertEqual(server.requests["/v1/items"], 4)
+
+            # Only the cleared responses are fetched again
+            await client.get_items()
+            self.assertEqual(server.requests["/v1/items"], 4)
+            await client.close()
+
+    async def asyncTearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
@@ -4,6 +4,7 @@ import os
 import sys
 import unittest
 from typing import Optional
+from urllib.parse import quote
 
 import config
 import skinport
@@ -47,3 +48,104 @@ class SkinportClientTestCase(unittest.IsolatedAsyncioTestCase):
 
     async def asyncTearDown(self):
         await self.client.close()
+
+
+class SalesHistoryBulkTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = skinport.Client()
+        self.requests = []
+
+        async def get_sales_history(**parameters):
+            names = parameters["params"]["market_hash_name"].split(",")
+            self.requests.append(names)
+            await asyncio.sleep(0.01)
+            return [{"market_hash_name": name, "currency": "EUR"} for name in names]
+
+        self.client.http.get_sales_history = get_sales_history
+
+    async def test_names_are_chunked(self):
+        names = [f"Sticker | Name {i}" for i in range(100)]
+
+        result = await self.client.get_sales_history_bulk(names, max_query_length=200)
+
+        self.assertGreater(len(self.requests), 1)
+        self.assertEqual(sorted(name for chunk in self.requests for name in chunk), sorted(names))
+        self.assertEqual(set(result), set(names))
+        self.assertEqual(result["Sticker | Name 42"].market_hash_name, "Sticker | Name 42")
+
+    async def test_duplicates_are_requested_once(self):
+        await self.client.get_sales_history_bulk(["Glove Case Key", "Glove Case Key"])
+
+        self.assertEqual(self.requests, [["Glove Case Key"]])
+
+    def test_chunks_fit_into_query(self):
+        names = ["★ Karambit | Fade (Factory New)"] + [f"AK-47 | Redline ({i})" for i in range(50)]
+
+        for chunk in skinport.client._chunk_market_hash_names(names, 150):
+            self.assertLessEqual(len(quote(",".join(chunk), safe="")), 150)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+
+class SyncAccountTransactionsTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = skinport.Client()
+        self.pages = []
+        # Transaction IDs 10 down to 1, three per page, newest first
+        ids = list(range(10, 0, -1))
+
+        async def get_account_transactions(**parameters):
+            page = parameters["params"]["page"]
+            self.pages.append(page)
+            chunk = ids[(page - 1) * 3 : page * 3]
+            return {
+                "pagination": {"page": page, "pages": 4},
+                "data": [{"id": i, "type": "credit", "status": "complete", "created_at": f"2024-01-{i:02}T00:00:00.000Z"} for i in chunk],
+            }
+
+        self.client.http.get_account_transactions = get_account_transactions
+
+    async def test_initial_sync_walks_all_pages(self):
+        transactions, checkpoint = await self.client.sync_account_transactions()
+
+        self.assertEqual([t.transaction_id for t in transactions], list(range(10, 0, -1)))
+        self.assertEqual(self.pages, [1, 2, 3, 4])
+        self.assertEqual(checkpoint.transaction_id, 10)
+
+    async def test_sync_stops_at_checkpoint(self):
+        transactions, checkpoint = await self.client.sync_account_transactions(skinport.TransactionCheckpoint(transaction_id=6))
+
+        self.assertEqual([t.transaction_id for t in transactions], [10, 9, 8, 7])
+        self.assertEqual(self.pages, [1, 2])
+        self.assertEqual(checkpoint.transaction_id, 10)
+
+    async def test_sync_without_new_transactions(self):
+        given_checkpoint = skinport.TransactionCheckpoint(transaction_id=10)
+
+        transactions, checkpoint = await self.client.sync_account_transactions(given_checkpoint)
+
+        self.assertEqual(transactions, [])
+        self.assertIs(checkpoint, given_checkpoint)
+        self.assertEqual(self.pages, [1])
+
+    async def test_sync_skips_transactions_shifted_to_next_page(self):
+        # A new transaction arrives after the first page, so page 2 repeats the last transaction of page 1
+        pages = {1: [10, 9, 8], 2: [8, 7, 6], 3: [5, 4, 3], 4: [2, 1]}
+
+        async def get_account_transactions(**parameters):
+            page = parameters["params"]["page"]
+            return {
+                "pagination": {"page": page, "pages": 4},
+                "data": [{"id": i, "type": "credit", "status": "complete", "created_at": f"2024-01-{i:02}T00:00:00.000Z"} for i in pages[page]],
+            }
+
+        self.client.http.get_account_transactions = get_account_transactions
+
+        transactions, checkpoint = await self.client.sync_account_transactions()
+
+        self.assertEqual([t.transaction_id for t in transactions], list(range(10, 0, -1)))
+        self.assertEqual(checkpoint.transaction_id, 10)
+
+    async def asyncTearDown(self):
+        await self.client.close()
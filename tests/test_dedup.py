@@ -0,0 +1,69 @@
+import time
+import unittest
+from unittest import mock
+
+import skinport
+from skinport import SaleDeduplicator
+
+
+def make_event(event_type, *sale_ids):
+    return {"eventType": event_type, "sales": [{"saleId": sale_id} for sale_id in sale_ids]}
+
+
+class SaleDeduplicatorTestCase(unittest.TestCase):
+    def test_duplicate_sales_are_removed(self):
+        deduplicator = SaleDeduplicator()
+        first = make_event("listed", 1, 2)
+
+        self.assertIs(deduplicator.filter(first), first)
+        self.assertIsNone(deduplicator.filter(make_event("listed", 1, 2)))
+        self.assertEqual(deduplicator.filter(make_event("listed", 2, 3)), make_event("listed", 3))
+        self.assertEqual(deduplicator.duplicates, 3)
+
+    def test_event_type_is_part_of_the_key(self):
+        deduplicator = SaleDeduplicator()
+        deduplicator.filter(make_event("listed", 1))
+
+        self.assertIsNotNone(deduplicator.filter(make_event("sold", 1)))
+
+    def test_count_window(self):
+        deduplicator = SaleDeduplicator(maxlen=2)
+        for sale_id in range(3):
+            deduplicator.seen(sale_id, "listed")
+
+        self.assertEqual(len(deduplicator), 2)
+        self.assertFalse(deduplicator.seen(0, "listed"))
+        self.assertTrue(deduplicator.seen(2, "listed"))
+
+    def test_time_window(self):
+        deduplicator = SaleDeduplicator(ttl=10)
+        now = time.monotonic()
+        with mock.patch("skinport.dedup.time.monotonic", return_value=now):
+            deduplicator.seen(1, "listed")
+        with mock.patch("skinport.dedup.time.monotonic", return_value=now + 5):
+            self.assertTrue(deduplicator.seen(1, "listed"))
+        with mock.patch("skinport.dedup.time.monotonic", return_value=now + 11):
+            self.assertFalse(deduplicator.seen(1, "listed"))
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            SaleDeduplicator(maxlen=0)
+        with self.assertRaises(ValueError):
+            SaleDeduplicator(ttl=0)
+
+
+class ClientDeduplicationTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_listeners_receive_each_sale_once(self):
+        client = skinport.Client(deduplicator=SaleDeduplicator())
+        received = []
+
+        @client.listen("saleFeed")
+        async def on_sale_feed(data):
+            received.append(data)
+
+        await client._on_sale_feed(make_event("listed", 1))
+        await client._on_sale_feed(make_event("listed", 1))
+        await client._on_sale_feed(make_event("sold", 1))
+        await client.close()
+
+        self.assertEqual(received, [make_event("listed", 1), make_event("sold", 1)])
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import skinport
+from skinport import EventDispatcher
+
+
+def make_event(sale_id):
+    return {"eventType": "listed", "sales": [{"saleId": sale_id}]}
+
+
+class EventDispatcherTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_multiple_listeners_inline(self):
+        dispatcher = EventDispatcher()
+        calls = []
+
+        async def first(data):
+            calls.append(("first", data))
+
+        async def second(data):
+            calls.append(("second", data))
+
+        dispatcher.add_listener("saleFeed", first)
+        dispatcher.add_listener("saleFeed", second)
+        await dispatcher.dispatch("saleFeed", 1)
+
+        self.assertEqual(calls, [("first", 1), ("second", 1)])
+
+    async def test_remove_listener(self):
+        dispatcher = EventDispatcher()
+
+        async def listener(data):
+            pass
+
+        dispatcher.add_listener("saleFeed", listener)
+        dispatcher.remove_listener("saleFeed", listener)
+        dispatcher.remove_listener("saleFeed", listener)
+
+        self.assertNotIn("saleFeed", dispatcher.listeners)
+
+    async def test_sync_listener_requires_executor(self):
+        with self.assertRaises(TypeError):
+            EventDispatcher().add_listener("saleFeed", lambda data: None)
+
+    async def test_sync_listener_runs_in_executor(self):
+        threads = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            dispatcher = EventDispatcher(executor=executor)
+            dispatcher.add_listener("saleFeed", lambda data: threads.append(threading.get_ident()))
+            await dispatcher.dispatch("saleFeed", 1)
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+    async def test_workers_run_listeners_concurrently(self):
+        dispatcher = EventDispatcher(workers=2)
+        release = asyncio.Event()
+        calls = []
+
+        async def slow(data):
+            await release.wait()
+            calls.append("slow")
+
+        async def fast(data):
+            calls.append("fast")
+            release.set()
+
+        dispatcher.add_listener("saleFeed", slow)
+        dispatcher.add_listener("saleFeed", fast)
+        await dispatcher.dispatch("saleFeed", 1)
+        await asyncio.wait_for(dispatcher.join(), 1)
+        await dispatcher.close()
+
+        self.assertEqual(calls, ["fast", "slow"])
+
+    async def test_ordered_by_sale_id(self):
+        dispatcher = EventDispatcher(workers=4, ordered=True)
+        handled = {}
+
+        async def listener(data):
+            sale_id = data["sales"][0]["saleId"]
+            await asyncio.sleep(0.001 * (sale_id % 3))
+            handled.setdefault(sale_id, []).append(data["eventType"])
+
+        dispatcher.add_listener("saleFeed", listener)
+        for sale_id in range(10):
+            await dispatcher.dispatch("saleFeed", make_event(sale_id))
+            await dispatcher.dispatch("saleFeed", {"eventType": "sold", "sales": [{"saleId": sale_id}]})
+        await asyncio.wait_for(dispatcher.join(), 1)
+        await dispatcher.close()
+
+        self.assertEqual(handled, {sale_id: ["listed", "sold"] for sale_id in range(10)})
+
+    async def test_ordered_by_every_sale_of_an_event(self):
+        dispatcher = EventDispatcher(workers=4, ordered=True)
+        handled = []
+
+        async def listener(data):
+            if data["eventType"] == "listed":
+                await asyncio.sleep(0.05)
+            handled.append((data["eventType"], [sale["saleId"] for sale in data["sales"]]))
+
+        dispatcher.add_listener("saleFeed", listener)
+        await dispatcher.dispatch("saleFeed", {"eventType": "listed", "sales": [{"saleId": 1}, {"saleId": 2}]})
+        await dispatcher.dispatch("saleFeed", {"eventType": "sold", "sales": [{"saleId": 2}]})
+        await asyncio.wait_for(dispatcher.join(), 1)
+        await dispatcher.close()
+
+        self.assertEqual(handled, [("listed", [1, 2]), ("sold", [2])])
+
+    async def test_events_spanning_queues_do_not_deadlock(self):
+        dispatcher = EventDispatcher(workers=3, ordered=True)
+        handled = []
+
+        async def listener(data):
+            await asyncio.sleep(0)
+            handled.append(data)
+
+        dispatcher.add_listener("saleFeed", listener)
+        events = [{"eventType": "listed", "sales": [{"saleId": a}, {"saleId": b}]} for a in range(6) for b in range(6)]
+        for event in events:
+            await dispatcher.dispatch("saleFeed", event)
+        await asyncio.wait_for(dispatcher.join(), 1)
+        await dispatcher.close()
+
+        self.assertEqual(len(handled), len(events))
+
+    async def test_listener_exception_does_not_stop_worker(self):
+        dispatcher = EventDispatcher(workers=1)
+        calls = []
+
+        async def listener(data):
+            calls.append(data)
+            raise ValueError("boom")
+
+        dispatcher.add_listener("saleFeed", listener)
+        with self.assertLogs("skinport.dispatcher", level="ERROR"):
+            await dispatcher.dispatch("saleFeed", 1)
+            await dispatcher.dispatch("saleFeed", 2)
+            await asyncio.wait_for(dispatcher.join(), 1)
+        await dispatcher.close()
+
+        self.assertEqual(calls, [1, 2])
+
+    async def test_client_dispatches_sale_feed(self):
+        client = skinport.Client(listener_workers=2)
+        received = []
+
+        @client.listen("saleFeed")
+        async def on_sale_feed(data):
+            received.append(data)
+
+        await client._on_sale_feed(make_event(1))
+        await asyncio.wait_for(client.dispatcher.join(), 1)
+        await client.close()
+
+        self.assertEqual(received, [make_event(1)])
+        self.assertEqual(client.listeners["saleFeed"], [on_sale_feed])
+
+    async def test_client_parses_sale_feed_once(self):
+        client = skinport.Client(parse_sale_feed=True)
+        received = []
+
+        @client.listen("saleFeed")
+        async def first(sale_feed):
+            received.append(sale_feed)
+
+        @client.listen("saleFeed")
+        async def second(sale_feed):
+            received.append(sale_feed)
+
+        stream = client.sale_feed()
+        await client._on_sale_feed(make_event(1))
+
+        self.assertIsInstance(received[0], skinport.SaleFeed)
+        self.assertIs(received[0], received[1])
+        self.assertIs(await anext(stream), received[0])
+        self.assertEqual(received[0].sales[0].sale_id, 1)
+        await client.close()
@@ -0,0 +1,194 @@
+import asyncio
+import ssl
+import time
+import unittest
+
+import aiohttp
+
+from skinport import InternalServerError, NotFound, RateLimit, RateLimited, RequestTimeout, RetryPolicy
+from skinport.http import HTTPClient
+from skinport.testing import FakeSkinportServer
+
+
+class HTTPClientTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = HTTPClient(connector_limit=10, keepalive_timeout=30.0, dns_cache_ttl=120)
+
+    async def test_ssl_context_is_pinned_to_tls13(self):
+        self.assertEqual(self.http.ssl_context.minimum_version, ssl.TLSVersion.TLSv1_3)
+        self.assertEqual(self.http.ssl_context.maximum_version, ssl.TLSVersion.TLSv1_3)
+
+    async def test_start_session_reuses_open_session(self):
+        session = self.http._HTTPClient__session
+
+        await self.http.start_session()
+
+        self.assertIs(session, self.http._HTTPClient__session)
+
+    async def test_start_session_after_close(self):
+        session = self.http._HTTPClient__session
+        await self.http.close()
+
+        await self.http.start_session()
+
+        self.assertIsNot(session, self.http._HTTPClient__session)
+        self.assertFalse(self.http._HTTPClient__session.closed)
+
+    async def test_connector_settings(self):
+        connector = self.http._HTTPClient__session.connector
+
+        self.assertEqual(connector.limit, 10)
+        self.assertTrue(connector.use_dns_cache)
+
+    async def asyncTearDown(self):
+        await self.http.close()
+
+
+class HTTPClientRetryTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = FakeSkinportServer(items=10)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.http.close()
+        await self.server.close()
+
+    def client(self, **kwargs):
+        self.http = HTTPClient(base_url=self.server.url, **kwargs)
+        return self.http
+
+    async def test_rate_limit_is_never_exceeded(self):
+        self.server.rate_limits["items"] = RateLimit(4, 0.5)
+        http = self.client(rate_limits={"items": RateLimit(4, 0.5)}, retry_policy=RetryPolicy(max_attempts=1))
+
+        for _ in range(10):
+            await http.get_items()
+
+        self.assertEqual(self.server.responses[200], 10)
+        self.assertEqual(self.server.responses[429], 0)
+
+    async def test_retry_after_is_read_from_response(self):
+        # Waiting for the backoff instead of Retry-After would exceed max_elapsed
+        http = self.client(retry_policy=RetryPolicy(backoff_base=60, max_elapsed=5, jitter=False))
+        self.server.inject(429, retry_after=0)
+
+        self.assertEqual(len(await http.get_items()), 10)
+        self.assertEqual(self.server.responses[429], 1)
+
+    async def test_rate_limited_past_max_elapsed(self):
+        http = self.client(retry_policy=RetryPolicy(max_elapsed=10))
+        self.server.inject(429, count=2, retry_after=30)
+
+        start = time.monotonic()
+        with self.assertRaises(RateLimited) as context:
+            await http.get_items()
+
+        self.assertEqual(context.exception.retry_after, 30.0)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(self.server.requests["/v1/items"], 1)
+
+    async def test_rate_limited_pauses_bucket(self):
+        http = self.client()
+        self.server.inject(429, retry_after=1)
+
+        await http.get_items()
+
+        self.assertEqual(self.server.responses[429], 1)
+        self.assertGreater(http.ratelimiter._buckets["items"]._paused_until, 0)
+
+    async def test_server_errors_are_retried(self):
+        http = self.client(retry_policy=RetryPolicy(backoff_base=0.01))
+        self.server.inject(503, count=2)
+
+        self.assertEqual(len(await http.get_items()), 10)
+        self.assertEqual(self.server.responses[503], 2)
+
+    async def test_server_errors_exhaust_attempts(self):
+        http = self.client(retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.01))
+        self.server.inject(502, count=2)
+
+        with self.assertRaises(InternalServerError):
+            await http.get_items()
+        self.assertEqual(self.server.requests["/v1/items"], 2)
+
+    async def test_client_errors_are_not_retried(self):
+        http = self.client(retry_policy=RetryPolicy(backoff_base=0.01))
+        self.server.inject(404)
+
+        with self.assertRaises(NotFound):
+            await http.get_items()
+        self.assertEqual(self.server.requests["/v1/items"], 1)
+
+    async def test_retry_policy_per_bucket(self):
+        http = self.client(retry_policy=RetryPolicy(backoff_base=0.01), retry_policies={"items": RetryPolicy(max_attempts=1)})
+        self.server.inject(503)
+
+        with self.assertRaises(InternalServerError):
+            await http.get_items()
+        self.server.inject(503)
+        await http.get_sales_out_of_stock()
+
+    async def test_connection_errors_are_retried(self):
+        url = self.server.url
+        await self.server.close()
+        self.http = HTTPClient(base_url=url, retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.01))
+
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await self.http.get_items()
+
+
+class HTTPClientTimeoutTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = FakeSkinportServer(items=10)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.http.close()
+        await self.server.close()
+
+    async def test_deadline(self):
+        self.server.latency = 0.5
+        self.http = HTTPClient(base_url=self.server.url, timeout=0.1)
+
+        start = time.monotonic()
+        with self.assertRaises(RequestTimeout) as context:
+            await self.http.get_items()
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual(context.exception.timeout, 0.1)
+
+    async def test_per_call_deadline(self):
+        self.server.latency = 0.2
+        self.http = HTTPClient(base_url=self.server.url, timeout=0.05)
+
+        self.assertEqual(len(await self.http.get_items(timeout=2)), 10)
+
+    async def test_read_timeout(self):
+        self.server.latency = 0.5
+        self.http = HTTPClient(base_url=self.server.url, read_timeout=0.05, retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.01))
+
+        with self.assertRaises(RequestTimeout) as context:
+            await self.http.get_items()
+
+        self.assertIsNone(context.exception.timeout)
+        self.assertEqual(self.server.requests["/v1/items"], 2)
+
+    async def test_read_timeout_within_deadline(self):
+        self.server.latency = 0.5
+        self.http = HTTPClient(base_url=self.server.url, timeout=5, read_timeout=0.05, retry_policy=RetryPolicy(max_attempts=1))
+
+        with self.assertRaises(RequestTimeout) as context:
+            await self.http.get_items()
+
+        self.assertIsNone(context.exception.timeout)
+
+    async def test_rate_limit_wait_past_deadline(self):
+        self.http = HTTPClient(base_url=self.server.url, rate_limits={"items": RateLimit(1, 60)}, timeout=1)
+        await self.http.get_items()
+
+        start = time.monotonic()
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.http.get_items()
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(self.server.requests["/v1/items"], 1)
@@ -0,0 +1,139 @@
+import unittest
+
+import msgpack
+
+import skinport
+from skinport import Instrumentation, PrometheusInstrumentation, RateLimit, RetryPolicy
+from skinport.http import HTTPClient
+from skinport.skinport_msgpack_packet import SkinportMsgPackPacket
+from skinport.testing import FakeSkinportServer
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.requests = []
+        self.packets = []
+        self.events = []
+
+    def on_request(self, metrics):
+        self.requests.append(metrics)
+
+    def on_packet(self, size, seconds):
+        self.packets.append((size, seconds))
+
+    def on_event(self, name, seconds):
+        self.events.append((name, seconds))
+
+
+class FailingInstrumentation(Instrumentation):
+    def on_request(self, metrics):
+        raise RuntimeError("broken exporter")
+
+
+class HTTPInstrumentationTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = FakeSkinportServer(items=10)
+        await self.server.start()
+        self.instrumentation = RecordingInstrumentation()
+
+    async def asyncTearDown(self):
+        await self.http.close()
+        await self.server.close()
+
+    def client(self, instrumentation=None, **kwargs):
+        self.http = HTTPClient(base_url=self.server.url, instrumentation=instrumentation or self.instrumentation, **kwargs)
+        return self.http
+
+    async def test_request_phases(self):
+        self.server.latency = 0.05
+        http = self.client()
+
+        await http.get_items()
+        await http.get_items()
+
+        first, second = self.instrumentation.requests
+        self.assertEqual((first.method, first.path, first.bucket, first.status), ("GET", "/items", "items", 200))
+        self.assertEqual(first.attempts, 1)
+        self.assertGreater(first.size, 0)
+        self.assertIsNotNone(first.connect)
+        self.assertGreaterEqual(first.ttfb, 0.05)
+        self.assertIsNotNone(first.body)
+        self.assertGreaterEqual(first.total, first.ttfb)
+        self.assertIsNone(first.error)
+        # The pooled connection is reused
+        self.assertIsNone(second.connect)
+
+    async def test_retries_and_errors(self):
+        http = self.client(retry_policy=RetryPolicy(backoff_base=0.01))
+        self.server.inject(503)
+        await http.get_items()
+        self.server.inject(404)
+        with self.assertRaises(skinport.NotFound):
+            await http.get_items()
+
+        retried, failed = self.instrumentation.requests
+        self.assertEqual((retried.attempts, retried.retries, retried.status), (2, 1, 200))
+        self.assertEqual((failed.status, failed.error), (404, "NotFound"))
+
+    async def test_rate_limit_wait(self):
+        http = self.client(rate_limits={"items": RateLimit(1, 0.1)})
+
+        await http.get_items()
+        await http.get_items()
+
+        self.assertEqual(self.instrumentation.requests[0].ratelimit_wait, 0.0)
+        self.assertGreater(self.instrumentation.requests[1].ratelimit_wait, 0.0)
+
+    async def test_instrumentation_errors_are_logged(self):
+        http = self.client(FailingInstrumentation())
+
+        with self.assertLogs("skinport.instrumentation", level="ERROR"):
+            self.assertEqual(len(await http.get_items()), 10)
+
+
+class WebsocketInstrumentationTestCase(unittest.IsolatedAsyncioTestCase):
+    def test_packet_decode(self):
+        instrumentation = RecordingInstrumentation()
+        packet_class = SkinportMsgPackPacket.configure(instrumentation=instrumentation)
+        encoded_packet = msgpack.dumps({"type": 2, "data": ["saleFeed", {"eventType": "listed", "sales": []}], "nsp": "/"})
+
+        packet_class(encoded_packet=encoded_packet)
+
+        self.assertEqual(len(instrumentation.packets), 1)
+        self.assertEqual(instrumentation.packets[0][0], len(encoded_packet))
+
+    async def test_event_dispatch(self):
+        instrumentation = RecordingInstrumentation()
+        client = skinport.Client(instrumentation=instrumentation)
+
+        await client._handle_event("saleFeed", {"eventType": "listed", "sales": []})
+        await client._handle_event("maintenanceUpdated", {"active": False})
+        await client.close()
+
+        self.assertEqual([name for name, _ in instrumentation.events], ["saleFeed", "maintenanceUpdated"])
+
+
+class PrometheusInstrumentationTestCase(unittest.TestCase):
+    @unittest.skipIf(prometheus_client is not None, "prometheus-client is installed")
+    def test_requires_prometheus_client(self):
+        with self.assertRaises(ImportError):
+            PrometheusInstrumentation()
+
+    @unittest.skipIf(prometheus_client is None, "prometheus-client is not installed")
+    def test_exports_metrics(self):
+        registry = prometheus_client.CollectorRegistry()
+        instrumentation = PrometheusInstrumentation(registry=registry)
+        metrics = skinport.RequestMetrics("GET", "/items", "items")
+        metrics.status, metrics.attempts, metrics.total, metrics.size = 200, 2, 0.5, 1024
+
+        instrumentation.on_request(metrics)
+        instrumentation.on_event("saleFeed", 0.001)
+
+        self.assertEqual(registry.get_sample_value("skinport_requests_total", {"path": "/items", "status": "200"}), 1)
+        self.assertEqual(registry.get_sample_value("skinport_request_retries_total", {"path": "/items"}), 1)
+        self.assertEqual(registry.get_sample_value("skinport_event_dispatch_seconds_count", {"event": "saleFeed"}), 1)
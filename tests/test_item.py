@@ -1,8 +1,10 @@
 import datetime
 import json
+import math
+import sys
 import unittest
 
-from skinport import Currency, Item
+from skinport import Currency, Item, ItemTable
 
 TEST_ITEMS = """[
   {
@@ -78,3 +80,59 @@ class ItemTestCase(unittest.TestCase):
             repr(items[0]),
             "Item(data={'market_hash_name': 'AK-47 | Aquamarine Revenge (Battle-Scarred)', 'currency': 'EUR', 'suggested_price': 13.18, 'item_page': 'https://skinport.com/item/ak-47-aquamarine-revenge-battle-scarred', 'market_page': 'https://skinport.com/market/730?cat=Rifle&item=Aquamarine+Revenge', 'min_price': 11.33, 'max_price': 18.22, 'mean_price': 12.58, 'median_price': None, 'quantity': 25, 'created_at': 1535988253, 'updated_at': 1568073728, 'version': None})",
         )
+
+
+class ItemTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self._items = json.loads(TEST_ITEMS)
+        self.table = ItemTable(data=self._items)
+
+    def test_len(self):
+        self.assertEqual(len(self.table), 2)
+
+    def test_rows_match_items(self):
+        for data, item in zip(self._items, self.table):
+            self.assertEqual(repr(item), repr(Item(data=data)))
+
+    def test_lookup_by_name(self):
+        name = "★ M9 Bayonet | Fade (Factory New)"
+
+        self.assertIn(name, self.table)
+        self.assertEqual(self.table[name].suggested_price, 319.11)
+        self.assertIsNone(self.table[name].min_price)
+        self.assertEqual(self.table.row(name), 1)
+        self.assertIsNone(self.table.get("Glove Case Key"))
+
+    def test_lookup_by_position(self):
+        self.assertEqual(self.table[-1].market_hash_name, "★ M9 Bayonet | Fade (Factory New)")
+        with self.assertRaises(IndexError):
+            self.table[2]
+
+    def test_columns(self):
+        self.assertEqual(list(self.table.column("quantity")), [25, 0])
+        self.assertTrue(math.isnan(self.table.column("min_price")[1]))
+
+    def test_where(self):
+        rows = self.table.where(lambda quantity, min_price, suggested_price: quantity > 0 and min_price < suggested_price)
+
+        self.assertEqual(rows, [0])
+
+    def test_filter(self):
+        table = self.table.filter(lambda min_price: min_price < 20)
+
+        self.assertEqual(len(table), 1)
+        self.assertIn("AK-47 | Aquamarine Revenge (Battle-Scarred)", table)
+        self.assertEqual(table[0].currency, Currency.eur)
+
+    def test_size_grows_with_rows(self):
+        def table(rows):
+            return ItemTable(data=[{**self._items[0], "market_hash_name": f"Item {row}"} for row in range(rows)])
+
+        small, large = sys.getsizeof(table(10)), sys.getsizeof(table(1000))
+
+        # At least the 8 numeric columns of 8 bytes per row
+        self.assertGreater(large - small, 990 * 8 * 8)
+
+    def test_filter_unknown_column(self):
+        with self.assertRaises(KeyError):
+            self.table.filter(lambda unknown: True)
@@ -0,0 +1,96 @@
+import asyncio
+import gc
+import unittest
+
+from skinport import TransactionAsyncIterator
+
+
+class TransactionAsyncIteratorTestCase(unittest.IsolatedAsyncioTestCase):
+    def make_getter(self, pages, per_page=2):
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def getter(params):
+            page = params.get("page", 1)
+            self.requested.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            data = [{"id": page * 100 + i, "type": "credit", "status": "complete"} for i in range(per_page)]
+            return {"pagination": {"page": page, "pages": pages}, "data": data}
+
+        return getter
+
+    async def test_iterates_all_pages(self):
+        iterator = TransactionAsyncIterator(self.make_getter(3))
+
+        transactions = await iterator.flatten()
+
+        self.assertEqual(len(transactions), 6)
+        self.assertEqual(self.requested, [1, 2, 3])
+        self.assertEqual(self.max_in_flight, 1)
+
+    async def test_prefetch_keeps_order(self):
+        sequential = [t.transaction_id for t in await TransactionAsyncIterator(self.make_getter(6)).flatten()]
+
+        prefetched = [t.transaction_id for t in await TransactionAsyncIterator(self.make_getter(6), prefetch=3).flatten()]
+
+        self.assertEqual(prefetched, sequential)
+        self.assertEqual(sorted(self.requested), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.max_in_flight, 3)
+
+    async def test_prefetch_is_bounded_by_page_count(self):
+        iterator = TransactionAsyncIterator(self.make_getter(2), prefetch=5)
+
+        await iterator.flatten()
+
+        self.assertEqual(self.requested, [1, 2])
+
+    async def test_close_cancels_prefetched_pages(self):
+        iterator = TransactionAsyncIterator(self.make_getter(10), prefetch=4)
+        await iterator.next()
+        tasks = list(iterator._prefetched.values())
+
+        iterator.close()
+        await asyncio.sleep(0)
+
+        self.assertEqual(len(tasks), 4)
+        self.assertTrue(all(task.cancelled() for task in tasks))
+
+    async def test_context_manager_cancels_prefetched_pages_on_break(self):
+        async with TransactionAsyncIterator(self.make_getter(10), prefetch=4) as iterator:
+            async for transaction in iterator:
+                tasks = list(iterator._prefetched.values())
+                break
+
+        self.assertEqual(len(tasks), 4)
+        self.assertTrue(all(task.done() for task in tasks))
+        self.assertEqual(iterator._prefetched, {})
+
+    async def test_failed_page_cancels_prefetched_pages(self):
+        exceptions = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: exceptions.append(context))
+
+        async def getter(params):
+            page = params.get("page", 1)
+            if page > 1:
+                await asyncio.sleep(0.01 * page)
+                raise RuntimeError(page)
+            return {"pagination": {"page": page, "pages": 10}, "data": [{"id": 1, "type": "credit", "status": "complete"}]}
+
+        iterator = TransactionAsyncIterator(getter, prefetch=4)
+        await iterator.next()
+        tasks = list(iterator._prefetched.values())
+        await asyncio.sleep(0.035)
+        with self.assertRaises(RuntimeError):
+            await iterator.next()
+        del iterator
+        await asyncio.sleep(0.1)
+
+        self.assertTrue(all(task.done() for task in tasks))
+        self.assertTrue(any(task.cancelled() for task in tasks))
+        tasks.clear()
+        gc.collect()
+        self.assertEqual(exceptions, [])
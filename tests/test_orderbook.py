@@ -0,0 +1,75 @@
+import unittest
+
+from skinport import AppID, Currency, OrderBook, SaleFeed
+
+
+def make_sale(sale_id, market_hash_name="AK-47 | Redline (Field-Tested)", sale_price=1000, currency="EUR", appid=730):
+    return {"saleId": sale_id, "marketHashName": market_hash_name, "salePrice": sale_price, "currency": currency, "appid": appid, "wear": 0.2}
+
+
+def make_event(event_type, *sales):
+    return {"eventType": event_type, "sales": list(sales)}
+
+
+class OrderBookTestCase(unittest.TestCase):
+    def setUp(self):
+        self.order_book = OrderBook()
+        self.order_book.update(
+            make_event(
+                "listed",
+                make_sale(1, sale_price=1500),
+                make_sale(2, sale_price=1000),
+                make_sale(3, sale_price=1200),
+                make_sale(4, sale_price=900, currency="USD"),
+                make_sale(5, market_hash_name="Rust Key", sale_price=100, appid=252490),
+            )
+        )
+
+    def test_cheapest(self):
+        listing = self.order_book.cheapest("AK-47 | Redline (Field-Tested)", Currency.eur)
+
+        self.assertEqual(listing.sale_id, 2)
+        self.assertEqual(listing.sale_price, 10.0)
+        self.assertEqual(self.order_book.cheapest("AK-47 | Redline (Field-Tested)", Currency.usd).sale_id, 4)
+        self.assertIsNone(self.order_book.cheapest("Glove Case Key"))
+
+    def test_sold_removes_listing(self):
+        self.order_book.update(make_event("sold", make_sale(2, sale_price=1000)))
+
+        self.assertNotIn(2, self.order_book)
+        self.assertEqual(self.order_book.cheapest("AK-47 | Redline (Field-Tested)").sale_id, 3)
+        self.assertEqual(len(self.order_book), 4)
+
+    def test_unknown_sold_is_ignored(self):
+        self.order_book.update(SaleFeed(data=make_event("sold", make_sale(99))))
+
+        self.assertEqual(len(self.order_book), 5)
+
+    def test_listings_sorted_by_price(self):
+        listings = self.order_book.listings("AK-47 | Redline (Field-Tested)")
+
+        self.assertEqual([listing.sale_id for listing in listings], [2, 3, 1])
+        self.assertEqual([listing.sale_id for listing in self.order_book.listings("AK-47 | Redline (Field-Tested)", max_price=12)], [2, 3])
+
+    def test_relisting_replaces_listing(self):
+        self.order_book.update(make_event("listed", make_sale(1, sale_price=500)))
+
+        self.assertEqual(self.order_book.cheapest("AK-47 | Redline (Field-Tested)").sale_id, 1)
+        self.assertEqual(len(self.order_book.listings("AK-47 | Redline (Field-Tested)")), 3)
+
+    def test_secondary_indexes(self):
+        self.assertEqual([listing.sale_id for listing in self.order_book.by_app_id(AppID.rust)], [5])
+        self.assertEqual([listing.sale_id for listing in self.order_book.by_currency(Currency.usd)], [4])
+
+        self.order_book.remove(5)
+        self.order_book.remove(4)
+
+        self.assertEqual(self.order_book.by_app_id(AppID.rust), [])
+        self.assertEqual(self.order_book.by_currency(Currency.usd), [])
+        self.assertIsNone(self.order_book.remove(5))
+
+    def test_clear(self):
+        self.order_book.clear()
+
+        self.assertEqual(len(self.order_book), 0)
+        self.assertIsNone(self.order_book.cheapest("AK-47 | Redline (Field-Tested)"))
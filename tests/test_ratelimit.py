@@ -0,0 +1,102 @@
+import asyncio
+import time
+import unittest
+
+from skinport import RateLimit, RateLimiter
+
+
+class RateLimiterTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_within_budget(self):
+        limiter = RateLimiter({"items": RateLimit(3, 10.0)})
+
+        waited = [await limiter.acquire("items") for _ in range(3)]
+
+        self.assertEqual(waited, [0.0, 0.0, 0.0])
+
+    async def test_acquire_over_budget_waits(self):
+        limiter = RateLimiter({"items": RateLimit(2, 0.2)})
+        await limiter.acquire("items")
+        await limiter.acquire("items")
+
+        start = time.monotonic()
+        await limiter.acquire("items")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    async def test_no_burst_after_partial_period(self):
+        limiter = RateLimiter({"items": RateLimit(2, 0.2)})
+        await limiter.acquire("items")
+        await limiter.acquire("items")
+        await asyncio.sleep(0.1)
+
+        start = time.monotonic()
+        await limiter.acquire("items")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    async def test_released_request_counts_from_release(self):
+        limiter = RateLimiter({"items": RateLimit(1, 0.2)})
+        await limiter.acquire("items")
+        await asyncio.sleep(0.1)
+        limiter.release("items")
+
+        self.assertGreater(limiter.delay("items"), 0.15)
+
+    async def test_buckets_are_independent(self):
+        limiter = RateLimiter({"items": RateLimit(1, 10.0), "account": RateLimit(1, 10.0)})
+        await limiter.acquire("items")
+
+        self.assertGreater(limiter.delay("items"), 0)
+        self.assertEqual(limiter.delay("account"), 0.0)
+        await asyncio.wait_for(limiter.acquire("account"), timeout=1)
+
+    async def test_pause_holds_back_requests(self):
+        limiter = RateLimiter({"items": RateLimit(10, 1.0)})
+
+        self.assertTrue(limiter.pause("items", 0.1))
+        start = time.monotonic()
+        await limiter.acquire("items")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertFalse(limiter.pause("unknown", 0.1))
+
+    async def test_cancelled_waiter_does_not_consume_budget(self):
+        limiter = RateLimiter({"items": RateLimit(1, 0.2)})
+        await limiter.acquire("items")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire("items"), timeout=0.05)
+
+        start = time.monotonic()
+        await limiter.acquire("items")
+        self.assertLess(time.monotonic() - start, 0.19)
+
+    async def test_unknown_bucket_is_not_limited(self):
+        limiter = RateLimiter()
+
+        self.assertEqual(await limiter.acquire(None), 0.0)
+        self.assertEqual(await limiter.acquire("unknown"), 0.0)
+
+    async def test_waiters_are_served_in_order(self):
+        limiter = RateLimiter({"items": RateLimit(1, 0.05)})
+        order = []
+
+        async def request(i):
+            await limiter.acquire("items")
+            order.append(i)
+
+        await asyncio.gather(*(request(i) for i in range(4)))
+
+        self.assertEqual(order, [0, 1, 2, 3])
+
+    def test_default_limits(self):
+        limiter = RateLimiter({"items": RateLimit(1, 1.0)})
+
+        self.assertEqual(limiter.limits["items"], RateLimit(1, 1.0))
+        self.assertEqual(limiter.limits["sales_history"], RateLimit(8, 300.0))
+
+    def test_invalid_rate_limit(self):
+        with self.assertRaises(ValueError):
+            RateLimit(0, 1.0)
+        with self.assertRaises(ValueError):
+            RateLimit(1, 0)
@@ -0,0 +1,98 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+import msgpack
+
+import skinport
+from skinport import ClientException, PacketRecorder, PacketReplayer
+from skinport.skinport_msgpack_packet import SkinportMsgPackPacket
+
+
+def encode_event(name, data):
+    return msgpack.dumps({"type": 2, "data": [name, data], "nsp": "/"})
+
+
+def make_event(sale_id):
+    return {"eventType": "listed", "sales": [{"saleId": sale_id}]}
+
+
+class ReplayTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "sale_feed.rec")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, *packets):
+        with PacketRecorder(self.path) as recorder:
+            for received_at, encoded_packet in packets:
+                recorder.record(encoded_packet, received_at)
+
+    async def test_packet_class_records_decoded_packets(self):
+        with PacketRecorder(self.path) as recorder:
+            packet_class = SkinportMsgPackPacket.configure(recorder=recorder)
+            packet_class(encoded_packet=encode_event("saleFeed", make_event(1)))
+
+        self.assertEqual([encoded_packet for _, encoded_packet in PacketReplayer(self.path)], [encode_event("saleFeed", make_event(1))])
+
+    async def test_replay_dispatches_events(self):
+        self.record(
+            (1.0, msgpack.dumps({"type": 0, "data": {"sid": "abc"}, "nsp": "/"})),
+            (2.0, encode_event("saleFeed", make_event(1))),
+            (3.0, encode_event("maintenanceUpdated", {"active": False})),
+        )
+        client = skinport.Client()
+        received = []
+
+        @client.listen("saleFeed")
+        async def on_sale_feed(data):
+            received.append(data)
+
+        @client.listen("maintenanceUpdated")
+        async def on_maintenance_updated(data):
+            received.append(data)
+
+        events = await PacketReplayer(self.path).replay(client, speed=None)
+        await client.close()
+
+        self.assertEqual(events, 2)
+        self.assertEqual(received, [make_event(1), {"active": False}])
+
+    async def test_replay_keeps_relative_timing(self):
+        self.record((10.0, encode_event("saleFeed", make_event(1))), (11.0, encode_event("saleFeed", make_event(2))))
+        client = skinport.Client()
+
+        started_at = time.monotonic()
+        await PacketReplayer(self.path).replay(client, speed=20)
+        await client.close()
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.05)
+
+    async def test_appending_to_recording(self):
+        self.record((1.0, b"first"))
+        self.record((2.0, b"second"))
+
+        self.assertEqual(list(PacketReplayer(self.path)), [(1.0, b"first"), (2.0, b"second")])
+
+    async def test_truncated_recording(self):
+        self.record((1.0, b"first"), (2.0, b"second"))
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+
+        with self.assertLogs("skinport.replay", level="WARNING"):
+            self.assertEqual(list(PacketReplayer(self.path)), [(1.0, b"first")])
+
+    async def test_invalid_recording(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a recording")
+
+        with self.assertRaises(ClientException):
+            list(PacketReplayer(self.path))
+        client = skinport.Client()
+        with self.assertRaises(ValueError):
+            await PacketReplayer(self.path).replay(client, speed=0)
+        await client.close()
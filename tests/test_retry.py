@@ -0,0 +1,50 @@
+import datetime
+import email.utils
+import unittest
+
+from skinport import RetryPolicy
+
+
+class RetryPolicyTestCase(unittest.TestCase):
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=False)
+
+        self.assertEqual([policy.backoff(attempt) for attempt in range(1, 6)], [0.5, 1.0, 2.0, 3.0, 3.0])
+
+    def test_backoff_jitter(self):
+        policy = RetryPolicy(backoff_base=1.0)
+
+        for _ in range(100):
+            self.assertTrue(0 <= policy.backoff(3) <= 4.0)
+
+    def test_allows(self):
+        policy = RetryPolicy(max_attempts=3, max_elapsed=10.0)
+
+        self.assertTrue(policy.allows(1, 0.0))
+        self.assertTrue(policy.allows(2, 10.0))
+        self.assertFalse(policy.allows(3, 0.0))
+        self.assertFalse(policy.allows(1, 10.5))
+        self.assertTrue(RetryPolicy(max_elapsed=None).allows(1, 10**6))
+
+    def test_parse_retry_after_seconds(self):
+        self.assertEqual(RetryPolicy.parse_retry_after("120"), 120.0)
+        self.assertEqual(RetryPolicy.parse_retry_after(" 1.5 "), 1.5)
+        self.assertEqual(RetryPolicy.parse_retry_after("-3"), 0.0)
+
+    def test_parse_retry_after_date(self):
+        date = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+
+        retry_after = RetryPolicy.parse_retry_after(email.utils.format_datetime(date, usegmt=True))
+
+        self.assertAlmostEqual(retry_after, 30, delta=2)
+        self.assertEqual(RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_parse_invalid_retry_after(self):
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+        self.assertIsNone(RetryPolicy.parse_retry_after("soon"))
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with self.assertRaises(ValueError):
+            RetryPolicy(backoff_base=-1)
@@ -1,7 +1,8 @@
+import datetime
 import json
 import unittest
 
-from skinport import SaleFeed
+from skinport import LazySaleFeedSale, SaleFeed, SaleFeedSale
 
 TEST_SALEFEED = """{
     "eventType": "listed",
@@ -90,3 +91,41 @@ class SalefeedTestCase(unittest.TestCase):
     def test_sale_feed_constructor(self):
         sale_feed = SaleFeed(data=self._sale_feed)
         self.assertIsInstance(sale_feed, SaleFeed)
+
+    def test_lock_from_raw_timestamp(self):
+        self._sale_feed["sales"][0]["lock"] = 1739088000000
+        sale_feed = SaleFeed(data=self._sale_feed)
+        self.assertEqual(sale_feed.sales[0].lock, datetime.datetime(2025, 2, 9, 8, 0, tzinfo=datetime.timezone.utc))
+
+    def test_sales_are_cached(self):
+        sale_feed = SaleFeed(data=self._sale_feed)
+        self.assertIs(sale_feed.sales, sale_feed.sales)
+        self.assertIs(sale_feed.sales[0], sale_feed.sales[0])
+
+    def test_lazy_sales_match_eager_sales(self):
+        eager = SaleFeed(data=self._sale_feed).sales[0]
+        lazy = SaleFeed(data=self._sale_feed, lazy=True).sales[0]
+        self.assertIsInstance(lazy, LazySaleFeedSale)
+        for name, value in vars(SaleFeedSale).items():
+            # The lock of the test data is a string instead of a timestamp
+            if isinstance(value, property) and name != "lock":
+                with self.subTest(name):
+                    self.assertEqual(repr(getattr(lazy, name)), repr(getattr(eager, name)))
+
+    def test_lazy_sale_defaults(self):
+        eager = SaleFeedSale(data={})
+        lazy = LazySaleFeedSale(data={})
+        for slot in SaleFeedSale.__slots__:
+            with self.subTest(slot):
+                self.assertEqual(getattr(lazy, slot), getattr(eager, slot))
+        self.assertIsNot(lazy.screenshots, LazySaleFeedSale(data={}).screenshots)
+
+    def test_lazy_sale_reads_fields_on_access(self):
+        data = dict(self._sale_feed["sales"][0])
+        sale = LazySaleFeedSale(data=data)
+        data["saleId"] = 1
+        self.assertEqual(sale.sale_id, 1)
+        data["saleId"] = 2
+        self.assertEqual(sale.sale_id, 1)
+        with self.assertRaises(AttributeError):
+            sale.unknown
@@ -16,7 +16,7 @@ class SkinportMsgPackPacketTestCase(unittest.TestCase):
         # When
         encoded_packet = given_packet.encode()
         # Then
-        expected_encoded_packet = b'\x83\xa4type\x02\xa4data\xd6\xffg\xa8`\x80\xa3nsp\xa1/'
+        expected_encoded_packet = b'\x83\xa4type\x02\xa4data\xd7\x00\x00\x00\x01\x94\xe9\xb8\xf4\x00\xa3nsp\xa1/'
         self.assertEqual(expected_encoded_packet, encoded_packet)
 
     def test_decode(self):
@@ -44,6 +44,13 @@ class SkinportMsgPackPacketTestCase(unittest.TestCase):
         # Then
         self.assertEqual(given_packet._to_dict(), decoded_packet._to_dict())
 
+    def test_encode_uses_skinport_timestamps(self):
+        packet = SkinportMsgPackPacket(packet_type=2, data=["saleFeed", {"sales": [{"lock": msgpack.Timestamp(1739624110, 0)}]}], namespace="/")
+
+        decoded = msgpack.unpackb(packet.encode())
+
+        self.assertEqual(decoded["data"][1]["sales"][0]["lock"], msgpack.ExtType(0, (1739624110000).to_bytes(8, "big")))
+
     def test_default(self):
         with self.subTest('When object is not a Timestamp'):
             # Given
@@ -122,3 +129,24 @@ class SkinportMsgPackPacketTestCase(unittest.TestCase):
         timestamp = SkinportMsgPackPacket._decode_timestamp_from_ext(*ext_type)
         # Then
         self.assertEqual(given_dt, timestamp.to_datetime())
+
+    def test_decode_raw_timestamps(self):
+        # Given
+        packet_class = SkinportMsgPackPacket.configure(raw_timestamps=True)
+        encoded_packet = msgpack.dumps({'type': 2, 'data': msgpack.ExtType(0, b'\x00\x00\x01\x94\xe9\xb8\xf4\x01'), 'nsp': '/'})
+        # When
+        decoded_packet = packet_class()
+        decoded_packet.decode(encoded_packet)
+        # Then
+        self.assertEqual(1739088000001, decoded_packet.data)
+        default_packet = SkinportMsgPackPacket()
+        default_packet.decode(encoded_packet)
+        self.assertEqual(msgpack.Timestamp(1739088000, 1_000_000), default_packet.data)
+
+    def test_decode_timestamp_keeps_milliseconds(self):
+        # Given
+        given_data = b'\x00\x00\x01\x94\xe9\xb8\xf4\x01'
+        # When
+        timestamp = SkinportMsgPackPacket._decode_timestamp_from_ext(0, given_data)
+        # Then
+        self.assertEqual(msgpack.Timestamp(1739088000, 1_000_000), timestamp)
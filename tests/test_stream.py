@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+
+import skinport
+from skinport import EventType, OverflowPolicy, SaleFeedStream
+
+
+def make_event(sale_id):
+    return {"eventType": "listed", "sales": [{"saleId": sale_id}]}
+
+
+class SaleFeedStreamTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_iterates_events(self):
+        stream = SaleFeedStream()
+        await stream.put(make_event(1))
+        await stream.put(make_event(2))
+        stream_iter = aiter(stream)
+
+        first = await anext(stream_iter)
+        second = await anext(stream_iter)
+
+        self.assertEqual(first.event_type, EventType.listed)
+        self.assertEqual([first.sales[0].sale_id, second.sales[0].sale_id], [1, 2])
+        self.assertEqual(stream.queued, 2)
+
+    async def test_drop_newest(self):
+        stream = SaleFeedStream(maxsize=2, overflow=OverflowPolicy.drop_newest)
+
+        results = [await stream.put(make_event(i)) for i in range(3)]
+
+        self.assertEqual(results, [True, True, False])
+        self.assertEqual(stream.dropped, 1)
+        self.assertEqual((await anext(stream)).sales[0].sale_id, 0)
+
+    async def test_drop_oldest(self):
+        stream = SaleFeedStream(maxsize=2, overflow=OverflowPolicy.drop_oldest)
+
+        for i in range(3):
+            await stream.put(make_event(i))
+
+        self.assertEqual(stream.dropped, 1)
+        self.assertEqual(stream.qsize, 2)
+        self.assertEqual((await anext(stream)).sales[0].sale_id, 1)
+
+    async def test_block_waits_for_consumer(self):
+        stream = SaleFeedStream(maxsize=1)
+        await stream.put(make_event(1))
+
+        put = asyncio.ensure_future(stream.put(make_event(2)))
+        await asyncio.sleep(0.01)
+        self.assertFalse(put.done())
+
+        await anext(stream)
+        self.assertTrue(await asyncio.wait_for(put, timeout=1))
+        self.assertEqual(stream.dropped, 0)
+
+    async def test_close_stops_iteration_and_releases_producers(self):
+        stream = SaleFeedStream(maxsize=1)
+        await stream.put(make_event(1))
+        put = asyncio.ensure_future(stream.put(make_event(2)))
+        await asyncio.sleep(0)
+
+        stream.close()
+
+        self.assertFalse(await asyncio.wait_for(put, timeout=1))
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+
+    async def test_client_dispatches_to_streams_and_listener(self):
+        client = skinport.Client()
+        received = []
+
+        @client.listen("saleFeed")
+        async def on_sale_feed(data):
+            received.append(data)
+
+        async with client.sale_feed() as stream:
+            await client._on_sale_feed(make_event(1))
+
+            self.assertEqual((await anext(stream)).sales[0].sale_id, 1)
+            self.assertEqual(received, [make_event(1)])
+        self.assertEqual(client.sale_feed_streams, [])
+        await client.close()
@@ -0,0 +1,89 @@
+import unittest
+
+import skinport
+from skinport import EventType, LazySaleFeedSale, SaleFilter, SubscriptionIndex
+
+
+def make_sale(sale_id, market_hash_name="AK-47 | Redline (Field-Tested)", sale_price=1000, category="Rifle", wear=0.2, stattrak=False):
+    return {
+        "saleId": sale_id,
+        "marketHashName": market_hash_name,
+        "salePrice": sale_price,
+        "category": category,
+        "wear": wear,
+        "stattrak": stattrak,
+        "souvenir": False,
+    }
+
+
+def sale(**kwargs):
+    return LazySaleFeedSale(data=make_sale(1, **kwargs))
+
+
+class SaleFilterTestCase(unittest.TestCase):
+    def test_empty_filter_matches_everything(self):
+        self.assertTrue(SaleFilter().matches(sale()))
+
+    def test_price_range(self):
+        sale_filter = SaleFilter(min_price=5, max_price=10)
+
+        self.assertTrue(sale_filter.matches(sale(sale_price=1000)))
+        self.assertFalse(sale_filter.matches(sale(sale_price=1001)))
+        self.assertFalse(sale_filter.matches(sale(sale_price=499)))
+
+    def test_wear_range(self):
+        sale_filter = SaleFilter(max_wear=0.07)
+
+        self.assertTrue(sale_filter.matches(sale(wear=0.05)))
+        self.assertFalse(sale_filter.matches(sale(wear=0.2)))
+        self.assertFalse(sale_filter.matches(sale(wear=None)))
+
+    def test_flags(self):
+        self.assertTrue(SaleFilter(stattrak=True).matches(sale(stattrak=True)))
+        self.assertFalse(SaleFilter(stattrak=True).matches(sale()))
+        self.assertTrue(SaleFilter(souvenir=False).matches(sale()))
+
+
+class SubscriptionIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.index = SubscriptionIndex()
+        self.index.add(SaleFilter(market_hash_names={"AK-47 | Redline (Field-Tested)", "Glove Case Key"}, max_price=20), "watchlist")
+        self.index.add(SaleFilter(categories={"Knife"}), "knives")
+        self.index.add(SaleFilter(min_price=1000), "expensive")
+        self.index.add(SaleFilter(market_hash_names={"Glove Case Key"}), "keys")
+
+    def test_match(self):
+        self.assertEqual(self.index.match(sale()), ["watchlist"])
+        self.assertEqual(self.index.match(sale(market_hash_name="Glove Case Key", category="Key", sale_price=250)), ["watchlist", "keys"])
+        self.assertEqual(self.index.match(sale(market_hash_name="Karambit | Fade", category="Knife", sale_price=150000)), ["knives", "expensive"])
+        self.assertEqual(self.index.match(sale(market_hash_name="P250 | Sand Dune", category="Pistol", sale_price=3)), [])
+
+    def test_remove(self):
+        self.index.remove("watchlist")
+
+        self.assertEqual(self.index.match(sale()), [])
+        self.assertEqual(self.index.match(sale(market_hash_name="Glove Case Key")), ["keys"])
+
+
+class ClientSubscribeTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_only_matching_sales_are_dispatched(self):
+        client = skinport.Client()
+        received = []
+
+        @client.subscribe(market_hash_names={"Glove Case Key"})
+        async def on_key(sale, event_type):
+            received.append((sale.sale_id, event_type))
+
+        await client._on_sale_feed({"eventType": "listed", "sales": [make_sale(1), make_sale(2, market_hash_name="Glove Case Key")]})
+        await client.close()
+
+        self.assertEqual(received, [(2, EventType.listed)])
+
+    async def test_subscribe_requires_coroutine_function(self):
+        client = skinport.Client()
+
+        with self.assertRaises(TypeError):
+            client.subscribe(max_price=10)(lambda sale, event_type: None)
+        with self.assertRaises(TypeError):
+            client.subscribe(SaleFilter(), max_price=10)
+        await client.close()
@@ -0,0 +1,190 @@
+import asyncio
+import time
+import unittest
+
+import aiohttp
+
+import skinport
+from skinport import RateLimit
+from skinport.skinport_msgpack_packet import SkinportMsgPackPacket
+from skinport.testing import FakeSaleFeedServer, FakeSkinportServer, payloads
+
+
+class PayloadsTestCase(unittest.TestCase):
+    def test_sale_feed_packet_uses_skinport_timestamps(self):
+        encoded_packet = payloads.make_sale_feed_packet(3)
+        packet = SkinportMsgPackPacket.configure(raw_timestamps=True)(encoded_packet=encoded_packet)
+
+        for sale in packet.data[1]["sales"]:
+            self.assertIsInstance(sale["lock"], int)
+
+
+class FakeSkinportServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = FakeSkinportServer(items=50, transactions=30)
+        await self.server.start()
+        self.client = skinport.Client(base_url=self.server.url)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_get_items(self):
+        items = await self.client.get_items(currency=skinport.Currency.usd)
+
+        self.assertEqual(len(items), 50)
+        self.assertEqual(items[0].currency, skinport.Currency.usd)
+        self.assertEqual(self.server.requests["/v1/items"], 1)
+
+    async def test_get_sales_history(self):
+        names = [item.market_hash_name for item in await self.client.get_sales_history()][:2]
+
+        history = await self.client.get_sales_history(*names)
+
+        self.assertEqual({item.market_hash_name for item in history}, set(names))
+
+    async def test_get_sales_out_of_stock(self):
+        self.assertEqual(len(await self.client.get_sales_out_of_stock()), 5)
+
+    async def test_account_transactions(self):
+        with self.assertRaises(skinport.AuthenticationError):
+            await self.client.get_account_transactions()
+
+        self.client.set_auth(client_id="id", client_secret="secret")
+        transactions = [transaction async for transaction in await self.client.fetch_all_account_transactions(prefetch=1)]
+
+        self.assertEqual(len(transactions), 30)
+
+    async def test_timeout_does_not_cancel_shared_request(self):
+        self.server.latency = 0.2
+        shared = asyncio.ensure_future(self.client.get_items())
+        await asyncio.sleep(0)
+
+        with self.assertRaises(skinport.RequestTimeout):
+            await self.client.get_items(timeout=0.05)
+        self.assertEqual(len(await shared), 50)
+        self.assertEqual(self.server.requests["/v1/items"], 1)
+
+    async def test_per_call_timeout_extends_client_timeout(self):
+        self.server.latency = 0.2
+        self.client.http.timeout = 0.05
+
+        self.assertEqual(len(await self.client.get_items(timeout=2)), 50)
+        self.assertEqual(len(await self.client.get_sales_out_of_stock(timeout=2)), 5)
+        with self.assertRaises(skinport.RequestTimeout):
+            await self.client.get_item_table()
+
+    async def test_injected_error(self):
+        self.client.http.retry_policy = skinport.RetryPolicy(backoff_base=0.01)
+        self.server.inject(503, count=3)
+
+        with self.assertRaises(skinport.InternalServerError):
+            await self.client.get_items()
+        self.assertEqual(len(await self.client.get_items()), 50)
+        self.assertEqual(self.server.responses[503], 3)
+
+
+class FakeSkinportServerBehaviourTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_rate_limit(self):
+        async with FakeSkinportServer(items=1, rate_limits={"items": RateLimit(1, 60)}) as server:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(server.url + "/items") as response:
+                    self.assertEqual(response.status, 200)
+                async with session.get(server.url + "/items") as response:
+                    self.assertEqual(response.status, 429)
+                    self.assertEqual(response.headers["Retry-After"], "60")
+
+    async def test_latency(self):
+        async with FakeSkinportServer(items=1, latency=0.05) as server:
+            async with aiohttp.ClientSession() as session:
+                started_at = time.monotonic()
+                async with session.get(server.url + "/items") as response:
+                    await response.read()
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.05)
+
+    async def test_credentials(self):
+        async with FakeSkinportServer(credentials=("id", "secret")) as server:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(server.url + "/account/transactions", auth=aiohttp.BasicAuth("id", "wrong")) as response:
+                    self.assertEqual(response.status, 401)
+                async with session.get(server.url + "/account/transactions", auth=aiohttp.BasicAuth("id", "secret")) as response:
+                    self.assertEqual(response.status, 200)
+
+
+class FakeSaleFeedServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def connect(self, server, *sale_feeds):
+        client = skinport.Client(parse_sale_feed=True)
+        for currency in sale_feeds:
+            client.add_sale_feed(currency=currency)
+        task = asyncio.create_task(client.connect(url=server.url))
+        await asyncio.wait_for(server.wait_for_join(len(sale_feeds)), 5)
+        return client, task
+
+    async def disconnect(self, client, task):
+        await client.close()
+        await asyncio.wait_for(task, 5)
+
+    async def test_emits_to_joined_rooms(self):
+        async with FakeSaleFeedServer(rate=0) as server:
+            client, task = await self.connect(server, skinport.Currency.eur, skinport.Currency.usd)
+            received = asyncio.Queue()
+
+            @client.listen("saleFeed")
+            async def on_sale_feed(data):
+                received.put_nowait(data)
+
+            self.assertEqual(set(server.rooms), {"730:EUR:en", "730:USD:en"})
+            await server.emit(room="730:USD:en")
+            data = await asyncio.wait_for(received.get(), 5)
+            await self.disconnect(client, task)
+
+        self.assertEqual(data.event_type, skinport.EventType.listed)
+        self.assertEqual(data.sales[0].currency, skinport.Currency.usd)
+        self.assertIsNotNone(data.sales[0].lock)
+
+    async def test_emits_at_rate(self):
+        async with FakeSaleFeedServer(rate=500, burst=10, sold_ratio=0.5, max_events=50) as server:
+            client = skinport.Client(parse_sale_feed=True)
+            received = []
+
+            @client.listen("saleFeed")
+            async def on_sale_feed(data):
+                received.append(data)
+
+            task = asyncio.create_task(client.connect(url=server.url))
+            await asyncio.wait_for(server.wait_for_join(), 5)
+            started_at = time.monotonic()
+            while len(received) < 50 and time.monotonic() - started_at < 5:
+                await asyncio.sleep(0.01)
+            await self.disconnect(client, task)
+
+        self.assertEqual(len(received), 50)
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.08)
+        listed = {sale.sale_id for data in received if data.event_type == skinport.EventType.listed for sale in data.sales}
+        sold = {sale.sale_id for data in received if data.event_type == skinport.EventType.sold for sale in data.sales}
+        self.assertTrue(sold)
+        self.assertLessEqual(sold, listed)
+
+    async def test_raw_timestamps(self):
+        async with FakeSaleFeedServer(rate=0) as server:
+            client = skinport.Client(raw_timestamps=True)
+            received = asyncio.Queue()
+
+            @client.listen("saleFeed")
+            async def on_sale_feed(data):
+                received.put_nowait(data)
+
+            task = asyncio.create_task(client.connect(url=server.url))
+            await asyncio.wait_for(server.wait_for_join(), 5)
+            await server.emit()
+            data = await asyncio.wait_for(received.get(), 5)
+            await self.disconnect(client, task)
+
+        self.assertIsInstance(data["sales"][0]["lock"], int)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            FakeSaleFeedServer(rate=-1)
+        with self.assertRaises(ValueError):
+            FakeSaleFeedServer(burst=0)
@@ -2,7 +2,7 @@ import json
 import unittest
 from typing import List
 
-from skinport import Transaction
+from skinport import Transaction, TransactionCheckpoint
 
 TEST_TRANSACTIONS = """{
     "pagination": {
@@ -74,3 +74,24 @@ class TransactionTestCase(unittest.TestCase):
         transactions: List[Transaction] = []
         for transaction in self._transactions["data"]:
             transactions.append(Transaction(data=transaction))
+
+
+class TransactionCheckpointTestCase(unittest.TestCase):
+    def setUp(self):
+        self._transactions = json.loads(TEST_TRANSACTIONS)
+        self.transaction = Transaction(data=self._transactions["data"][0])
+
+    def test_from_transaction(self):
+        checkpoint = TransactionCheckpoint.from_transaction(self.transaction)
+
+        self.assertEqual(checkpoint.transaction_id, 9999993)
+        self.assertEqual(checkpoint.created_at, self._transactions["data"][0]["created_at"])
+
+    def test_dict_round_trip(self):
+        checkpoint = TransactionCheckpoint.from_transaction(self.transaction)
+
+        self.assertEqual(TransactionCheckpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict()))), checkpoint)
+
+    def test_includes(self):
+        self.assertTrue(TransactionCheckpoint(transaction_id=9999993).includes(self.transaction))
+        self.assertFalse(TransactionCheckpoint(transaction_id=9999992).includes(self.transaction))